@@ -0,0 +1,62 @@
+"""
+Times building metadata for many variables with pysat.Meta.
+
+With pysat installed, or on the PYTHONPATH, run
+
+    python benchmarks/bench_meta.py [--repeat N] [--variables N]
+
+Metadata for each variable is assigned one variable at a time, as
+instrument modules commonly do, and in bulk with `Meta.from_dict`. The
+metadata is then accessed through `Meta.data`, so both include the time
+taken to store the values in the DataFrame. The best time over the
+repeats is reported for each approach.
+"""
+import argparse
+import time
+
+import pysat
+
+
+def best_time(func, repeat):
+    """Return the shortest time, in seconds, taken by func over repeat calls
+    """
+    times = []
+    for i in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def by_variable(meta_dict):
+    meta = pysat.Meta()
+    for name in meta_dict:
+        meta[name] = meta_dict[name]
+    return meta.data
+
+
+def from_dict(meta_dict):
+    return pysat.Meta.from_dict(meta_dict).data
+
+
+def main(repeat=3, variables=1000):
+    meta_dict = {'var{:d}'.format(i): {'units': 'm', 'long_name': 'Var',
+                                       'fill': -1., 'value_min': 0.,
+                                       'value_max': float(i)}
+                 for i in range(variables)}
+
+    print('{:d} variables'.format(variables))
+    loop_time = best_time(lambda: by_variable(meta_dict), repeat)
+    print('meta[name] = {{...}}: {:8.3f} s'.format(loop_time))
+    bulk_time = best_time(lambda: from_dict(meta_dict), repeat)
+    print('Meta.from_dict:      {:8.3f} s'.format(bulk_time))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of times each step is run')
+    parser.add_argument('--variables', type=int, default=1000,
+                        help='number of variables given metadata')
+    args = parser.parse_args()
+    main(args.repeat, args.variables)
@@ -0,0 +1,53 @@
+"""
+Times writing and reading higher order pandas data with netCDF4 files.
+
+With pysat installed, or on the PYTHONPATH, run
+
+    python benchmarks/bench_netcdf4.py [--repeat N]
+
+A day of the pysat_testing2d instrument is loaded, then exported with
+`Instrument.to_netcdf4` and read back with `pysat.utils.load_netcdf4`.
+The best time over the repeats is reported for each step.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import pysat
+
+
+def best_time(func, repeat):
+    """Return the shortest time, in seconds, taken by func over repeat calls
+    """
+    times = []
+    for i in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def main(repeat=3):
+    temp_dir = tempfile.mkdtemp()
+    try:
+        inst = pysat.Instrument('pysat', 'testing2d')
+        inst.load(2009, 1)
+        fname = os.path.join(temp_dir, 'bench_testing2d.nc')
+
+        print('{:d} times, higher order variables: {:s}'.format(
+            len(inst.index), ', '.join(inst.meta.keys_nD())))
+        write_time = best_time(lambda: inst.to_netcdf4(fname), repeat)
+        print('to_netcdf4:   {:8.3f} s'.format(write_time))
+        read_time = best_time(lambda: pysat.utils.load_netcdf4(fname), repeat)
+        print('load_netcdf4: {:8.3f} s'.format(read_time))
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of times each step is run')
+    main(parser.parse_args().repeat)
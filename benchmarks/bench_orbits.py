@@ -0,0 +1,70 @@
+"""
+Times finding orbit breaks in a day of data with pysat.Orbits.
+
+With pysat installed, or on the PYTHONPATH, run
+
+    python benchmarks/bench_orbits.py [--repeat N] [--rates S [S ...]]
+
+A day of the pysat testing instrument is loaded at each sample rate, given
+in seconds, and the orbit breaks are found using local time (equatorial
+orbits), latitude (polar orbits), and orbit number. One local time value in
+every thousand is bad, so that false breaks must be weeded out. The best
+time over the repeats is reported for each kind of break.
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pds
+
+import pysat
+
+
+def best_time(func, repeat):
+    """Return the shortest time, in seconds, taken by func over repeat calls
+    """
+    times = []
+    for i in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def day_of_data(rate):
+    inst = pysat.Instrument('pysat', 'testing', clean_level='clean')
+    index = pds.date_range('2009-01-01', periods=int(86400. / rate),
+                           freq='{:d}L'.format(int(rate * 1000)))
+    secs = (index - index[0]).total_seconds().values
+    uts = secs / 60. / 97.
+    # one bad local time in every thousand samples
+    mlt = (uts * 24.) % 24.
+    mlt[500::1000] = 0.
+    inst.data = pds.DataFrame({'mlt': mlt,
+                               'latitude': 90. * np.sin(2. * np.pi * uts),
+                               'orbit_num': np.floor(uts)}, index=index)
+    return inst
+
+
+def main(repeat=3, rates=(10., 1., 0.1)):
+    kinds = [('local time', 'mlt', '_equaBreaks'),
+             ('latitude', 'latitude', '_polarBreaks'),
+             ('orbit number', 'orbit_num', '_orbitNumberBreaks')]
+    for rate in rates:
+        inst = day_of_data(rate)
+        print('{:g} s samples ({:d} points)'.format(rate, len(inst.index)))
+        for label, index, method in kinds:
+            inst.orbits.orbit_index = index
+            run = getattr(inst.orbits, method)
+            print('{:13s}: {:8.3f} s'.format(label, best_time(run, repeat)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of times each step is run')
+    parser.add_argument('--rates', type=float, nargs='+',
+                        default=[10., 1., 0.1],
+                        help='sample rates to test, in seconds')
+    args = parser.parse_args()
+    main(args.repeat, args.rates)
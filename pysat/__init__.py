@@ -82,6 +82,25 @@ else:
     with open(os.path.join(pysat_dir, 'data_path.txt'), 'r') as f:
         data_dir = f.readline()
 
+# additional data directories are stored one per line after the primary
+# directory, and are searched in order after it
+data_dir = data_dir.rstrip('\n')
+data_dirs = [data_dir]
+with open(os.path.join(pysat_dir, 'data_path.txt'), 'r') as f:
+    data_dirs.extend([line.strip() for line in f.readlines()[1:]
+                      if line.strip() != ''])
+
+# load up stored cache directory and size limit (in bytes), if any
+cache_dir = ''
+cache_size = None
+if os.path.isfile(os.path.join(pysat_dir, 'cache_path.txt')):
+    with open(os.path.join(pysat_dir, 'cache_path.txt'), 'r') as f:
+        cache_info = [line.strip() for line in f.readlines()]
+    if len(cache_info) > 0:
+        cache_dir = cache_info[0]
+    if len(cache_info) > 1 and cache_info[1] != '':
+        cache_size = int(cache_info[1])
+
 import netCDF4
 from pandas import Panel, DataFrame, Series, datetime
 from . import utils, model_utils
@@ -4,7 +4,7 @@ import warnings
 import numpy as np
 import pandas as pds
 
-from pysat.ssnl.avg import _calc_2d_median
+from pysat.ssnl.avg import _bin_locations, _calc_binned_median
 
 
 class Constellation(object):
@@ -201,13 +201,10 @@ class Constellation(object):
         biny = np.linspace(bin3[0], bin3[1], bin3[2]+1)
 
         numy = len(biny)-1
-        numz = len(data_label)
 
-        # Ranges
-        yarr, zarr = map(np.arange, (numy, numz))
-
-        # Store data here.
-        ans = [[[collections.deque()] for j in yarr] for k in zarr]
+        # Store the bin of each sample and the data here.
+        ids = []
+        values = [[] for label in data_label]
 
         # Filter data by bounds and bin it.
         # Idiom for loading all of the data in an instrument's bounds.
@@ -226,42 +223,23 @@ class Constellation(object):
                     # Grab the data in bounds on data1, data2.
                     data_considered = inst.data.iloc[in_bounds]
 
-                    y_indexes = np.digitize(data_considered[label3], biny) - 1
-
-                    # Iterate over the bins along y
-                    for yj in yarr:
-                        # Indices of data in this bin
-                        yindex, = np.where(y_indexes == yj)
-
-                        # If there's data in this bin
-                        if len(yindex) > 0:
-                            ydx = data_considered.index[yindex.astype(int)]
-                            # For each data label, add the points.
-                            for zk in zarr:
-                                dlab = data_label[zk]
-                                ans[zk][yj][0].extend(
-                                    data_considered.loc[ydx, dlab].tolist())
+                    # Bin the data along y
+                    bin_ids, locs = _bin_locations(data_considered, [label3],
+                                                   [biny])
+                    ids.append(bin_ids)
+                    for zk, dlab in enumerate(data_label):
+                        values[zk].append(data_considered[dlab].values[locs])
 
         # Now for the averaging.
-        # Let's, try .. packing the answers for the 2d function.
-        numx = 1
-        xarr = np.arange(numx)
-        binx = None
-
-        # TODO modify output
-        out_2d = _calc_2d_median(ans, data_label, binx, biny, xarr, yarr,
-                                 zarr, numx, numy, numz)
+        out_1d = _calc_binned_median(ids, values, data_label, (numy,))
 
         # Transform output
         output = {}
-        for i, label in enumerate(data_label):
-            median = [r[0] for r in out_2d[label]['median']]
-            count = [r[0] for r in out_2d[label]['count']]
-            dev = [r[0] for r in out_2d[label]['avg_abs_dev']]
-            output[label] = {'median': median,
-                             'count': count,
-                             'avg_abs_dev': dev,
-                             'bin': out_2d[label]['bin_y']}
+        for label in data_label:
+            output[label] = {'median': list(out_1d[label]['median']),
+                             'count': list(out_1d[label]['count']),
+                             'avg_abs_dev': list(out_1d[label]['avg_abs_dev']),
+                             'bin': biny}
         return output
 
     def difference(self, instrument1, instrument2, bounds, data_labels,
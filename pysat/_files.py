@@ -1,16 +1,26 @@
 from __future__ import print_function
 from __future__ import absolute_import
 
+import contextlib
+import errno
 import string
 import os
+import json
+import shutil
+import time
 import weakref
 import re
 import glob
 import numpy as np
 import pandas as pds
 from pysat import data_dir as data_dir
+from pysat import data_dirs as data_dirs
+from pysat import cache_dir as cache_dir
+from pysat import cache_size as cache_size
 
 from pysat import logger
+from pysat.utils.compression import compressed_extensions
+from pysat.utils.compression import is_compressed, split_compression_ext
 
 
 class Files(object):
@@ -35,6 +45,10 @@ class Files(object):
     data_path : string
         path to the directory containing instrument files,
         top_dir/platform/name/tag/
+    data_paths : list
+        paths to the directories searched for instrument files, starting
+        with data_path and followed by the same sub-directory under each of
+        the additional pysat data directories
     manual_org : bool
         if True, then Files will look directly in pysat data directory
         for data files and will not use /platform/name/tag
@@ -162,6 +176,15 @@ class Files(object):
         elif self.data_path[-1] != os.path.sep:
             self.data_path = os.path.join(self.data_path, '')
 
+        # additional data directories, searched in order after data_path
+        self._extra_data_paths = [os.path.join(ddir, self.sub_dir_path, '')
+                                  for ddir in data_dirs[1:]]
+        # fast local cache for files stored in the data directories
+        if cache_dir != '':
+            self._cache = _DataCache(cache_dir, max_size=cache_size)
+        else:
+            self._cache = None
+
         # store write to disk preference
         self.write_to_disk = write_to_disk
         if self.write_to_disk is False:
@@ -183,13 +206,24 @@ class Files(object):
                 # couldn't find stored info, load file list and then store
                 self.refresh()
 
+    @property
+    def data_paths(self):
+        return [self.data_path] + self._extra_data_paths
+
     def _filter_empty_files(self):
         """Update the file list (files) with empty files ignored"""
 
+        cached = {}
+        if self._cache is not None:
+            # read the cache index once for all of the files
+            cached = self._cache.lookup_many(
+                [os.path.join(self.sub_dir_path, fi) for fi in self.files])
         keep_index = []
         for i, fi in enumerate(self.files):
             # create full path
-            fi_path = os.path.join(self.data_path, fi)
+            fi_path = cached.get(os.path.join(self.sub_dir_path, fi))
+            if fi_path is None:
+                fi_path = self._find_path(fi)
             # ensure it exists
             if os.path.exists(fi_path):
                 # check for size
@@ -342,9 +376,19 @@ class Files(object):
                                    data_path=self.data_path,
                                    format_str=self.file_format)
         info = self._remove_data_dir_path(info)
+        # search any additional data directories, files in earlier
+        # directories take precedence
+        for data_path in self._extra_data_paths:
+            if not os.path.isdir(data_path):
+                continue
+            extra_info = self._sat._list_rtn(tag=self._sat.tag,
+                                             sat_id=self._sat.sat_id,
+                                             data_path=data_path,
+                                             format_str=self.file_format)
+            extra_info = self._remove_data_dir_path(extra_info, data_path)
+            info = self._merge_file_lists(info, extra_info)
         if not info.empty:
-            if self.ignore_empty_files:
-                self._filter_empty_files()
+            # empty files are removed when the list is attached below
             logger.info('Found {ll:d} of them.'.format(ll=len(info)))
         else:
             estr = "Unable to find any files that match the supplied template."
@@ -356,6 +400,87 @@ class Files(object):
         # store - to disk, if enabled
         self._store()
 
+    def _merge_file_lists(self, info, extra_info):
+        """Add files from a lower priority data directory to a file list
+
+        Parameters
+        ----------
+        info : pandas.Series
+            Files found in higher priority data directories
+        extra_info : pandas.Series
+            Files found in a lower priority data directory
+
+        Returns
+        -------
+        pandas.Series
+            Files indexed by datetime, including the files in extra_info
+            that aren't already present in info
+
+        """
+
+        if extra_info is None or extra_info.empty:
+            return info
+        if info.empty:
+            return extra_info
+
+        if self._sat.multi_file_day:
+            # several files per time allowed, only skip repeated files
+            is_new = ~extra_info.isin(info.values)
+        else:
+            is_new = ~extra_info.index.isin(info.index)
+        return pds.concat([info, extra_info[is_new]])
+
+    def get_full_path(self, fname, promote=True):
+        """Return the full path to a file from the instrument file list
+
+        Parameters
+        ----------
+        fname : string
+            filename, relative to the instrument data directory
+        promote : bool
+            If True and a pysat cache directory is set, the file is copied
+            into the cache (if not already present) and the path to the
+            cached copy is returned. (default=True)
+
+        Returns
+        -------
+        string
+            Full path to the file in the first data directory that contains
+            it. If the file isn't found in any data directory, the path
+            within data_path is returned.
+
+        """
+
+        if self._cache is None and len(self._extra_data_paths) == 0:
+            return os.path.join(self.data_path, fname)
+
+        rel_path = os.path.join(self.sub_dir_path, fname)
+        if self._cache is not None and not promote:
+            cached = self._cache.lookup(rel_path)
+            if cached is not None:
+                return cached
+
+        full_path = self._find_path(fname)
+        if self._cache is not None and promote and os.path.isfile(full_path):
+            # only files are cached, not directories such as npy stores
+            return self._cache.fetch(rel_path, full_path)
+        else:
+            return full_path
+
+    def _find_path(self, fname):
+        """Return the path to fname in the first data directory with it
+
+        If the file isn't found in any data directory, the path within
+        data_path is returned. The cache directory is not searched.
+
+        """
+
+        for data_path in self.data_paths:
+            full_path = os.path.join(data_path, fname)
+            if os.path.exists(full_path):
+                return full_path
+        return os.path.join(self.data_path, fname)
+
     def get_new(self):
         """List new files since last recorded file state.
 
@@ -480,10 +605,12 @@ class Files(object):
             files = self.files[id1:id2+1].to_list()
         return files
 
-    def _remove_data_dir_path(self, inp=None):
+    def _remove_data_dir_path(self, inp=None, data_path=None):
         """Remove the data directory path from filenames"""
+        if data_path is None:
+            data_path = self.data_path
         if inp is not None:
-            split_str = os.path.join(self.data_path, '')
+            split_str = os.path.join(data_path, '')
             return inp.apply(lambda x: x.split(split_str)[-1])
 
     @classmethod
@@ -551,6 +678,229 @@ class Files(object):
         return process_parsed_filenames(stored, two_digit_year_break)
 
 
+class _DataCache(object):
+    """Least recently used cache of data files on fast local storage.
+
+    Files are copied from the pysat data directories into the cache directory
+    when loaded. An index stored in the cache directory tracks the size,
+    source modification time, and last access time of each cached file.
+    Cached copies that are out of date with the source file are replaced,
+    and the least recently used files are removed whenever the total size
+    exceeds max_size.
+
+    Parameters
+    ----------
+    cache_dir : string
+        Top level cache directory
+    max_size : int or NoneType
+        Maximum total size of the cached files in bytes, unlimited if None
+        (default=None)
+
+    Note
+    ----
+    Several processes may share one cache directory. The index is only read
+    and changed while holding a lock file, and files used within the last
+    in_use_time seconds are not removed, so that a file returned by fetch
+    is still present when it is opened. The cache may briefly exceed
+    max_size while all of its files are in use.
+
+    """
+
+    index_name = '.pysat_cache_index.json'
+    # seconds since last use during which a cached file isn't removed
+    in_use_time = 30.
+    # seconds after which a lock file is assumed to be left by a process
+    # that stopped while holding it
+    lock_timeout = 60.
+
+    def __init__(self, cache_dir, max_size=None):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.index_file = os.path.join(cache_dir, self.index_name)
+
+    @contextlib.contextmanager
+    def _lock(self):
+        """Hold the lock file of the cache index while in this context"""
+        lock_file = '{:s}.lock'.format(self.index_file)
+        while True:
+            try:
+                lock = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except OSError as err:
+                if err.errno != errno.EEXIST:
+                    raise
+            try:
+                if time.time() - os.path.getmtime(lock_file) > \
+                        self.lock_timeout:
+                    logger.info('Removing stale cache lock file')
+                    os.remove(lock_file)
+                    continue
+            except OSError:
+                # lock released while checking its age
+                continue
+            time.sleep(0.01)
+        try:
+            os.close(lock)
+            yield
+        finally:
+            try:
+                os.remove(lock_file)
+            except OSError:
+                pass
+
+    def _load_index(self):
+        """Load the cache index, an empty index is returned on failure"""
+        try:
+            with open(self.index_file, 'r') as fin:
+                return json.load(fin)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _store_index(self, index):
+        """Store the cache index, replacing the old one in a single step"""
+        temp_file = '{:s}.{:d}'.format(self.index_file, os.getpid())
+        with open(temp_file, 'w') as fout:
+            json.dump(index, fout)
+        os.rename(temp_file, self.index_file)
+
+    def lookup(self, rel_path):
+        """Return path to a cached file, or None if it isn't cached"""
+        return self.lookup_many([rel_path]).get(rel_path)
+
+    def lookup_many(self, rel_paths):
+        """Return dict of paths to the cached files among rel_paths
+
+        The index is read once, so this is much faster than calling lookup
+        for each file. Files that aren't cached are left out of the dict.
+
+        """
+        with self._lock():
+            index = self._load_index()
+        cached = {}
+        for rel_path in rel_paths:
+            if rel_path in index:
+                cached_path = os.path.join(self.cache_dir, rel_path)
+                if os.path.isfile(cached_path):
+                    cached[rel_path] = cached_path
+        return cached
+
+    def _use(self, rel_path, entry=None):
+        """Mark a cached file as used, and remove old files if needed
+
+        Parameters
+        ----------
+        rel_path : string
+            Location of the file relative to the cache directory
+        entry : dict or NoneType
+            Index entry for a newly copied file, or None to use the
+            current entry
+
+        Returns
+        -------
+        bool
+            True if the cached file is present and current
+
+        """
+
+        cached = os.path.join(self.cache_dir, rel_path)
+        with self._lock():
+            # read the index again, keeping changes from other processes
+            index = self._load_index()
+            if entry is None:
+                entry = index.get(rel_path)
+            if entry is None or not os.path.isfile(cached):
+                return False
+            entry['atime'] = time.time()
+            index[rel_path] = entry
+            self._evict(index, keep=rel_path)
+            self._store_index(index)
+        return True
+
+    def fetch(self, rel_path, src_path):
+        """Return path to cached copy of src_path, caching it if needed
+
+        Parameters
+        ----------
+        rel_path : string
+            Location of the file relative to the cache directory
+        src_path : string
+            Full path to the file in a pysat data directory
+
+        Returns
+        -------
+        string
+            Full path to the cached file, or src_path if the file is larger
+            than the total cache size or couldn't be kept in the cache
+
+        """
+
+        cached = os.path.join(self.cache_dir, rel_path)
+        src_stat = os.stat(src_path)
+        if self.max_size is not None and src_stat.st_size > self.max_size:
+            return src_path
+
+        # another process may remove the file between the copy and updating
+        # the index, in which case the lookup is repeated
+        for attempt in range(3):
+            with self._lock():
+                entry = self._load_index().get(rel_path)
+                current = (entry is not None and os.path.isfile(cached)
+                           and entry['size'] == src_stat.st_size
+                           and entry['mtime'] == src_stat.st_mtime)
+            if current:
+                if self._use(rel_path):
+                    return cached
+                continue
+
+            # cached copy is missing or out of date
+            cached_dir = os.path.dirname(cached)
+            if not os.path.isdir(cached_dir):
+                try:
+                    os.makedirs(cached_dir)
+                except OSError:
+                    # made by another process
+                    pass
+            # copy under a temporary name so that other processes never
+            # see a partial file
+            temp_file = '{:s}.{:d}.part'.format(cached, os.getpid())
+            shutil.copyfile(src_path, temp_file)
+            os.rename(temp_file, cached)
+            logger.info('Copied {:s} to cache'.format(rel_path))
+            if self._use(rel_path, {'size': src_stat.st_size,
+                                    'mtime': src_stat.st_mtime}):
+                return cached
+
+        return src_path
+
+    def _evict(self, index, keep=None):
+        """Remove least recently used files until the cache fits max_size"""
+
+        # forget about files removed from the cache by other means
+        for rel_path in list(index.keys()):
+            if not os.path.isfile(os.path.join(self.cache_dir, rel_path)):
+                del index[rel_path]
+
+        if self.max_size is None:
+            return
+
+        total = sum([entry['size'] for entry in index.values()])
+        by_age = sorted(index.keys(), key=lambda kk: index[kk]['atime'])
+        now = time.time()
+        for rel_path in by_age:
+            if total <= self.max_size:
+                break
+            if rel_path == keep or \
+                    now - index[rel_path]['atime'] < self.in_use_time:
+                # files used recently may be about to be opened
+                continue
+            try:
+                os.remove(os.path.join(self.cache_dir, rel_path))
+            except OSError:
+                continue
+            total -= index.pop(rel_path)['size']
+            logger.info('Removed {:s} from cache'.format(rel_path))
+
+
 def process_parsed_filenames(stored, two_digit_year_break=None):
     """Accepts dict with data parsed from filenames and creates
     a pandas Series object formatted for the Files class.
@@ -717,6 +1067,8 @@ def parse_fixed_width_filenames(files, format_str):
                    np.array(end_key, dtype=int) - max_len]
     # need to parse out dates for datetime index
     for i, temp in enumerate(files):
+        # compressed files are parsed like the uncompressed file
+        temp = split_compression_ext(temp)[0]
         for j, key in enumerate(keys):
             val = temp[key_str_idx[0][j]:key_str_idx[1][j]]
             stored[key].append(val)
@@ -794,6 +1146,7 @@ def parse_delimited_filenames(files, format_str, delimiter):
     parsed_block = pblock[:-1]
     # need to parse out dates for datetime index
     for temp in files:
+        temp = split_compression_ext(temp)[0]
         split_name = temp.split(delimiter)
         idx = 0
         for sname, bname in zip(split_name, parsed_block):
@@ -929,11 +1282,24 @@ def search_local_system_formatted_filename(data_path, search_str):
     provides a more specific filename search string that limits the
     false positive rate.
 
+    Compressed versions of the files, with one of the extensions in
+    pysat.utils.compression.compressed_extensions, are also returned
+    unless the uncompressed file is present as well.
+
     """
 
     # perform local file search
     abs_search_str = os.path.join(data_path, search_str)
     files = glob.glob(abs_search_str)
+    found = set(files)
+    for ext in compressed_extensions:
+        files.extend([sfile for sfile in glob.glob(abs_search_str + ext)
+                      if sfile not in found])
+    # when both versions of a file are present, the plain file wins
+    found = set(files)
+    files = [sfile for sfile in files
+             if not is_compressed(sfile)
+             or split_compression_ext(sfile)[0] not in found]
     # remove data_path portion
     files = [sfile.split(data_path)[-1] for sfile in files]
     # return info
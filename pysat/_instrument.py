@@ -10,6 +10,7 @@ except NameError:
 import copy
 import functools
 import inspect
+from multiprocessing.pool import ThreadPool
 import os
 import string
 import sys
@@ -1042,7 +1043,7 @@ class Instrument(object):
             raise ValueError('Must supply either a date or file id number.')
 
         if len(fname) > 0:
-            load_fname = [os.path.join(self.files.data_path, f) for f in fname]
+            load_fname = [self.files.get_full_path(f) for f in fname]
             try:
                 data, mdata = self._load_rtn(load_fname, tag=self.tag,
                                              sat_id=self.sat_id, **self.kwargs)
@@ -1368,7 +1369,7 @@ class Instrument(object):
                 self.meta = meta
 
         # check if load routine actually returns meta
-        if self.meta.data.empty:
+        if self.meta.empty:
             self.meta[self.variables] = {self.name_label: self.variables,
                                          self.units_label: [''] *
                                          len(self.variables)}
@@ -1528,7 +1529,11 @@ class Instrument(object):
         # faking daily data from monthly
         for date in local_files.index:
             if date in remote_files.index:
-                if remote_files[date] != local_files[date]:
+                remote_name, local_name = [
+                    utils.compression.split_compression_ext(
+                        os.path.basename(fname))[0]
+                    for fname in [remote_files[date], local_files[date]]]
+                if remote_name != local_name:
                     new_dates.append(date)
         logger.info('Found {} files that are new or updated.'.format(len(new_dates)))
         # download date for dates in new_dates (also includes new names)
@@ -1536,7 +1541,8 @@ class Instrument(object):
                       **kwargs)
 
     def download(self, start=None, stop=None, freq='D', user=None,
-                 password=None, date_array=None, **kwargs):
+                 password=None, date_array=None, skip_listed=False,
+                 **kwargs):
         """Download data for given Instrument object from start to stop.
 
         Parameters
@@ -1555,6 +1561,11 @@ class Instrument(object):
         date_array : list-like
             Sequence of dates to download date for. Takes precendence over
             start and stop inputs
+        skip_listed : bool
+            If True, dates with a file already listed in Instrument.files,
+            in any of the data directories, are not requested from the
+            server. Changes to those remote files are not downloaded.
+            (default=False)
         **kwargs : dict
             Dictionary of keywords that may be options for specific instruments
 
@@ -1594,6 +1605,15 @@ class Instrument(object):
             stop = self._filter_datetime_input(stop)
             date_array = utils.time.create_date_range(start, stop, freq=freq)
 
+        if skip_listed:
+            # files in the local catalog don't need to be checked remotely
+            listed = self.files.files.index
+            date_array = [date for date in date_array if date not in listed]
+            logger.info('{:d} dates are not listed locally.'.format(
+                len(date_array)))
+            if len(date_array) == 0:
+                return
+
         if user is None:
             self._download_rtn(date_array,
                                tag=self.tag,
@@ -1954,6 +1974,34 @@ class Instrument(object):
 
         return data, data_type, datetime_flag
 
+    def _stack_higher_order(self, key, col=None, index=False):
+        """Collect a higher order variable into a single array
+
+        Parameters
+        ----------
+        key : str
+            Name of a variable with a Series or DataFrame at each time
+        col : str or NoneType
+            Column to collect when the variable holds DataFrames. If None,
+            the values of each Series are used. (default=None)
+        index : bool
+            If True, collect the index of each Series or DataFrame rather
+            than the values (default=False)
+
+        Returns
+        -------
+        numpy.ndarray
+            Array with one row for each time in the Instrument
+
+        """
+        items = self.data[key].values
+        if index:
+            return np.stack([item.index.values for item in items])
+        elif col is None:
+            return np.stack([item.values for item in items])
+        else:
+            return np.stack([item[col].values for item in items])
+
     def _filter_netcdf4_metadata(self, mdata_dict, coltype, remove=False,
                                  export_nan=None):
         """Filter metadata properties to be consistent with netCDF4.
@@ -2419,11 +2467,9 @@ class Instrument(object):
                         # has subvariable data (not just empty frame/series)
                         # so we can determine what the real underlying data
                         # types are
-                        good_data_loc = 0
-                        for jjj in np.arange(len(self.data)):
-                            if len(self.data[key].iloc[0]) > 0:
-                                data_loc = jjj
-                                break
+                        lengths = np.array([len(item)
+                                            for item in self.data[key].values])
+                        good_data_loc = int(np.argmax(lengths > 0))
                         # found a place with data, if there is one
                         # now iterate over the subvariables, get data info
                         # create netCDF4 variables and store the data
@@ -2462,17 +2508,10 @@ class Instrument(object):
                                                     'Unable to find MetaData',
                                                     'for', ', '.join((key,
                                                                       col)))))
-                                # attach data
-                                # it may be slow to repeatedly call the store
-                                # method as well astype method below collect
-                                # data into a numpy array, then write the full
-                                # array in one go
+                                # attach data, collected into one array so
+                                # the full variable is written in one go
                                 temp_cdf_data = \
-                                    np.zeros((num, dims[0])).astype(coltype)
-                                for i in range(num):
-                                    temp_cdf_data[i, :] = \
-                                        self[key].iloc[i][col].values
-                                # write data
+                                    self._stack_higher_order(key, col=col)
                                 cdfkey[:, :] = temp_cdf_data.astype(coltype)
 
                             else:
@@ -2509,11 +2548,7 @@ class Instrument(object):
                                                     'Unable to find MetaData',
                                                     'for,', key)))
                                 # attach data
-                                temp_cdf_data = \
-                                    np.zeros((num, dims[0])).astype(coltype)
-                                for i in range(num):
-                                    temp_cdf_data[i, :] = self[i, key].values
-                                # write data
+                                temp_cdf_data = self._stack_higher_order(key)
                                 cdfkey[:, :] = temp_cdf_data.astype(coltype)
 
                         # we are done storing the actual data for the given
@@ -2553,18 +2588,16 @@ class Instrument(object):
                             # set metadata dict
                             cdfkey.setncatts(new_dict)
                             # set data
-                            temp_cdf_data = np.zeros((num,
-                                                      dims[0])).astype(coltype)
-                            for i in range(num):
-                                temp_cdf_data[i, :] = self[i, key].index.values
+                            temp_cdf_data = self._stack_higher_order(key,
+                                                                     index=True)
                             cdfkey[:, :] = (temp_cdf_data.astype(coltype) *
                                             1.E-6).astype(coltype)
 
                         else:
-                            if self[key].iloc[data_loc].index.name is not None:
+                            if self[key].iloc[idx].index.name is not None:
                                 for export_name_label in export_name_labels:
                                     new_dict[export_name_label] = \
-                                        self[key].iloc[data_loc].index.name
+                                        self[key].iloc[idx].index.name
                             else:
                                 for export_name_label in export_name_labels:
                                     new_dict[export_name_label] = key
@@ -2574,11 +2607,8 @@ class Instrument(object):
                             # assign metadata dict
                             cdfkey.setncatts(new_dict)
                             # set data
-                            temp_cdf_data = \
-                                np.zeros((num, dims[0])).astype(coltype)
-                            for i in range(num):
-                                temp_cdf_data[i, :] = \
-                                    self[key].iloc[i].index.to_native_types()
+                            temp_cdf_data = self._stack_higher_order(key,
+                                                                     index=True)
                             cdfkey[:, :] = temp_cdf_data.astype(coltype)
 
             # store any non standard attributes
@@ -2641,6 +2671,77 @@ class Instrument(object):
             out_data.setncatts(adict)
         return
 
+    def to_parquet(self, data_path, format_str=None, n_workers=2,
+                   epoch_name='Epoch', row_group_size=None,
+                   compression='snappy'):
+        """Exports data over the Instrument bounds to daily Parquet files.
+
+        Each day within the bounds is loaded and written to its own file,
+        with the pysat metadata stored in the file schema. The files may be
+        loaded with the generic instrument in
+        pysat.instruments.templates.parquet_pandas.
+
+        Parameters
+        ----------
+        data_path : string
+            Top level directory for the files
+        format_str : string or NoneType
+            Template for the filenames, relative to data_path. If None,
+            pysat.utils.parquet.default_format_str is used. (default=None)
+        n_workers : int
+            Number of days written at the same time. Later days are loaded
+            while earlier days are written. (default=2)
+        epoch_name : string
+            Name of the column that stores the time index (default='Epoch')
+        row_group_size : int or NoneType
+            Number of rows in each Parquet row group. If None, each file is
+            one row group. (default=None)
+        compression : string
+            Compression codec used within the files (default='snappy')
+
+        Returns
+        -------
+        fnames : list
+            Files written, in date order
+
+        Note
+        ----
+        Requires pyarrow. Only pandas data is supported, and higher order
+        variables are not written. Iterating over the Instrument loads each
+        day, so the data for the last day remains loaded afterwards.
+
+        """
+        if not self.pandas_format:
+            raise ValueError('Parquet export is only supported for pandas data')
+        if format_str is None:
+            format_str = utils.parquet.default_format_str
+
+        fnames = []
+        pending = []
+        pool = ThreadPool(max(n_workers, 1))
+        try:
+            for inst in self:
+                if inst.empty:
+                    continue
+                fnames.append(os.path.join(data_path, format_str.format(
+                    year=inst.date.year, month=inst.date.month,
+                    day=inst.date.day)))
+                # limit the number of days held in memory
+                if len(pending) >= max(n_workers, 1):
+                    pending.pop(0).get()
+                pending.append(pool.apply_async(
+                    utils.parquet.write_parquet,
+                    (fnames[-1], inst.data, inst.meta),
+                    {'epoch_name': epoch_name,
+                     'row_group_size': row_group_size,
+                     'compression': compression}))
+            for result in pending:
+                result.get()
+        finally:
+            pool.close()
+            pool.join()
+        return fnames
+
 #
 # ----------------------------------------------
 #   Utilities supporting the Instrument Object
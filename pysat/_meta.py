@@ -1,6 +1,8 @@
 from __future__ import print_function
 from __future__ import absolute_import
 
+from collections import OrderedDict
+from copy import deepcopy
 import os
 import warnings
 import numpy as np
@@ -88,6 +90,15 @@ class Meta(object):
 
     Notes
     -----
+    Metadata assigned to variables is collected by variable and written to
+    the DataFrame at Meta.data in bulk, the next time it is accessed. Use
+    Meta.from_dict or Meta.update_many to assign metadata for many
+    variables at once.
+
+    Meta.copy shares the stored metadata between the copies. Each copy only
+    makes its own copy of the metadata before it is changed, or when
+    Meta.data or Meta.ho_data is accessed, as those may be changed in place.
+
     Meta object preserves the case of variables and attributes as it first
     receives the data. Subsequent calls to set new metadata with the same
     variable or attribute will use case of first call. Accessing or setting
@@ -138,6 +149,10 @@ class Meta(object):
         meta[['name1', 'name2']] = {'long_name':[string1, string2],
                                     'units':[string1, string2],
                                     'custom10':[string1, string2]}
+        # or, with the metadata grouped by variable
+        meta.update_many({'name1': {'long_name':string1, 'units':string1},
+                          'name2': {'long_name':string2, 'units':string2}})
+        meta = pysat.Meta.from_dict({'name1': {'units':string1}})
 
         # assiging metadata for n-Dimensional variables
         meta2 = pysat.Meta()
@@ -204,6 +219,19 @@ class Meta(object):
         self._export_nan = [fill_label] + export_nan
         # init higher order (nD) data structure container, a dict
         self._ho_data = {}
+        # metadata waiting to be written to the DataFrame, by variable,
+        # and the labels not yet in the DataFrame
+        self._pending = OrderedDict()
+        self._pending_labels = []
+        self._frame = None
+        # lower case to stored variable and attribute names, along with
+        # the DataFrame index and columns they were built from, and lower
+        # case to higher order variable names
+        self._lower_names = {'index': None, 'vars': {},
+                             'columns': None, 'attrs': {}, 'ho': {}}
+        # set when the DataFrame and higher order metadata are shared
+        # with copies of this object
+        self._shared = {'shared': False}
         # use any user provided data to instantiate object with data
         # attirube unit and name labels are called within
         if metadata is not None:
@@ -233,10 +261,14 @@ class Meta(object):
 
     @property
     def ho_data(self):
+        self._unshare()
+        # the dict may be changed in place, so rebuild the names when needed
+        self._lower_names['ho'] = None
         return self._ho_data
 
     @property
     def data(self):
+        self._unshare()
         return self._data
 
     @data.setter
@@ -244,9 +276,21 @@ class Meta(object):
         self._data = new_frame
         # self.keys = self._data.columns.lower()
 
+    @property
+    def _data(self):
+        self._flush()
+        return self._frame
+
+    @_data.setter
+    def _data(self, new_frame):
+        self._pending.clear()
+        del self._pending_labels[:]
+        self._frame = new_frame
+
     @ho_data.setter
     def ho_data(self, new_dict):
         self._ho_data = new_dict
+        self._lower_names['ho'] = None
 
     @property
     def empty(self):
@@ -254,7 +298,9 @@ class Meta(object):
 
         # only need to check on lower data since lower data
         # is set when higher metadata assigned
-        if self.data.empty:
+        if len(self._pending) > 0:
+            return False
+        elif self._data.empty:
             return True
         else:
             return False
@@ -276,12 +322,13 @@ class Meta(object):
     def drop(self, names):
         """Drops variables (names) from metadata."""
 
+        self._unshare()
         # drop lower dimension data
         self.data = self._data.drop(names, axis=0)
         # drop higher dimension data
         for name in names:
             if name in self._ho_data:
-                _ = self._ho_data.pop(name)
+                _ = self._pop_ho(name)
 
     def keep(self, keep_names):
         """Keeps variables (keep_names) while dropping other parameters
@@ -291,7 +338,7 @@ class Meta(object):
         keep_names : list-like
             variables to keep
         """
-        keep_names = [self.var_case_name(name) for name in keep_names]
+        keep_names = set([self.var_case_name(name) for name in keep_names])
         current_names = self._data.index
         drop_names = []
         for name in current_names:
@@ -354,9 +401,9 @@ class Meta(object):
     def __contains__(self, other):
         """case insensitive check for variable name"""
 
-        if other.lower() in [i.lower() for i in self.keys()]:
+        if other.lower() in self._var_names():
             return True
-        if other.lower() in [i.lower() for i in self.keys_nD()]:
+        if other.lower() in self._ho_names():
             return True
         return False
 
@@ -384,11 +431,12 @@ class Meta(object):
             for item_name in self.keys_nD():
                 output_str += '\n\n'
                 output_str += 'Metadata for '+item_name+'\n'
-                output_str += self.ho_data[item_name].__str__(False)
+                output_str += self._ho_data[item_name].__str__(False)
 
         return output_str
 
     def _insert_default_values(self, input_name):
+        """Set the default metadata values for a variable"""
 
         default_str = ''
         default_nan = np.NaN
@@ -399,7 +447,169 @@ class Meta(object):
         defaults = [default_str, input_name, default_str, default_str,
                     input_name, input_name, 'linear', default_nan,
                     default_nan, default_nan]
-        self._data.loc[input_name, labels] = defaults
+        if input_name not in self._pending:
+            self._pending[input_name] = {}
+        self._var_names().setdefault(input_name.lower(), input_name)
+        for label, default in zip(labels, defaults):
+            self._set_pending(input_name, label, default)
+
+    def _set_pending(self, name, label, value):
+        """Store a metadata value to be written to the DataFrame"""
+
+        if (label not in self._frame.columns
+                and label not in self._pending_labels):
+            self._pending_labels.append(label)
+            self._attr_names().setdefault(label.lower(), label)
+        self._pending[name][label] = value
+
+    def _var_names(self):
+        """Returns dict of stored variable names keyed by lower case name"""
+
+        index = self._frame.index
+        if self._lower_names['index'] is not index:
+            # variables were added or removed since the dict was built
+            var_names = {}
+            for name in index:
+                var_names.setdefault(name.lower(), name)
+            for name in self._pending:
+                var_names.setdefault(name.lower(), name)
+            self._lower_names['index'] = index
+            self._lower_names['vars'] = var_names
+        return self._lower_names['vars']
+
+    def _attr_names(self):
+        """Returns dict of stored attribute names keyed by lower case name"""
+
+        columns = self._frame.columns
+        if self._lower_names['columns'] is not columns:
+            attr_names = {}
+            for label in columns:
+                attr_names.setdefault(label.lower(), label)
+            for label in self._pending_labels:
+                attr_names.setdefault(label.lower(), label)
+            self._lower_names['columns'] = columns
+            self._lower_names['attrs'] = attr_names
+        return self._lower_names['attrs']
+
+    def _ho_names(self):
+        """Returns dict of higher order variable names keyed by lower case"""
+
+        if self._lower_names['ho'] is None:
+            ho_names = {}
+            for name in self._ho_data:
+                ho_names.setdefault(name.lower(), name)
+            self._lower_names['ho'] = ho_names
+        return self._lower_names['ho']
+
+    def _set_ho(self, name, meta):
+        """Store the Meta object for a higher order variable"""
+
+        self._unshare()
+        self._ho_names().setdefault(name.lower(), name)
+        self._ho_data[name] = meta
+
+    def _pop_ho(self, name):
+        """Remove and return the Meta object for a higher order variable"""
+
+        self._unshare()
+        self._ho_names().pop(name.lower(), None)
+        return self._ho_data.pop(name)
+
+    def _flush(self):
+        """Write the pending metadata values into the DataFrame"""
+
+        if len(self._pending) == 0:
+            return
+        pending = list(self._pending.items())
+        new_labels = list(self._pending_labels)
+        self._pending.clear()
+        del self._pending_labels[:]
+        self._unshare()
+
+        # add rows for new variables and columns for new labels in one step
+        frame = self._frame
+        new_names = [name for name, _ in pending if name not in frame.index]
+        if len(new_names) > 0 or len(new_labels) > 0:
+            frame = frame.reindex(
+                index=frame.index.append(pds.Index(new_names)),
+                columns=frame.columns.append(pds.Index(new_labels)))
+
+        # then set each label for all of the variables at once
+        by_label = OrderedDict()
+        for name, values in pending:
+            for label in values:
+                if label not in by_label:
+                    by_label[label] = ([], [])
+                by_label[label][0].append(name)
+                by_label[label][1].append(values[label])
+        for label in by_label:
+            frame.loc[by_label[label][0], label] = by_label[label][1]
+        self._data = frame
+
+    def update_many(self, meta_dict):
+        """Assign metadata for many variables at once.
+
+        Parameters
+        ----------
+        meta_dict : dict
+            Metadata for each variable name, as a dict of attribute names and
+            values, e.g. {'name1': {'units': 'm'}, 'name2': {'units': 's'}}.
+            Attributes not provided keep their current values, or their
+            default values for new variables. Metadata for higher order
+            variables may be provided as a Meta object under 'meta'.
+
+        Note
+        ----
+        Variable and attribute names are case insensitive and case
+        preserving, as for assignment through meta[name] = {...}.
+
+        """
+
+        if len(meta_dict) == 0:
+            return
+
+        self._unshare()
+        children = []
+        for name in meta_dict:
+            input_data = meta_dict[name]
+            if name in self:
+                new_name = self.var_case_name(name)
+                if new_name not in self._pending:
+                    self._pending[new_name] = {}
+            else:
+                new_name = name
+                self._insert_default_values(new_name)
+
+            for key in input_data:
+                to_be_set = input_data[key]
+                if key in ['children', 'meta']:
+                    children.append((new_name, to_be_set))
+                    continue
+
+                # case of existing attribute is enforced upon new data
+                key = self.attr_case_name(key)
+
+                if hasattr(to_be_set, '__iter__') and \
+                        not isinstance(to_be_set, basestring):
+                    # we have some list-like object
+                    # can only store a single element
+                    if len(to_be_set) == 0:
+                        # empty list, ensure there is something
+                        to_be_set = ['']
+                    if isinstance(to_be_set[0], basestring):
+                        self._set_pending(new_name, key,
+                                          '\n\n'.join(to_be_set))
+                    else:
+                        warnings.warn(' '.join(('Array elements are',
+                                                'not allowed in meta.',
+                                                'Dropping input :', key)))
+                else:
+                    self._set_pending(new_name, key, to_be_set)
+
+        # process higher order metadata, assigned as Meta objects
+        for name, child in children:
+            if child is not None:
+                self[name] = child
 
 
     def __setattr__(self, name, value):
@@ -447,75 +657,23 @@ class Meta(object):
         if isinstance(input_data, dict):
             # if not passed an iterable, make it one
             if isinstance(names, basestring):
-                names = [names]
-                for key in input_data:
-                    input_data[key] = [input_data[key]]
+                self.update_many({names: input_data})
+                return
             elif isinstance(names, slice) and (names.step is None):
                 # Check for instrument[indx,:] or instrument[idx] usage
-                names = list(self.data.keys())
-            # make sure the variable names are in good shape
-            # Meta object is case insensitive but case preserving
-            # convert given names into ones Meta has already seen
-            # if new, then input names become the standard
-            names = [self.var_case_name(name) for name in names]
-            for name in names:
-                if name not in self:
-                    self._insert_default_values(name)
-            # check if input dict empty
-            if input_data.keys() == []:
-                # meta wasn't actually assigned by user, empty call
-                # we can head out - we've assigned defaults if first data
-                return
+                names = list(self._data.keys())
             # perform some checks on the data
             # make sure number of inputs matches number of metadata inputs
             for key in input_data:
                 if len(names) != len(input_data[key]):
                     raise ValueError(''.join(('Length of names and inputs',
                                               ' must be equal.')))
-            # make sure the attribute names are in good shape
-            # check name of attributes against existing attribute names
-            # if attribute name exists somewhere, then case of existing
-            # attribute
-            # will be enforced upon new data by default for consistency
-            keys = [i for i in input_data]
-            for name in keys:
-                new_name = self.attr_case_name(name)
-                if new_name != name:
-                    input_data[new_name] = input_data.pop(name)
-
-            # time to actually add the metadata
-            for key in input_data:
-                if key not in ['children', 'meta']:
-                    for i, name in enumerate(names):
-                        to_be_set = input_data[key][i]
-                        if hasattr(to_be_set, '__iter__') and \
-                                not isinstance(to_be_set, basestring):
-                            # we have some list-like object
-                            # can only store a single element
-                            if len(to_be_set) == 0:
-                                # empty list, ensure there is something
-                                to_be_set = ['']
-                            if isinstance(to_be_set[0], basestring):
-                                self._data.loc[name, key] = \
-                                    '\n\n'.join(to_be_set)
-                            else:
-                                warnings.warn(' '.join(('Array elements are',
-                                                        'not allowed in meta.',
-                                                        'Dropping input :',
-                                                        key)))
-                        else:
-                            self._data.loc[name, key] = to_be_set
-                else:
-                    # key is 'meta' or 'children'
-                    # process higher order stuff. Meta inputs could be part of
-                    # larger multiple parameter assignment
-                    # so not all names may actually have 'meta' to add
-                    for j, (item, val) in enumerate(zip(names,
-                                                        input_data['meta'])):
-                        if val is not None:
-                            # assign meta data, recursive call....
-                            # heads to if Meta instance call
-                            self[item] = val
+            # regroup the metadata by variable
+            meta_dict = OrderedDict()
+            for i, name in enumerate(names):
+                meta_dict[name] = {key: input_data[key][i]
+                                   for key in input_data}
+            self.update_many(meta_dict)
 
         elif isinstance(input_data, Series):
             # outputs from Meta object are a Series.
@@ -526,7 +684,7 @@ class Meta(object):
                 child = in_dict.pop('children')
                 if child is not None:
                     # if not child.data.empty:
-                    self.ho_data[names] = child
+                    self._set_ho(names, child)
             # remaining items are simply assigned
             self[names] = in_dict
 
@@ -567,7 +725,7 @@ class Meta(object):
             # if there is no existing metadata info
             self[new_item_name] = {}
             # now add to higher order data
-            self._ho_data[new_item_name] = input_data
+            self._set_ho(new_item_name, input_data)
 
     def __getitem__(self, key):
         """Convenience method for obtaining metadata.
@@ -609,17 +767,17 @@ class Meta(object):
             # if tuple length is 2, index, column
             if len(key) == 2:
                 new_index = match_name(self.var_case_name, key[0],
-                                        self.data.index)
+                                        self._data.index)
                 new_name = match_name(self.attr_case_name, key[1],
-                                        self.data.columns)
-                return self.data.loc[new_index, new_name]
+                                        self._data.columns)
+                return self._data.loc[new_index, new_name]
 
             # if tuple length is 3, index, child_index, column
             elif len(key) == 3:
                 new_index = self.var_case_name(key[0])
                 new_child_index = self.var_case_name(key[1])
                 new_name = self.attr_case_name(key[2])
-                return self.ho_data[new_index].data.loc[new_child_index,
+                return self._ho_data[new_index]._data.loc[new_child_index,
                                                         new_name]
 
         elif isinstance(key, list):
@@ -633,9 +791,9 @@ class Meta(object):
                 # if new_key in self.keys():
                 # don't need to check if in lower, all variables
                 # are always in the lower metadata
-                meta_row = self.data.loc[new_key]
-                if new_key in self.keys_nD():
-                    meta_row.at['children'] = self.ho_data[new_key].copy()
+                meta_row = self._data.loc[new_key]
+                if new_key in self._ho_data:
+                    meta_row.at['children'] = self._ho_data[new_key].copy()
                 else:
                     # empty_meta = Meta()
                     # self.apply_default_labels(empty_meta)
@@ -816,31 +974,40 @@ class Meta(object):
         """
 
         lower_name = name.lower()
-        if name in self:
-            for i in self.keys():
-                if lower_name == i.lower():
-                    return i
-            for i in self.keys_nD():
-                if lower_name == i.lower():
-                    return i
+        var_names = self._var_names()
+        if lower_name in var_names:
+            return var_names[lower_name]
+        ho_names = self._ho_names()
+        if lower_name in ho_names:
+            return ho_names[lower_name]
         return name
 
     def keys(self):
         """Yields variable names stored for 1D variables"""
 
-        for i in self.data.index:
+        # metadata may be flushed to the DataFrame while iterating
+        index = self._frame.index
+        pending = list(self._pending)
+        for i in index:
             yield i
+        for i in pending:
+            if i not in index:
+                yield i
 
     def keys_nD(self):
         """Yields keys for higher order metadata"""
 
-        for i in self.ho_data:
+        for i in self._ho_data:
             yield i
 
     def attrs(self):
         """Yields metadata products stored for each variable name"""
 
-        for i in self.data.columns:
+        columns = self._frame.columns
+        pending = list(self._pending_labels)
+        for i in columns:
+            yield i
+        for i in pending:
             yield i
 
     def has_attr(self, name):
@@ -864,7 +1031,7 @@ class Meta(object):
 
         """
 
-        if name.lower() in [i.lower() for i in self.data.columns]:
+        if name.lower() in self._attr_names():
             return True
         return False
 
@@ -889,14 +1056,14 @@ class Meta(object):
         """
 
         lower_name = name.lower()
-        for i in self.attrs():
-            if lower_name == i.lower():
-                return i
+        attr_names = self._attr_names()
+        if lower_name in attr_names:
+            return attr_names[lower_name]
         # check if attribute present in higher order structures
-        for key in self.keys_nD():
-            for i in self[key].children.attrs():
-                if lower_name == i.lower():
-                    return i
+        for key in self._ho_names().values():
+            attr_names = self._ho_data[key]._attr_names()
+            if lower_name in attr_names:
+                return attr_names[lower_name]
         # nothing was found if still here
         # pass name back, free to be whatever
         return name
@@ -944,14 +1111,57 @@ class Meta(object):
             mdata.data.loc[key] = other.data.loc[key]
         # add together higher order data
         for key in other_updated.keys_nD():
-            mdata.ho_data[key] = other.ho_data[key]
+            mdata._set_ho(key, other.ho_data[key])
 
         return mdata
 
     def copy(self):
-        from copy import deepcopy as deepcopy
-        """Deep copy of the meta object."""
-        return deepcopy(self)
+        """Copy of the meta object.
+
+        The copy shares the stored metadata with this object until either
+        one is changed, so copies are cheap to make and to discard.
+
+        """
+
+        self._flush()
+        shared = ['_frame', '_ho_data', '_pending', '_pending_labels',
+                  '_lower_names', '_shared']
+        state = {key: deepcopy(value) for key, value in self.__dict__.items()
+                 if key not in shared}
+        state['_frame'] = self._frame
+        state['_ho_data'] = self._ho_data
+        state['_pending'] = OrderedDict()
+        state['_pending_labels'] = []
+        state['_lower_names'] = dict(self._lower_names)
+        state['_shared'] = {'shared': True}
+        self._shared['shared'] = True
+
+        # set state directly, as the copy may not be mutable
+        meta = self.__class__.__new__(self.__class__)
+        meta.__dict__.update(state)
+        return meta
+
+    def _unshare(self):
+        """Copy metadata shared with other Meta objects before changing it"""
+
+        if not self._shared['shared']:
+            return
+        self._shared['shared'] = False
+
+        frame = self._frame.copy()
+        lower_names = self._lower_names
+        if lower_names['index'] is self._frame.index:
+            lower_names['index'] = frame.index
+        if lower_names['columns'] is self._frame.columns:
+            lower_names['columns'] = frame.columns
+        lower_names['vars'] = dict(lower_names['vars'])
+        lower_names['attrs'] = dict(lower_names['attrs'])
+        if lower_names['ho'] is not None:
+            lower_names['ho'] = dict(lower_names['ho'])
+        ho_data = {key: child.copy() for key, child in self._ho_data.items()}
+        # storage is replaced whether or not the object is mutable
+        super(Meta, self).__setattr__('_frame', frame)
+        super(Meta, self).__setattr__('_ho_data', ho_data)
 
     def pop(self, name):
         """Remove and return metadata about variable
@@ -975,7 +1185,7 @@ class Meta(object):
                 output = self[new_name]
                 self.data.drop(new_name, inplace=True, axis=0)
             else:
-                output = self.ho_data.pop(new_name)
+                output = self._pop_ho(new_name)
 
             return output
         else:
@@ -1006,9 +1216,9 @@ class Meta(object):
         """
 
         # base Instrument attributes
-        banned = inst._base_attr
+        banned = set(inst._base_attr)
         # get base attribute set, and attributes attached to instance
-        base_attrb = self._base_attr
+        base_attrb = set(self._base_attr)
         this_attrb = dir(self)
         # collect these attributes into a dict
         adict = {}
@@ -1026,7 +1236,7 @@ class Meta(object):
         # to check if a duplicate
 
         # instrument attributes are now inst.meta attributes
-        inst_attr = dir(inst)
+        inst_attr = set(dir(inst))
 
         for key in transfer_key:
             if key not in banned:
@@ -1201,13 +1411,28 @@ class Meta(object):
         else:
             raise ValueError('Unable to retrieve information from ' + name)
 
+    @classmethod
+    def from_dict(cls, meta_dict, **kwargs):
+        """Create Meta object from a dict of metadata for each variable.
+
+        Parameters
+        ----------
+        meta_dict : dict
+            Metadata for each variable name, as a dict of attribute names and
+            values, e.g. {'name1': {'units': 'm'}, 'name2': {'units': 's'}}
+        **kwargs : dict
+            Keywords passed to Meta, such as the attribute labels
+
+        Returns
+        -------
+        Meta
+
+        """
+        meta = cls(**kwargs)
+        meta.update_many(meta_dict)
+        return meta
+
     # @classmethod
     # def from_nc():
     #     """not implemented yet, load metadata from netCDF"""
     #     pass
-    #
-    # @classmethod
-    # def from_dict():
-    #     """not implemented yet, load metadata from dict of items/list types
-    #     """
-    #     pass
@@ -2,9 +2,13 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 import functools
+import hashlib
+import json
+import os
 
 import numpy as np
 import pandas as pds
+import xarray as xr
 from pysat import Series
 from pysat import logger
 
@@ -70,6 +74,16 @@ class Orbits(object):
         vefi.orbits.next()
         # backwards
         vefi.orbits.prev()
+
+        # find all orbits within the bounds once, then iterate over them
+        # loading only the days spanned by each orbit
+        vefi.orbits.build_catalog()
+        for vefi in vefi.orbits:
+            print('Next catalog orbit ', vefi['dB_mer'])
+
+        # iterate forward over orbits, loading each day once
+        for vefi in vefi.orbits.stream(pad={'minutes': 5}):
+            print('Next padded orbit ', vefi['dB_mer'])
     """
 
     def __init__(self, sat=None, index=None, kind=None, period=None):
@@ -107,6 +121,13 @@ class Orbits(object):
         self.num = 0
         self._current = 0
         self.orbit_index = index
+        self._kind = kind
+
+        # start and stop times of every orbit within the bounds, along with
+        # the dates used to build it, and days loaded for catalog orbits
+        self.catalog = None
+        self._catalog_dates = None
+        self._catalog_days = {}
 
     @property
     def current(self):
@@ -159,13 +180,20 @@ class Orbits(object):
         """Prepares data structure for breaking data into orbits. Not intended
         for end user."""
         # if the breaks between orbit have not been defined, define them
-        # also, store the data so that grabbing different orbits does not
+        # also, keep the data so that grabbing different orbits does not
         # require reloads of whole dataset
         if len(self._orbit_breaks) == 0:
             # determine orbit breaks
             self._detBreaks()
-            # store a copy of data
-            self._fullDayData = self.sat.data.copy()
+            # keep the loaded data, orbits are positional views into it
+            self._fullDayData = self.sat.data
+            if self.sat.pandas_format and \
+                    hasattr(self._fullDayData, '_consolidate_inplace'):
+                # combine columns of the same type once, otherwise pandas
+                # copies each orbit when combining them on first access.
+                # This is a private pandas method, and only a speedup, so
+                # it is skipped by versions of pandas without it
+                self._fullDayData._consolidate_inplace()
             # set current orbit counter to zero (default)
             self._current = 0
 
@@ -222,34 +250,16 @@ class Orbits(object):
 
             # check for large positive gradients around the break that would
             # suggest not a true orbit break, but rather bad orbit_index values
-            new_ind = []
-            for idx in ind:
-                tidx, = np.where(lt_diff[(idx - 5):(idx + 6)] > 10 * typical_lt_diff)
-
-                if len(tidx) != 0:
-                    # there are large changes, suggests a false alarm
-                    # iterate over samples and check
-                    for sub_tidx in tidx:
-                        # look at time change vs local time change
-                        if(ut_diff[idx - 5:idx + 6].iloc[sub_tidx] <
-                           lt_diff[idx - 5:idx + 6].iloc[sub_tidx] /
-                           orbit_index_period * self.orbit_period):
-                            # change in ut is small compared to the change in
-                            # the orbit index this is flagged as a false alarm,
-                            # or dropped from consideration
-                            logger.info(''.join(('Dropping found break ',
-                                                 'as false positive.')))
-                            pass
-                        else:
-                            # change in UT is significant, keep orbit break
-                            new_ind.append(idx)
-                            break
-                else:
-                    # no large positive gradients, current orbit break passes
-                    # the first test
-                    new_ind.append(idx)
+            good = self._check_equa_breaks(ind, lt_diff.values,
+                                           ut_diff.values,
+                                           typical_lt_diff,
+                                           orbit_index_period)
+            if (~good).any():
+                logger.info(''.join(('Dropping {:d} found break(s) ',
+                                     'as false positive.')).format(
+                                         (~good).sum()))
             # replace all breaks with those that are 'good'
-            ind = np.array(new_ind)
+            ind = ind[good]
 
         # now, assemble some orbit breaks that are not triggered by changes in
         # the orbit index
@@ -313,6 +323,67 @@ class Orbits(object):
         # set number of orbits for the day
         self.num = num_orbits
 
+    def _check_equa_breaks(self, ind, lt_diff, ut_diff, typical_lt_diff,
+                           orbit_index_period):
+        """Test candidate equatorial orbit breaks for false positives.
+
+        Parameters
+        ----------
+        ind : array-like of int
+            Locations of candidate orbit breaks
+        lt_diff : array-like of float
+            Difference between consecutive orbit index values
+        ut_diff : array-like of timedelta64
+            Difference between consecutive times
+        typical_lt_diff : float
+            Typical difference between consecutive orbit index values
+        orbit_index_period : float
+            The change in value of supplied index parameter for a single orbit
+
+        Returns
+        -------
+        good : array-like of bool
+            True for each break that is kept
+
+        Note
+        ----
+        A break is dropped when every large positive gradient in the orbit
+        index within five samples of the break comes with a change in time
+        that is small compared to the change in the orbit index. The window
+        around each break follows Python slicing of [idx - 5:idx + 6], and
+        all windows are tested together.
+
+        """
+
+        ind = np.asarray(ind, dtype=np.int64)
+        num = len(lt_diff)
+        # start and stop of each window, as set by Python slicing
+        start = ind - 5
+        start = np.where(start < 0, np.maximum(start + num, 0), start)
+        stop = np.minimum(ind + 6, num)
+        locs = start[:, np.newaxis] + np.arange(11)
+        in_window = locs < stop[:, np.newaxis]
+        locs = np.where(in_window, locs, 0)
+
+        # large positive gradients, which suggest a false alarm
+        with np.errstate(invalid='ignore'):
+            lt_win = lt_diff[locs]
+            large = in_window & (lt_win > 10 * typical_lt_diff)
+
+        # change in time compared to the change in orbit index, truncated
+        # to whole nanoseconds as done by pandas.Timedelta
+        ut_win = ut_diff.astype('timedelta64[ns]')[locs]
+        ut_null = np.isnat(ut_win)
+        ut_win = ut_win.astype(np.int64)
+        period = self.orbit_period.value
+        with np.errstate(invalid='ignore'):
+            lt_ut = np.trunc(lt_win / orbit_index_period * period)
+            small_ut = ~ut_null & (ut_win < lt_ut)
+
+        # keep breaks without large gradients, or where any large gradient
+        # comes with a significant change in UT
+        return ~large.any(axis=1) | (large & ~small_ut).any(axis=1)
+
     def _polarBreaks(self):
         """Determine where breaks in a polar orbiting satellite orbit occur.
 
@@ -383,11 +454,9 @@ class Orbits(object):
                                           'appear to exist in loaded data')))
 
         # determine where the orbit index changes from one value to the next
-        uniq_vals = np.unique(self.sat[self.orbit_index].values)
-        orbit_index = []
-        for val in uniq_vals:
-            idx, = np.where(val == self.sat[self.orbit_index].values)
-            orbit_index.append(idx[0])
+        # first location of each orbit number, ordered by orbit number
+        _, orbit_index = np.unique(self.sat[self.orbit_index].values,
+                                   return_index=True)
 
         # create orbitbreak index, ensure first element is always 0
         if len(orbit_index) > 0:
@@ -404,6 +473,363 @@ class Orbits(object):
         # set number of orbits for the day
         self.num = num_orbits
 
+    def _find_breaks(self, orbit_index):
+        """Find orbit breaks within a Series of orbit index values
+
+        Parameters
+        ----------
+        orbit_index : pandas.Series
+            orbit index values, indexed by time
+
+        Returns
+        -------
+        np.array
+            integer locations of the start of each orbit
+
+        """
+
+        stored_data = self.sat.data
+        if self.sat.pandas_format:
+            self.sat.data = pds.DataFrame({self.orbit_index: orbit_index})
+        else:
+            self.sat.data = xr.Dataset({self.orbit_index:
+                                        ('time', orbit_index.values)},
+                                       coords={'time': orbit_index.index})
+        try:
+            self._detBreaks()
+            breaks = np.asarray(self._orbit_breaks, dtype=int)
+        finally:
+            self.sat.data = stored_data
+            self._reset()
+        return breaks
+
+    def _catalog_file(self):
+        """Full path of the stored orbit catalog for this instrument"""
+
+        fname = ''.join((self.sat.platform, '_', self.sat.name, '_',
+                         self.sat.tag, '_', self.sat.sat_id,
+                         '_orbit_catalog.json'))
+        return os.path.join(self.sat.files.home_path, fname)
+
+    def _catalog_key(self, dates):
+        """Describe the orbit settings, files, and custom functions used
+        to build a catalog over dates"""
+
+        custom = self.sat.custom
+        functions = [(_function_fingerprint(func), kind, args, kwargs)
+                     for func, kind, args, kwargs in
+                     zip(custom._functions, custom._kind, custom._args,
+                         custom._kwargs)]
+        if any(function[0] is None for function in functions):
+            # catalogs built with functions that can't be compared are
+            # never reused
+            custom_key = None
+        else:
+            custom_key = hashlib.sha1(repr(functions).encode('utf-8')
+                                      ).hexdigest()
+        fnames = self.sat.files[dates[0]:dates[-1] + pds.DateOffset(days=1)]
+        return {'kind': self._kind, 'index': self.orbit_index,
+                'period': int(self.orbit_period.value),
+                'custom': custom_key,
+                'files': [str(fname) for fname in fnames]}
+
+    def _load_stored_catalog(self, dates):
+        """Return orbits within dates from the stored catalog, or None if
+        the stored catalog does not cover them"""
+
+        fname = self._catalog_file()
+        if not (self.sat.files.write_to_disk and os.path.isfile(fname)):
+            return None
+        with open(fname, 'r') as fin:
+            stored = json.load(fin)
+
+        stored_dates = pds.to_datetime(stored['dates'])
+        if (len(stored_dates) == 0 or dates[0] < stored_dates[0]
+                or dates[-1] > stored_dates[-1]):
+            return None
+        key = self._catalog_key(dates)
+        if key['custom'] is None or 'days' not in stored:
+            return None
+        for label in ['kind', 'index', 'period', 'custom']:
+            if key[label] != stored['key'][label]:
+                return None
+        if not set(key['files']).issubset(stored['key']['files']):
+            return None
+
+        catalog = pds.DataFrame({'start': pds.to_datetime(stored['start']),
+                                 'stop': pds.to_datetime(stored['stop'])},
+                                columns=['start', 'stop'])
+        last = dates[-1] + pds.DateOffset(days=1)
+        catalog = catalog[(catalog['stop'] >= dates[0])
+                          & (catalog['start'] < last)]
+        catalog = catalog.reset_index(drop=True)
+
+        # orbits that continue outside of the dates are cut at the first and
+        # last sample within them, as they would be by a new catalog
+        days = pds.DataFrame(stored['days'], columns=['date', 'first',
+                                                      'last'])
+        days = days.apply(pds.to_datetime)
+        days = days[(days['date'] >= dates[0]) & (days['date'] <= dates[-1])]
+        if len(days) == 0 or len(catalog) == 0:
+            return catalog.iloc[0:0]
+        catalog.loc[0, 'start'] = max(catalog['start'].iloc[0],
+                                      days['first'].iloc[0])
+        catalog.loc[len(catalog) - 1, 'stop'] = min(catalog['stop'].iloc[-1],
+                                                    days['last'].iloc[-1])
+        return catalog
+
+    def _store_catalog(self, dates, catalog, days):
+        """Write the catalog, and the first and last sample of each day with
+        data, next to the stored file list"""
+
+        if not self.sat.files.write_to_disk:
+            return
+        fname = self._catalog_file()
+        temp_name = '{:s}.{:d}.part'.format(fname, os.getpid())
+        with open(temp_name, 'w') as fout:
+            json.dump({'key': self._catalog_key(dates),
+                       'dates': [str(date) for date in dates],
+                       'start': [int(time.value) for time in catalog['start']],
+                       'stop': [int(time.value) for time in catalog['stop']],
+                       'days': [[int(time.value) for time in day]
+                                for day in days]},
+                      fout)
+        os.rename(temp_name, fname)
+
+    def build_catalog(self, use_stored=True, store=True):
+        """Find the start and stop times of every orbit within the bounds.
+
+        Each day within inst.bounds is loaded once, keeping only the orbit
+        index, and orbits are followed across day boundaries. Once built,
+        iterating over inst.orbits uses the catalog, loading only the days
+        spanned by each orbit.
+
+        Parameters
+        ----------
+        use_stored : bool
+            If True, orbits are taken from the stored catalog when it covers
+            the bounds and was built from the same files, orbit settings,
+            and custom functions, compared by their code. Catalogs are not
+            reused with custom functions that have no Python code.
+            (default=True)
+        store : bool
+            If True, the catalog is stored next to the Instrument file list
+            for later use. (default=True)
+
+        Returns
+        -------
+        pandas.DataFrame
+            Times of the first ('start') and last ('stop') sample of each
+            orbit, ordered by time. Also stored in inst.orbits.catalog.
+
+        Note
+        ----
+        Only supported when iterating by date. The Instrument is left with
+        the last day of the bounds loaded if the catalog is built.
+
+        """
+
+        if self.sat._iter_type != 'date':
+            raise ValueError('Orbit catalogs require iteration by date.')
+        if self.orbit_index is None:
+            raise ValueError('Orbit properties must be defined at ' +
+                             'pysat.Instrument object instantiation.' +
+                             'See Instrument docs.')
+        dates = pds.DatetimeIndex(self.sat._iter_list)
+
+        catalog = None
+        if use_stored:
+            catalog = self._load_stored_catalog(dates)
+
+        if catalog is None:
+            starts = []
+            stops = []
+            # first and last sample of each day with data
+            days = []
+            # orbit index values of the orbit still open at the end of the
+            # previous day
+            carry = None
+            for date in dates:
+                self.sat.load(date=date)
+                if self.sat.empty:
+                    continue
+                index = self.sat[self.orbit_index]
+                if not self.sat.pandas_format:
+                    index = index.to_pandas()
+                # exclude any padding outside of the day
+                index = index[(index.index >= date) &
+                              (index.index < date + pds.DateOffset(days=1))]
+                if len(index) > 0:
+                    days.append((date, index.index[0], index.index[-1]))
+                if carry is not None:
+                    index = pds.concat([carry, index])
+                if len(index) == 0:
+                    continue
+                breaks = self._find_breaks(index)
+                for first, last in zip(breaks[:-1], breaks[1:]):
+                    starts.append(index.index[first])
+                    stops.append(index.index[last - 1])
+                carry = index.iloc[breaks[-1]:]
+            if carry is not None and len(carry) > 0:
+                starts.append(carry.index[0])
+                stops.append(carry.index[-1])
+
+            catalog = pds.DataFrame({'start': pds.to_datetime(starts),
+                                     'stop': pds.to_datetime(stops)},
+                                    columns=['start', 'stop'])
+            if store:
+                self._store_catalog(dates, catalog, days)
+
+        self.catalog = catalog
+        self._catalog_dates = dates
+        self._catalog_days = {}
+        return catalog
+
+    def load_catalog_orbit(self, orbit):
+        """Load an orbit from the orbit catalog into .data.
+
+        Parameters
+        ----------
+        orbit : int
+            orbit number within the catalog, zero indexed. Negative numbers
+            count back from the last orbit.
+
+        Note
+        ----
+        Only the days spanned by the orbit are loaded, and days already
+        loaded for the previous orbit are reused. See build_catalog.
+
+        """
+
+        if self.catalog is None:
+            raise ValueError(' '.join(('An orbit catalog must be built',
+                                       'first, see build_catalog.')))
+        start = self.catalog['start'].iloc[orbit]
+        stop = self.catalog['stop'].iloc[orbit]
+        dates = pds.date_range(start.floor('D'), stop.floor('D'), freq='D')
+
+        days = {}
+        for date in dates:
+            if date in self._catalog_days:
+                days[date] = self._catalog_days[date]
+                continue
+            self.sat.load(date=date)
+            if not self.sat.empty:
+                # exclude any padding outside of the day
+                days[date] = self.sat[date:date + pds.DateOffset(days=1) -
+                                      pds.DateOffset(microseconds=1)]
+        self._catalog_days = days
+
+        pieces = [days[date] for date in dates if date in days]
+        if len(pieces) > 1:
+            self.sat.data = self.sat.concat_data(pieces)
+        else:
+            self.sat.data = pieces[0]
+        self.sat.data = self.sat[start:stop]
+
+    def _orbit_data(self, start, stop=None):
+        """Select the loaded day of data from start up to stop, by position.
+
+        Parameters
+        ----------
+        start : int
+            location of first sample
+        stop : int or NoneType
+            location after the last sample, or None for the end of the day
+
+        Returns
+        -------
+        pds.DataFrame or xr.Dataset
+            View into the loaded day of data, not a copy
+
+        """
+        if self.sat.pandas_format:
+            return self._fullDayData.iloc[start:stop]
+        else:
+            epoch_name = self.sat._index(self._fullDayData).name
+            return self._fullDayData.isel(
+                indexers={epoch_name: slice(start, stop)})
+
+    def aggregate(self, func='mean', data_label=None):
+        """Calculate statistics for each orbit in the loaded day of data.
+
+        Parameters
+        ----------
+        func : str, function, or list-like (default='mean')
+            Statistic to calculate, one of 'count', 'sum', 'mean', 'std',
+            'var', 'min', 'max', or 'median', or a function that returns a
+            single value from an array holding the values within an orbit.
+            A list calculates each statistic in turn.
+        data_label : str, list-like of str, or NoneType (default=None)
+            Variables to aggregate. If None, all one dimensional numeric
+            variables are used.
+
+        Returns
+        -------
+        pds.DataFrame
+            Statistics indexed by the start time of each orbit, with a column
+            for each variable. If func is list-like, the columns are labeled
+            by (variable, statistic).
+
+        Note
+        ----
+        NaN values are ignored, and are removed before calling func. Named
+        statistics are calculated for all orbits at once from the orbit
+        breaks, rather than loading each orbit into .data. Orbits are split
+        at the day boundaries, see build_catalog for orbits across days.
+
+        Examples
+        --------
+        ::
+
+            inst.load(2009, 1)
+            means = inst.orbits.aggregate('mean', ['mlt', 'slt'])
+
+        """
+
+        if len(self._orbit_breaks) == 0 and self.sat.empty:
+            return pds.DataFrame(None)
+        self._calcOrbits()
+
+        data = self._fullDayData
+        index = self.sat._index(data)
+        if data_label is None:
+            if self.sat.pandas_format:
+                data_label = [label for label in data.columns
+                              if np.issubdtype(data[label].dtype, np.number)]
+            else:
+                data_label = [label for label in data.data_vars
+                              if data[label].dims == (index.name,) and
+                              np.issubdtype(data[label].dtype, np.number)]
+        elif isinstance(data_label, str):
+            data_label = [data_label]
+
+        single = isinstance(func, str) or callable(func)
+        funcs = [func] if single else list(func)
+
+        starts = np.asarray(self._orbit_breaks, dtype=np.int64)
+        lengths = np.diff(np.append(starts, len(index)))
+        orbit_ids = np.repeat(np.arange(len(starts)), lengths)
+
+        output = {}
+        columns = []
+        for label in data_label:
+            values = np.asarray(data[label].values, dtype=np.float64)
+            if values.ndim != 1:
+                raise ValueError(''.join(('Only one dimensional variables ',
+                                          'may be aggregated: ', label)))
+            for stat in funcs:
+                column = label if single else (label, getattr(stat, '__name__',
+                                                              stat))
+                output[column] = _reduce_orbits(values, starts, orbit_ids,
+                                                stat)
+                columns.append(column)
+
+        output = pds.DataFrame(output, index=index[starts], columns=columns)
+        if not single:
+            output.columns = pds.MultiIndex.from_tuples(columns)
+        return output
+
     def _getBasicOrbit(self, orbit=None):
         """Load a particular orbit into .data for loaded day.
 
@@ -430,24 +856,24 @@ class Orbits(object):
                 # pull out requested orbit
                 if orbit == -1:
                     # load orbit data into data
-                    self.sat.data = self.sat[self._orbit_breaks[self.num +
-                                                                orbit]:]
+                    self.sat.data = self._orbit_data(
+                        self._orbit_breaks[self.num + orbit])
                     self._current = self.num + orbit + 1
                 elif ((orbit < 0) & (orbit >= -self.num)):
                     # load orbit data into data
-                    self.sat.data = self.sat[self._orbit_breaks[self.num +
-                                                                orbit]:
-                                             self._orbit_breaks[self.num +
-                                                                orbit + 1]]
-
+                    self.sat.data = self._orbit_data(
+                        self._orbit_breaks[self.num + orbit],
+                        self._orbit_breaks[self.num + orbit + 1])
                     self._current = self.num + orbit + 1
                 elif (orbit < self.num) & (orbit != 0):
                     # load orbit data into data
-                    self.sat.data = self.sat[self._orbit_breaks[orbit - 1]:
-                                             self._orbit_breaks[orbit]]
+                    self.sat.data = self._orbit_data(
+                        self._orbit_breaks[orbit - 1],
+                        self._orbit_breaks[orbit])
                     self._current = orbit
                 elif orbit == self.num:
-                    self.sat.data = self.sat[self._orbit_breaks[orbit - 1]:]
+                    self.sat.data = self._orbit_data(
+                        self._orbit_breaks[orbit - 1])
                     # recent addition, wondering why it wasn't there before,
                     # could just be a bug that is now fixed.
                     self._current = orbit
@@ -853,6 +1279,137 @@ class Orbits(object):
                 self.sat.prev()  # raises stopIteration at end of dataset
             self.prev()
 
+    def stream(self, pad=None):
+        """Iterate forward over every orbit within the bounds.
+
+        Each day within inst.bounds is loaded once. A rolling buffer holds
+        the current day along with the part of earlier days still needed for
+        the open orbit and any padding. Complete orbits are loaded into .data
+        in order, once the data after them has been loaded.
+
+        Parameters
+        ----------
+        pad : pandas.DateOffset, dictionary, or NoneType
+            Length of time to pad the beginning and end of each orbit, such
+            as for filters that need data before and after the orbit. A
+            dictionary is passed to pandas.DateOffset. (default=None)
+
+        Yields
+        ------
+        pysat.Instrument
+            Instrument with the next orbit, and any padding, in .data
+
+        Note
+        ----
+        Only supported when iterating by date. Orbits match those found by
+        build_catalog. Padding is limited to data within the bounds.
+
+        Examples
+        --------
+        ::
+
+            for inst in inst.orbits.stream(pad={'minutes': 5}):
+                print('next orbit with padding ', inst.index[0])
+
+        """
+
+        if self.sat._iter_type != 'date':
+            raise ValueError('Orbit streams require iteration by date.')
+        if self.orbit_index is None:
+            raise ValueError('Orbit properties must be defined at ' +
+                             'pysat.Instrument object instantiation.' +
+                             'See Instrument docs.')
+        if isinstance(pad, dict):
+            pad = pds.DateOffset(**pad)
+        elif pad is None:
+            pad = pds.DateOffset(seconds=0)
+        elif not isinstance(pad, pds.DateOffset):
+            raise ValueError(''.join(('pad must be a dictionary or a ',
+                                      'pandas.DateOffset instance.')))
+
+        # data kept from the days loaded so far
+        buffer = None
+        # time of the first sample in the orbit still open at the end of
+        # the buffer
+        open_start = None
+        # start and stop times of complete orbits awaiting padding
+        pending = []
+        for date in pds.DatetimeIndex(self.sat._iter_list):
+            self.sat.load(date=date)
+            day_end = date + pds.DateOffset(days=1)
+            if self.sat.empty:
+                continue
+
+            # exclude any padding outside of the day
+            index = self.sat.index
+            day = self.sat[index.searchsorted(date):
+                           index.searchsorted(day_end)]
+            if buffer is None:
+                buffer = day
+            else:
+                buffer = self.sat.concat_data([buffer, day])
+
+            times = self.sat._index(buffer)
+            if len(times) == 0:
+                continue
+            first = 0 if open_start is None else times.searchsorted(open_start)
+            orbit_index = buffer[self.orbit_index]
+            if not self.sat.pandas_format:
+                orbit_index = orbit_index.to_pandas()
+            orbit_index = orbit_index.iloc[first:]
+            breaks = self._find_breaks(orbit_index)
+            for start, stop in zip(breaks[:-1], breaks[1:]):
+                pending.append((orbit_index.index[start],
+                                orbit_index.index[stop - 1]))
+            open_start = orbit_index.index[breaks[-1]]
+
+            # load orbits with all of their padding available
+            while len(pending) > 0 and pending[0][1] + pad < day_end:
+                start, stop = pending.pop(0)
+                self.sat.data = self._stream_data(buffer, start - pad,
+                                                  stop + pad)
+                yield self.sat
+
+            # drop data no longer needed
+            keep = pending[0][0] if len(pending) > 0 else open_start
+            buffer = self._stream_data(buffer, keep - pad)
+
+        if open_start is None:
+            # no samples were found within any of the days
+            return
+        for start, stop in pending + [(open_start, None)]:
+            self.sat.data = self._stream_data(buffer, start - pad,
+                                              None if stop is None else
+                                              stop + pad)
+            yield self.sat
+
+    def _stream_data(self, data, start, stop=None):
+        """Select data between two times, inclusive, as a positional view.
+
+        Parameters
+        ----------
+        data : pds.DataFrame or xr.Dataset
+            data to select from
+        start : datetime
+            first time to select
+        stop : datetime or NoneType
+            last time to select, or None for the end of the data
+
+        Returns
+        -------
+        pds.DataFrame or xr.Dataset
+            View into data
+
+        """
+        times = self.sat._index(data)
+        first = times.searchsorted(start, side='left')
+        last = None if stop is None else times.searchsorted(stop,
+                                                             side='right')
+        if self.sat.pandas_format:
+            return data.iloc[first:last]
+        else:
+            return data.isel(indexers={times.name: slice(first, last)})
+
     def __iter__(self):
         """Support iteration by orbit.
 
@@ -870,6 +1427,17 @@ class Orbits(object):
         ----
         Limits of iteration set by setting inst.bounds.
         """
+        # use the orbit catalog if it was built for the current bounds
+        if self.catalog is not None and \
+                self.sat._iter_type == 'date' and \
+                np.array_equal(self._catalog_dates,
+                               pds.DatetimeIndex(self.sat._iter_list)):
+            for orbit in range(len(self.catalog)):
+                self.load_catalog_orbit(orbit)
+                yield self.sat
+            self._catalog_days = {}
+            return
+
         # load up the first increment of data
         # coupling with Instrument frame is high, but it is already
         # high in a number of areas
@@ -882,3 +1450,110 @@ class Orbits(object):
                 yield self.sat
             except StopIteration:
                 return
+
+
+def _function_fingerprint(func):
+    """Describe a custom function by its module and code
+
+    Parameters
+    ----------
+    func : function
+        custom function attached to an Instrument
+
+    Returns
+    -------
+    str or NoneType
+        module, name, and hash of the code of func, or None if func has no
+        Python code to describe
+
+    """
+
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return None
+    return ':'.join((str(getattr(func, '__module__', None)),
+                     getattr(func, '__name__', ''),
+                     hashlib.sha1(_code_bytes(code)).hexdigest()))
+
+
+def _code_bytes(code):
+    """Bytecode and constants of a code object, including nested functions
+
+    Parameters
+    ----------
+    code : code
+        code object of a function
+
+    Returns
+    -------
+    bytes
+        description of the code that does not depend on where it is loaded
+
+    """
+
+    parts = [code.co_code, repr(code.co_names).encode('utf-8')]
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            parts.append(_code_bytes(const))
+        else:
+            parts.append(repr(const).encode('utf-8'))
+    return b'\0'.join(parts)
+
+
+def _reduce_orbits(values, starts, orbit_ids, func):
+    """Reduce values to one value per orbit, ignoring NaNs.
+
+    Parameters
+    ----------
+    values : array-like of float
+        values for the day of data
+    starts : array-like of int
+        location of the first value of each orbit
+    orbit_ids : array-like of int
+        orbit number, starting at zero, for each value
+    func : str or function
+        statistic to calculate, see Orbits.aggregate
+
+    Returns
+    -------
+    array-like
+        value of the statistic for each orbit
+
+    """
+
+    if callable(func):
+        return np.array([func(orbit[~np.isnan(orbit)])
+                         for orbit in np.split(values, starts[1:])])
+
+    good = ~np.isnan(values)
+    count = np.add.reduceat(good.astype(np.int64), starts)
+    if func == 'count':
+        return count
+    elif func == 'min':
+        return np.fmin.reduceat(values, starts)
+    elif func == 'max':
+        return np.fmax.reduceat(values, starts)
+    elif func == 'median':
+        # NaNs are sorted after the values within each orbit
+        ordered = values[np.lexsort((values, orbit_ids))]
+        lower = np.maximum(starts + (count - 1) // 2, 0)
+        upper = np.minimum(starts + count // 2, len(values) - 1)
+        median = 0.5 * (ordered[lower] + ordered[upper])
+        median[count == 0] = np.nan
+        return median
+
+    total = np.add.reduceat(np.where(good, values, 0.), starts)
+    if func == 'sum':
+        return total
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+    if func == 'mean':
+        return mean
+    elif func in ['std', 'var']:
+        resid = np.where(good, values - mean[orbit_ids], 0.)
+        var = np.add.reduceat(resid**2, starts)
+        var[count > 1] /= count[count > 1] - 1
+        var[count <= 1] = np.nan
+        return np.sqrt(var) if func == 'std' else var
+
+    raise ValueError('Unknown statistic requested: {:}'.format(func))
@@ -34,6 +34,7 @@ import re
 import warnings
 
 import pysat
+from pysat.utils.compression import open_file
 
 platform = 'champ'
 name = 'star'
@@ -171,20 +172,20 @@ def load(fnames, tag=None, sat_id=None):
 
     # The header is formatted differently from the rest of the file, read it in
     # first to obtain the necessary meta data
-    f = open(fnames[0], "r")
-    hdata = re.split(";|\n", f.readline())
-    f.close()
-    try:
-        hdata.pop(hdata.index(''))
-    except:
-        pass
-
-    # If there are files, read in the data
-    data = pds.read_csv(fnames[0], delim_whitespace=True, skiprows=2,
-                        header=None, names=[champ_labels[h] for h in hdata],
-                        keep_date_col=True, index_col='datetime',
-                        parse_dates={'datetime': [0, 1, 2]},
-                        date_parser=parse_champdate)
+    with open_file(fnames[0]) as f:
+        hdata = re.split(";|\n", f.readline())
+        try:
+            hdata.pop(hdata.index(''))
+        except:
+            pass
+
+        # If there are files, read in the data
+        data = pds.read_csv(f, delim_whitespace=True, skiprows=1,
+                            header=None,
+                            names=[champ_labels[h] for h in hdata],
+                            keep_date_col=True, index_col='datetime',
+                            parse_dates={'datetime': [0, 1, 2]},
+                            date_parser=parse_champdate)
 
     # Initialize the meta data
     meta = pysat.Meta()
@@ -54,7 +54,6 @@ import logging
 import numpy as np
 import os
 import requests
-from requests.auth import HTTPBasicAuth
 import shutil
 import sys
 import tarfile
@@ -232,14 +231,14 @@ def load(fnames, tag=None, sat_id=None, altitude_bin=None):
             try:
                 data = netCDF4.Dataset(fnames[ind])
                 ncattrsList = data.ncattrs()
-                for d in ncattrsList:
-                    meta[d] = {'units': '', 'long_name': d}
+                meta.update_many({d: {'units': '', 'long_name': d}
+                                  for d in ncattrsList})
                 keys = data.variables.keys()
-                for key in keys:
-                    if 'units' in data.variables[key].ncattrs():
-                        profile_meta[key] = {'units': data.variables[key].units,
-                                             'long_name':
-                                             data.variables[key].long_name}
+                profile_meta.update_many(
+                    {key: {'units': data.variables[key].units,
+                           'long_name': data.variables[key].long_name}
+                     for key in keys
+                     if 'units' in data.variables[key].ncattrs()})
                 repeat = False
             except RuntimeError:
                 # file was empty, try the next one by incrementing ind
@@ -454,40 +453,34 @@ def download(date_array, tag, sat_id, data_path=None,
     if (user is None) or (password is None):
         raise ValueError('CDAAC user account information must be provided.')
 
+    # reuse one authenticated connection for all of the days
+    session = pysat.utils.download.create_session(user=user,
+                                                  password=password,
+                                                  pool_size=1)
     for date in date_array:
         logger.info('Downloading COSMIC data for ' + date.strftime('%D'))
         sys.stdout.flush()
         yr, doy = pysat.utils.time.getyrdoy(date)
         yrdoystr = '{year:04d}.{doy:03d}'.format(year=yr, doy=doy)
-        # Try re-processed data (preferred)
-        try:
+        fname = os.path.join(data_path,
+                             'cosmic_' + sub_dir + '_' + yrdoystr + '.tar')
+        # Try re-processed data (preferred), then post-processed data
+        found = False
+        for collection in ['cosmic2013', 'cosmic']:
             dwnld = ''.join(("https://cdaac-www.cosmic.ucar.edu/cdaac/rest/",
-                             "tarservice/data/cosmic2013/"))
-            dwnld = dwnld + sub_dir + '/{year:04d}.{doy:03d}'.format(year=yr,
-                                                                     doy=doy)
-            top_dir = os.path.join(data_path, 'cosmic2013')
-            req = requests.get(dwnld, auth=HTTPBasicAuth(user, password))
-            req.raise_for_status()
-        except requests.exceptions.HTTPError:
-            # if response is negative, try post-processed data
+                             "tarservice/data/", collection, '/', sub_dir,
+                             '/', yrdoystr))
+            top_dir = os.path.join(data_path, collection)
             try:
-                dwnld = ''.join(("https://cdaac-www.cosmic.ucar.edu/cdaac/",
-                                 "rest/tarservice/data/cosmic/"))
-                dwnld = dwnld + sub_dir + '/{year:04d}.{doy:03d}'
-                dwnld = dwnld.format(year=yr, doy=doy)
-                top_dir = os.path.join(data_path, 'cosmic')
-                req = requests.get(dwnld, auth=HTTPBasicAuth(user, password))
-                req.raise_for_status()
+                found = pysat.utils.download.download_file(dwnld, fname,
+                                                           session=session)
             except requests.exceptions.HTTPError as err:
-                estr = ''.join((str(err), '\n', 'Data not found'))
-                logger.info(estr)
-        # Copy request info to tarball
-        # If data does not exist, will copy info not readable as tar
-        fname = os.path.join(data_path,
-                             'cosmic_' + sub_dir + '_' + yrdoystr + '.tar')
-        with open(fname, "wb") as local_file:
-            local_file.write(req.content)
-            local_file.close()
+                logger.info(str(err))
+            if found:
+                break
+        if not found:
+            logger.info('Data not found for ' + yrdoystr)
+            continue
         try:
             # uncompress files and remove tarball
             tar = tarfile.open(fname)
@@ -3,6 +3,7 @@
 
 import fnmatch
 import ftplib
+import functools
 import logging
 import numpy as np
 import os
@@ -154,16 +155,45 @@ def list_remote_files(tag, sat_id, user=None, password=None,
     if (user is not None) or (password is not None):
         raise ValueError('User account information must not be provided.')
 
-    # connect to CDAWeb default port
-    ftp = ftplib.FTP('icon-science.ssl.berkeley.edu')
-    # user anonymous, passwd anonymous@
-    ftp.login()
-
     try:
         ftp_dict = supported_tags[sat_id][tag]
     except KeyError:
         raise ValueError('sat_id/tag name unknown.')
 
+    # reuse a recent listing of the server, if one covers start to stop
+    key = ''.join(('ftp://icon-science.ssl.berkeley.edu', ftp_dict['dir'],
+                   '/', ftp_dict['remote_fname']))
+    crawl = functools.partial(_crawl_remote_files, ftp_dict, start=start,
+                              stop=stop)
+    return pysat.utils.download.cached_file_list(key, crawl, start=start,
+                                                 stop=stop)
+
+
+def _crawl_remote_files(ftp_dict, start=None, stop=None):
+    """Walk the SSL ftp directories and return the files found
+
+    Parameters
+    ----------
+    ftp_dict : dict
+        Dict with the remote 'dir' and 'remote_fname' for the dataset
+    start : dt.datetime or NoneType
+        Starting time for file list (default=None)
+    stop : dt.datetime or NoneType
+        Ending time for the file list (default=None)
+
+    Returns
+    -------
+    pandas.Series
+        A Series formatted for the Files class (pysat._files.Files)
+        containing filenames and indexed by date and time
+
+    """
+
+    # connect to CDAWeb default port
+    ftp = ftplib.FTP('icon-science.ssl.berkeley.edu')
+    # user anonymous, passwd anonymous@
+    ftp.login()
+
     # naming scheme for files on the CDAWeb server
     remote_fname = ftp_dict['remote_fname']
 
@@ -257,7 +287,7 @@ def list_remote_files(tag, sat_id, user=None, password=None,
 
 
 def ssl_download(date_array, tag, sat_id, data_path=None,
-                 user=None, password=None, supported_tags=None):
+                 user=None, password=None, supported_tags=None, n_workers=4):
     """Download ICON data from public area of SSL ftp server
 
     Parameters
@@ -279,6 +309,8 @@ def ssl_download(date_array, tag, sat_id, data_path=None,
         error if user not supplied. (default=None)
     password : string
         Password for data download. (default=None)
+    n_workers : int
+        Number of files to download at the same time (default=4)
     **kwargs : dict
         Additional keywords supplied by user when invoking the download
         routine attached to a pysat.Instrument object are passed to this
@@ -291,43 +323,32 @@ def ssl_download(date_array, tag, sat_id, data_path=None,
                                      supported_tags=supported_tags,
                                      start=date_array[0], stop=date_array[-1])
 
-    # connect to CDAWeb default port
-    ftp = ftplib.FTP('icon-science.ssl.berkeley.edu')
-
-    # user anonymous, passwd anonymous@
-    ftp.login()
-    for date in date_array:
-        if date in remote_files:
-            fname = remote_files[date]
-            # format files for specific dates and download location
-            # yr, doy = pysat.utils.time.getyrdoy(date)
-            saved_local_fname = os.path.join(data_path, fname.split('/')[-1])
-
-            # perform download
-            try:
-                logger.info(' '.join(('Attempting to download file for',
-                                      date.strftime('%x'))))
-                logger.info(fname)
-                ftp.retrbinary('RETR ' + fname,
-                               open(saved_local_fname, 'wb').write)
-                logger.info('Finished.')
-                # If zipped files are stored remotely, unzip them locally and
-                # delete the downloaded zip
-                if fname.find('ZIP') > 0:
-                    with ZipFile(saved_local_fname, 'r') as zipObj:
-                        for member in zipObj.namelist():
-                            if member.find('.NC') > 0:
-                                outpath = os.path.join(data_path,
-                                                       os.path.basename(member))
-                                with zipObj.open(member) as source:
-                                    with open(outpath, 'wb') as target:
-                                        shutil.copyfileobj(source, target)
-                    os.remove(saved_local_fname)
-            except ftplib.error_perm as exception:
-                if str(exception.args[0]).split(" ", 1)[0] != '550':
-                    raise
-                else:
-                    os.remove(saved_local_fname)
-                    logger.info('File not available for ' + date.strftime('%x'))
-    ftp.close()
+    # format files for specific dates and download location
+    fnames = [remote_files[date] for date in date_array
+              if date in remote_files]
+    urls = [''.join(('ftp://icon-science.ssl.berkeley.edu', fname))
+            for fname in fnames]
+    saved_local_fnames = [os.path.join(data_path, fname.split('/')[-1])
+                          for fname in fnames]
+
+    # perform download, using anonymous login
+    logger.info('Attempting to download {:d} files.'.format(len(urls)))
+    downloaded = pysat.utils.download.download_files(urls,
+                                                     saved_local_fnames,
+                                                     n_workers=n_workers)
+
+    for fname, saved_local_fname, found in zip(fnames, saved_local_fnames,
+                                               downloaded):
+        # If zipped files are stored remotely, unzip them locally and
+        # delete the downloaded zip
+        if found and fname.find('ZIP') > 0:
+            with ZipFile(saved_local_fname, 'r') as zipObj:
+                for member in zipObj.namelist():
+                    if member.find('.NC') > 0:
+                        outpath = os.path.join(data_path,
+                                               os.path.basename(member))
+                        with zipObj.open(member) as source:
+                            with open(outpath, 'wb') as target:
+                                shutil.copyfileobj(source, target)
+            os.remove(saved_local_fname)
     return
@@ -20,8 +20,16 @@ from madrigalWeb import madrigalWeb
 
 import pysat
 
+try:
+    from urllib.parse import urlencode
+except ImportError:
+    from urllib import urlencode
+
 logger = logging.getLogger(__name__)
 
+# Madrigal fileType codes for the file formats that are downloaded as-is
+madrigal_file_types = {'hdf5': -2, 'netCDF4': -3}
+
 def cedar_rules():
     """ General acknowledgement statement for Madrigal data.
 
@@ -87,9 +95,8 @@ def load(fnames, tag=None, sat_id=None, xarray_coords=[]):
     # metadata
     file_meta = filed['Metadata']['Data Parameters']
     # load up what is offered into pysat.Meta
-    meta = pysat.Meta()
-
     labels = []
+    meta_dict = {}
     for item in file_meta:
         # handle difference in string output between python 2 and 3
         name_string = item[0]
@@ -100,9 +107,10 @@ def load(fnames, tag=None, sat_id=None, xarray_coords=[]):
             unit_string = unit_string.decode('UTF-8')
             desc_string = desc_string.decode('UTF-8')
         labels.append(name_string)
-        meta[name_string.lower()] = {'long_name': name_string,
-                                     'units': unit_string,
-                                     'desc': desc_string}
+        meta_dict[name_string.lower()] = {'long_name': name_string,
+                                          'units': unit_string,
+                                          'desc': desc_string}
+    meta = pysat.Meta.from_dict(meta_dict)
 
     # add additional metadata notes
     # custom attributes attached to meta are attached to
@@ -178,7 +186,7 @@ def load(fnames, tag=None, sat_id=None, xarray_coords=[]):
 
 def download(date_array, inst_code=None, kindat=None, data_path=None,
              user=None, password=None, url="http://cedar.openmadrigal.org",
-             file_format='hdf5'):
+             file_format='hdf5', n_workers=4):
     """Downloads data from Madrigal.
 
     Parameters
@@ -206,6 +214,8 @@ def download(date_array, inst_code=None, kindat=None, data_path=None,
     file_format : string ('hdf5')
         File format for Madrigal data.  Load routines currently only accept
         'hdf5', but any of the Madrigal options may be used here.
+    n_workers : int
+        Number of files to download at the same time (default=4)
 
     Returns
     --------
@@ -254,13 +264,57 @@ def download(date_array, inst_code=None, kindat=None, data_path=None,
                                  password=password, web_data=web_data, url=url,
                                  start=start, stop=stop)
 
+    remote_urls = list()
+    local_files = list()
     for mad_file in files:
         local_file = os.path.join(data_path, os.path.basename(mad_file.name))
 
-        if not os.path.isfile(local_file):
+        if os.path.isfile(local_file):
+            continue
+        if file_format in madrigal_file_types:
+            remote_urls.append(get_download_url(web_data, mad_file.name,
+                                                user, password,
+                                                file_format=file_format))
+            local_files.append(local_file)
+        else:
             web_data.downloadFile(mad_file.name, local_file, user, password,
                                   "pysat", format=file_format)
 
+    # binary formats are downloaded concurrently over pooled connections
+    pysat.utils.download.download_files(remote_urls, local_files,
+                                        n_workers=n_workers)
+
+
+def get_download_url(web_data, filename, user, password, file_format='hdf5'):
+    """Construct the Madrigal URL used to download a file
+
+    Parameters
+    ----------
+    web_data : MadrigalData
+        Open connection to Madrigal database
+    filename : string
+        Remote filename, as returned by get_remote_filenames
+    user : string
+        User's full name
+    password : string
+        User's email address
+    file_format : string
+        File format, one of the keys of madrigal_file_types (default='hdf5')
+
+    Returns
+    -------
+    url : string
+        Full URL for the Madrigal getMadfile.cgi service
+
+    """
+
+    query = urlencode([('fileName', filename),
+                       ('fileType', madrigal_file_types[file_format]),
+                       ('user_fullname', user.strip()),
+                       ('user_email', password.strip()),
+                       ('user_affiliation', 'pysat')])
+    return ''.join((web_data.cgiurl, 'getMadfile.cgi?', query))
+
 
 def get_remote_filenames(inst_code=None, kindat=None, user=None,
                          password=None, web_data=None,
@@ -414,7 +468,7 @@ def list_remote_files(tag, sat_id, inst_code=None, kindat=None, user=None,
                       password=None, supported_tags=None,
                       url="http://cedar.openmadrigal.org",
                       two_digit_year_break=None, start=dt.datetime(1900,1,1),
-                      stop=dt.datetime.now()):
+                      stop=None):
     """List files available from Madrigal.
 
     Parameters
@@ -451,8 +505,10 @@ def list_remote_files(tag, sat_id, inst_code=None, kindat=None, user=None,
         and '2000' will be added for years < two_digit_year_break.
     start : (dt.datetime)
         Starting time for file list (defaults to 01-01-1900)
-    stop : (dt.datetime)
-        Ending time for the file list (defaults to time of run)
+    stop : (dt.datetime or NoneType)
+        Ending time for the file list. If None, the end of the current
+        day is used, so that listings stored earlier in the day are reused.
+        (default=None)
 
     Returns
     -------
@@ -500,18 +556,31 @@ def list_remote_files(tag, sat_id, inst_code=None, kindat=None, user=None,
     except KeyError:
         raise ValueError('Problem parsing supported_tags')
 
-    # Retrieve remote file list
-    files = get_remote_filenames(inst_code=inst_code, kindat=kindat, user=user,
-                                 password=password, url=url, start=start,
-                                 stop=stop)
-
-    # parse these filenames to grab out the ones we want
-    logger.info("Parsing filenames")
-    stored = pysat._files.parse_fixed_width_filenames(files, format_str)
-
-    # process the parsed filenames and return a properly formatted Series
-    logger.info("Processing filenames")
-    return pysat._files.process_parsed_filenames(stored, two_digit_year_break)
+    if stop is None:
+        stop = dt.datetime.combine(dt.date.today(),
+                                   dt.time()) + dt.timedelta(days=1)
+
+    def crawl():
+        # Retrieve remote file list
+        files = get_remote_filenames(inst_code=inst_code, kindat=kindat,
+                                     user=user, password=password, url=url,
+                                     start=start, stop=stop)
+
+        # parse these filenames to grab out the ones we want
+        logger.info("Parsing filenames")
+        stored = pysat._files.parse_fixed_width_filenames(
+            [mad_file.name for mad_file in files], format_str)
+
+        # process the parsed filenames and return a properly formatted Series
+        logger.info("Processing filenames")
+        return pysat._files.process_parsed_filenames(stored,
+                                                     two_digit_year_break)
+
+    # reuse a recent listing of the server, if one covers start to stop
+    key = ' '.join((url, str(inst_code), str(kindat), format_str,
+                    str(two_digit_year_break)))
+    return pysat.utils.download.cached_file_list(key, crawl, start=start,
+                                                 stop=stop)
 
 
 def filter_data_single_date(self):
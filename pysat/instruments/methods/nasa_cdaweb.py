@@ -6,6 +6,7 @@ intervention.
 """
 
 from __future__ import absolute_import, division, print_function
+import functools
 import logging
 import sys
 import warnings
@@ -172,7 +173,7 @@ def download(supported_tags, date_array, tag, sat_id,
              remote_site='https://cdaweb.gsfc.nasa.gov',
              data_path=None, user=None, password=None,
              fake_daily_files_from_monthly=False,
-             multi_file_day=False):
+             multi_file_day=False, n_workers=4):
     """Routine to download NASA CDAWeb CDF data.
 
     This routine is intended to be used by pysat instrument modules supporting
@@ -206,6 +207,11 @@ def download(supported_tags, date_array, tag, sat_id,
         Some CDAWeb instrument data files are stored by month. This flag,
         when true, accomodates this reality with user feedback on a monthly
         time frame.
+    multi_file_day : bool
+        Set to True if there may be several files for each day
+        (default=False)
+    n_workers : int
+        Number of files to download at the same time (default=4)
 
     Returns
     --------
@@ -250,14 +256,23 @@ def download(supported_tags, date_array, tag, sat_id,
     local_fname = inst_dict['local_fname']
 
     if not multi_file_day:
-        # Get list of files from server
-        remote_files = list_remote_files(tag=tag, sat_id=sat_id,
-                                         remote_site=remote_site,
-                                         supported_tags=supported_tags)
+        # Get list of files from server, only for the requested years if
+        # the files are stored in yearly directories
+        if os.path.split(remote_fname)[0].find('year') != -1:
+            years = sorted(set([date.year for date in date_array]))
+        else:
+            years = [None]
+        remote_files = pds.Series([], dtype=object)
+        for year in years:
+            remote_files = remote_files.append(
+                _cached_remote_files(remote_url, remote_fname, year=year))
         # Find only requested files that exist remotely
         date_array = pds.DatetimeIndex(list(set(remote_files.index)
                                             & set(date_array))).sort_values()
 
+    # build the list of remote and local filenames to download
+    remote_paths = []
+    saved_local_fnames = []
     for date in date_array:
         # format files for specific dates and download location
         formatted_remote_fname = remote_fname.format(year=date.year,
@@ -272,59 +287,43 @@ def download(supported_tags, date_array, tag, sat_id,
                                                    hour=date.hour,
                                                    min=date.minute,
                                                    sec=date.second)
-        saved_local_fname = os.path.join(data_path, formatted_local_fname)
 
-        # perform download
         if not multi_file_day:
             # standard download
-            try:
-                logger.info(' '.join(('Attempting to download file for',
-                                      date.strftime('%d %B %Y'))))
-                sys.stdout.flush()
-                remote_path = '/'.join((remote_url.strip('/'),
-                                        formatted_remote_fname))
-                req = requests.get(remote_path)
-                if req.status_code != 404:
-                    open(saved_local_fname, 'wb').write(req.content)
-                    logger.info('Finished.')
-                else:
-                    logger.info(' '.join(('File not available for',
-                                          date.strftime('%d %B %Y'))))
-            except requests.exceptions.RequestException as exception:
-                logger.info(' '.join((exception, '- File not available for',
-                                      date.strftime('%d %B %Y'))))
+            remote_paths.append('/'.join((remote_url.strip('/'),
+                                          formatted_remote_fname)))
+            saved_local_fnames.append(os.path.join(data_path,
+                                                   formatted_local_fname))
         else:
             try:
-                logger.info(' '.join(('Attempting to download files for',
+                logger.info(' '.join(('Looking for files for',
                                       date.strftime('%d %B %Y'))))
-                sys.stdout.flush()
-                remote_files = list_remote_files(tag=tag, sat_id=sat_id,
-                                                 remote_site=remote_site,
-                                                 supported_tags=supported_tags,
-                                                 year=date.year,
-                                                 month=date.month,
-                                                 day=date.day)
-
-                # Get the files
-                i = 0
-                n = len(remote_files.values)
-                for remote_file in remote_files.values:
-                    remote_dir = os.path.split(formatted_remote_fname)[0]
-                    remote_file_path = '/'.join((remote_url.strip('/'),
-                                                 remote_dir.strip('/'),
-                                                 remote_file))
-                    saved_local_fname = os.path.join(data_path, remote_file)
-                    req = requests.get(remote_file_path)
-                    if req.status_code != 404:
-                        open(saved_local_fname, 'wb').write(req.content)
-                        i += 1
-                    else:
-                        logger.info(' '.join(('File not available for',
-                                              date.strftime('%d %B %Y'))))
-                logger.info('Downloaded {i:} of {n:} files.'.format(i=i, n=n))
+                remote_files = _cached_remote_files(remote_url, remote_fname,
+                                                    year=date.year,
+                                                    month=date.month,
+                                                    day=date.day)
             except requests.exceptions.RequestException as exception:
-                logger.info(' '.join((exception, '- Files not available for',
+                logger.info(' '.join((str(exception),
+                                      '- Files not available for',
                                       date.strftime('%d %B %Y'))))
+                continue
+
+            remote_dir = os.path.split(formatted_remote_fname)[0]
+            for remote_file in remote_files.values:
+                remote_paths.append('/'.join((remote_url.strip('/'),
+                                              remote_dir.strip('/'),
+                                              remote_file)))
+                saved_local_fnames.append(os.path.join(data_path,
+                                                       remote_file))
+
+    # perform download
+    logger.info('Attempting to download {:d} files.'.format(len(remote_paths)))
+    sys.stdout.flush()
+    downloaded = pysat.utils.download.download_files(remote_paths,
+                                                     saved_local_fnames,
+                                                     n_workers=n_workers)
+    logger.info('Downloaded {i:} of {n:} files.'.format(i=sum(downloaded),
+                                                        n=len(downloaded)))
 
 
 def list_remote_files(tag, sat_id,
@@ -413,11 +412,6 @@ def list_remote_files(tag, sat_id,
 
     """
 
-    import os
-    import requests
-    import warnings
-    from bs4 import BeautifulSoup
-
     if tag is None:
         tag = ''
     if sat_id is None:
@@ -449,11 +443,88 @@ def list_remote_files(tag, sat_id,
                                 "start/stop syntax in the download methods."]),
                       DeprecationWarning, stacklevel=2)
 
+    return _cached_remote_files(remote_url, format_str,
+                                two_digit_year_break=two_digit_year_break,
+                                delimiter=delimiter, year=year, month=month,
+                                day=day)
+
+
+def _listed_range(year=None, month=None, day=None):
+    """Return the first and last time listed by _crawl_remote_files
+
+    Parameters
+    ----------
+    year : int or NoneType
+        Year listed, or None for all files (default=None)
+    month : int or NoneType
+        Month listed, used only if year is given (default=None)
+    day : int or NoneType
+        Day listed, used only if year and month are given (default=None)
+
+    Returns
+    -------
+    start : datetime or NoneType
+        First time covered by the listing
+    stop : datetime or NoneType
+        Last time covered by the listing
+
+    """
+
+    if year is None:
+        return None, None
+
+    # the crawl selects a day only within a given month
+    if month is None:
+        start = pds.datetime(year, 1, 1)
+        stop = start + pds.DateOffset(years=1)
+    elif day is None:
+        start = pds.datetime(year, month, 1)
+        stop = start + pds.DateOffset(months=1)
+    else:
+        start = pds.datetime(year, month, day)
+        stop = start + pds.DateOffset(days=1)
+    return start, stop - pds.Timedelta(1, 'us')
+
+
+def _cached_remote_files(remote_url, format_str, two_digit_year_break=None,
+                         delimiter=None, year=None, month=None, day=None):
+    """Return the remote files, reusing a recent listing of the server
+
+    Parameters are described in list_remote_files. The listing is only
+    requested from the server for the given year, month, or day if no
+    recent listing covers it (see pysat.utils.download.cached_file_list).
+
+    """
+
+    start, stop = _listed_range(year=year, month=month, day=day)
+    key = ' '.join((remote_url, format_str, str(two_digit_year_break),
+                    str(delimiter)))
+    crawl = functools.partial(_crawl_remote_files, remote_url, format_str,
+                              two_digit_year_break=two_digit_year_break,
+                              delimiter=delimiter, year=year, month=month,
+                              day=day)
+    return pysat.utils.download.cached_file_list(key, crawl, start=start,
+                                                 stop=stop)
+
+
+def _crawl_remote_files(remote_url, format_str, two_digit_year_break=None,
+                        delimiter=None, year=None, month=None, day=None):
+    """Walk the remote directories and return the files found
+
+    Parameters are described in list_remote_files.
+
+    """
+
+    import os
+    import requests
+    from bs4 import BeautifulSoup
+
     # get a listing of all files
     # determine if we need to walk directories
 
     # Find Subdirectories and modify remote_url if user input is specified
     dir_split = os.path.split(format_str)
+    n_layers = 0
     if len(dir_split[0]) != 0:
         # Get all subdirectories
         subdirs = dir_split[0].split('/')
@@ -45,6 +45,7 @@ import warnings
 import pandas as pds
 
 import pysat
+from pysat.utils.compression import open_file, split_compression_ext
 
 platform = 'supermag'
 name = 'magnetometer'
@@ -275,7 +276,8 @@ def load(fnames, tag='', sat_id=None):
     # Cycle through the files
     for fname in fnames:
         fname = fname[:-11]  # Remove date index from end of filename
-        file_type = path.splitext(fname)[1].lower()
+        file_type = split_compression_ext(fname)[0]
+        file_type = path.splitext(file_type)[1].lower()
 
         # Open and load the files for each file type
         if file_type == ".csv":
@@ -331,7 +333,7 @@ def load_csv_data(fname, tag):
         date_list = list()
 
         # Open and read the file
-        with open(fname, "r") as fopen:
+        with open_file(fname) as fopen:
             dtime = pds.datetime.strptime(fname.split("_")[-1].split(".")[0],
                                           "%Y")
 
@@ -364,8 +366,10 @@ def load_csv_data(fname, tag):
             return pysat.datetime.strptime(dd, "%Y-%m-%d %H:%M:%S")
 
         # Load the file into a data frame
-        data = pds.read_csv(fname, parse_dates={'datetime': [0]},
-                            date_parser=parse_smag_date, index_col='datetime')
+        with open_file(fname) as fopen:
+            data = pds.read_csv(fopen, parse_dates={'datetime': [0]},
+                                date_parser=parse_smag_date,
+                                index_col='datetime')
 
     return data
 
@@ -402,7 +406,7 @@ def load_ascii_data(fname, tag):
 
     # Read in the text data, processing the header, indices, and
     # magnetometer data (as desired)
-    with open(fname, "r") as fopen:
+    with open_file(fname) as fopen:
         # Set the processing flags
         hflag = True  # header lines
         pflag = False  # parameter line
@@ -104,26 +104,33 @@ def load(fnames, tag=None, sat_id=None):
 
     """
 
+    from pysat.utils.compression import open_file
+
     if tag == '':
         # f107 data stored monthly, need to return data daily
         # the daily date is attached to filename
         # parse off the last date, load month of data, downselect to desired
         # day
         date = pysat.datetime.strptime(fnames[0][-10:], '%Y-%m-%d')
-        data = pds.read_csv(fnames[0][0:-11], index_col=0, parse_dates=True)
+        with open_file(fnames[0][0:-11]) as fin:
+            data = pds.read_csv(fin, index_col=0, parse_dates=True)
         idx, = np.where((data.index >= date) &
                         (data.index < date + pds.DateOffset(days=1)))
         result = data.iloc[idx, :]
     elif tag == 'all':
-        result = pds.read_csv(fnames[0], index_col=0, parse_dates=True)
+        with open_file(fnames[0]) as fin:
+            result = pds.read_csv(fin, index_col=0, parse_dates=True)
     elif tag == 'daily' or tag == 'prelim':
-        result = pds.read_csv(fnames[0], index_col=0, parse_dates=True)
+        with open_file(fnames[0]) as fin:
+            result = pds.read_csv(fin, index_col=0, parse_dates=True)
     elif tag == 'forecast':
         # load forecast data
-        result = pds.read_csv(fnames[0], index_col=0, parse_dates=True)
+        with open_file(fnames[0]) as fin:
+            result = pds.read_csv(fin, index_col=0, parse_dates=True)
     elif tag == '45day':
         # load forecast data
-        result = pds.read_csv(fnames[0], index_col=0, parse_dates=True)
+        with open_file(fnames[0]) as fin:
+            result = pds.read_csv(fin, index_col=0, parse_dates=True)
 
     meta = pysat.Meta()
     meta['f107'] = {meta.units_label: 'SFU',
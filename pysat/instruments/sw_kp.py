@@ -111,6 +111,7 @@ def load(fnames, tag=None, sat_id=None):
 
 
     """
+    from pysat.utils.compression import open_file
     from pysat.utils.time import parse_date
 
     meta = pysat.Meta()
@@ -130,9 +131,11 @@ def load(fnames, tag=None, sat_id=None):
             fname = filename[0:-11]
             date = pysat.datetime.strptime(filename[-10:], '%Y-%m-%d')
 
-            temp = pds.read_fwf(fname, colspecs=colspec, skipfooter=4,
-                                header=None, parse_dates=[[0, 1, 2]],
-                                date_parser=parse_date, index_col='0_1_2')
+            with open_file(fname) as fin:
+                temp = pds.read_fwf(fin, colspecs=colspec, skipfooter=4,
+                                    header=None, parse_dates=[[0, 1, 2]],
+                                    date_parser=parse_date,
+                                    index_col='0_1_2')
             idx, = np.where((temp.index >= date) &
                             (temp.index < date + pds.DateOffset(days=1)))
             temp = temp.iloc[idx, :]
@@ -167,11 +170,13 @@ def load(fnames, tag=None, sat_id=None):
         fill_val = np.nan
     elif tag == 'forecast':
         # load forecast data
-        result = pds.read_csv(fnames[0], index_col=0, parse_dates=True)
+        with open_file(fnames[0]) as fin:
+            result = pds.read_csv(fin, index_col=0, parse_dates=True)
         fill_val = -1
     elif tag == 'recent':
         # load recent Kp data
-        result = pds.read_csv(fnames[0], index_col=0, parse_dates=True)
+        with open_file(fnames[0]) as fin:
+            result = pds.read_csv(fin, index_col=0, parse_dates=True)
         fill_val = -1
 
     # Initalize the meta data
@@ -6,8 +6,9 @@ Each set of methods is contained within a subpackage of this set.
 """
 
 from pysat.instruments.templates import (madrigal_pandas, netcdf_pandas,
+                                         npy_pandas, parquet_pandas,
                                          template_instrument,
                                          template_cdaweb_instrument)
 
-__all__ = ['madrigal_pandas', 'netcdf_pandas', 'template_instrument',
-           'template_cdaweb_instrument']
+__all__ = ['madrigal_pandas', 'netcdf_pandas', 'npy_pandas', 'parquet_pandas',
+           'template_instrument', 'template_cdaweb_instrument']
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Generic module for loading Parquet files into the pandas format within pysat.
+
+The files are expected to have been written by `Instrument.to_parquet`,
+one file per day, with the pysat metadata stored in the file schema. Files
+are located using the default template in pysat.utils.parquet unless a
+different template is provided at instantiation.
+
+Only the variables given by the `columns` keyword are read, and the row
+groups within each file may be limited to a time range with the `start`
+and `stop` keywords, so reading a few variables over a long period does
+not read the rest of the data set from disk.
+
+Examples
+--------
+::
+
+    # export a year of data to daily Parquet files
+    inst = pysat.Instrument('pysat', 'testing')
+    inst.bounds = (pysat.datetime(2009, 1, 1), pysat.datetime(2009, 12, 31))
+    inst.to_parquet(os.path.join(pysat.data_dir, 'parquet', 'pandas'))
+
+    # load only two of the variables back
+    from pysat.instruments.templates import parquet_pandas
+    inst = pysat.Instrument(inst_module=parquet_pandas,
+                            columns=['mlt', 'slt'])
+    inst.load(2009, 1)
+
+"""
+
+import pysat
+from pysat.utils import parquet
+
+import logging
+logger = logging.getLogger(__name__)
+
+# pysat required parameters
+platform = 'parquet'
+name = 'pandas'
+# dictionary of data 'tags' and corresponding description
+tags = {'': 'Parquet'}
+# dictionary of satellite IDs, list of corresponding tags
+sat_ids = {'': ['']}
+_test_dates = {'': {'': pysat.datetime(2009, 1, 1)}}
+
+
+def init(self):
+    """Initializes the Instrument object with instrument specific values.
+
+    Runs once upon instantiation. This routine provides a convenient
+    location to print Acknowledgements or restrictions from the mission.
+
+    """
+
+    pass
+
+
+def load(fnames, tag=None, sat_id=None, columns=None, start=None, stop=None,
+         epoch_name='Epoch'):
+    """Loads data using pysat.utils.parquet.load_parquet .
+
+    This routine is called as needed by pysat. It is not intended
+    for direct user interaction.
+
+    Parameters
+    ----------
+    fnames : array-like
+        iterable of filename strings, full path, to data files to be loaded.
+        This input is nominally provided by pysat itself.
+    tag : string
+        tag name used to identify particular data set to be loaded.
+        This input is nominally provided by pysat itself.
+    sat_id : string
+        Satellite ID used to identify particular data set to be loaded.
+        This input is nominally provided by pysat itself.
+    columns : list-like of strings or NoneType
+        Variables to load. If None, all variables are loaded. (default=None)
+    start : datetime or NoneType
+        Earliest time to load (default=None)
+    stop : datetime or NoneType
+        Latest time to load, inclusive (default=None)
+    epoch_name : string
+        Name of the column that stores the time index (default='Epoch')
+
+    Returns
+    -------
+    data, metadata
+        Data and Metadata are formatted for pysat. Data is a pandas
+        DataFrame while metadata is a pysat.Meta instance.
+
+    Note
+    ----
+    Any additional keyword arguments passed to pysat.Instrument
+    upon instantiation are passed along to this routine.
+
+    """
+
+    return parquet.load_parquet(fnames, columns=columns, start=start,
+                                stop=stop, epoch_name=epoch_name)
+
+
+def list_files(tag=None, sat_id=None, data_path=None, format_str=None):
+    """Produce a list of files corresponding to format_str located at
+    data_path.
+
+    This routine is invoked by pysat and is not intended for direct use by
+    the end user.
+
+    Parameters
+    ----------
+    tag : string
+        tag name used to identify particular data set to be loaded.
+        This input is nominally provided by pysat itself. (default='')
+    sat_id : string
+        Satellite ID used to identify particular data set to be loaded.
+        This input is nominally provided by pysat itself. (default='')
+    data_path : string
+        Full path to directory containing files to be loaded. This
+        is provided by pysat. The user may specify their own data path
+        at Instrument instantiation and it will appear here. (default=None)
+    format_str : string
+        String template used to parse the datasets filenames. If None,
+        pysat.utils.parquet.default_format_str is used. (default=None)
+
+    Returns
+    -------
+    pandas.Series
+        Series of filename strings, including the path, indexed by datetime.
+
+    """
+
+    if format_str is None:
+        format_str = parquet.default_format_str
+    return pysat.Files.from_os(data_path=data_path, format_str=format_str)
+
+
+def download(date_array, tag, sat_id, data_path=None, user=None,
+             password=None):
+    """Downloads data for supported instruments, however this is a template
+    call.
+
+    This routine is invoked by pysat and is not intended for direct use by
+    the end user.
+
+    Parameters
+    ----------
+    date_array : array-like
+        list of datetimes to download data for. The sequence of dates need not
+        be contiguous.
+    tag : string
+        Tag identifier used for particular dataset. This input is provided by
+        pysat. (default='')
+    sat_id : string
+        Satellite ID string identifier used for particular dataset. This input
+        is provided by pysat. (default='')
+    data_path : string (None)
+        Path to directory to download data to. (default=None)
+    user : string
+        User string input used for download. Provided by user and passed via
+        pysat. If an account is required for dowloads this routine here must
+        error if user not supplied. (default=None)
+    password : string
+        Password for data download. (default=None)
+
+    """
+
+    logger.info('This is a generic Instrument routine and does not support ' +
+                'downloading data.')
+    pass
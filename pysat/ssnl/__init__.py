@@ -7,6 +7,7 @@ are independent of instrument type.
 Main Features
 -------------
 - Seasonal averaging routine for 1D and 2D data.
+- Mergeable quantile sketches for seasonal medians in bounded memory.
 - Occurrence probability routines, daily or by orbit.
 - Scatterplot of data_label(s) as functions of labelx,y
     over a season.
@@ -16,4 +17,5 @@ Main Features
 from . import occur_prob
 from . import avg
 from . import plot
+from . import sketch
 from ._core import computational_form
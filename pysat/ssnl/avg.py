@@ -7,13 +7,14 @@ Instrument independent seasonal averaging routine. Supports averaging
 """
 
 import pysat
+from pysat.ssnl.sketch import BinnedQuantileSketch
 import numpy as np
 import pandas as pds
-import collections
 import warnings
 
 
-def median1D(const, bin1, label1, data_label, auto_bin=True, returnData=False):
+def median1D(const, bin1, label1, data_label, auto_bin=True, returnData=False,
+             relative_accuracy=None):
     """Return a 1D median of data_label over a season and label1
 
     .. deprecated:: 2.2.0
@@ -35,6 +36,11 @@ def median1D(const, bin1, label1, data_label, auto_bin=True, returnData=False):
               number of bins. If false, bin edges must be manually entered
     returnData : (boolean)
         Return data in output dictionary as well as statistics
+    relative_accuracy : (float or NoneType)
+        If set, each bin keeps a quantile sketch with this relative accuracy
+        rather than every sample, and the statistics are estimated from it.
+        See pysat.ssnl.sketch. May not be used with returnData.
+        (default=None)
 
     Returns
     -------
@@ -42,7 +48,9 @@ def median1D(const, bin1, label1, data_label, auto_bin=True, returnData=False):
         1D median accessed by data_label as a function of label1
         over the season delineated by bounds of passed instrument objects.
         Also includes 'count' and 'avg_abs_dev' as well as the values of
-        the bin edges in 'bin_x'
+        the bin edges in 'bin_x'. If relative_accuracy is set, 'sketch'
+        holds the BinnedQuantileSketch used, which provides other quantiles
+        and may be merged with other sketches.
 
     """
 
@@ -69,49 +77,15 @@ def median1D(const, bin1, label1, data_label, auto_bin=True, returnData=False):
     else:
         binx = np.array(bin1)
 
-    # how many bins are used
-    numx = len(binx)-1
-    # how many different data products
-    numz = len(data_label)
-
-    # create array to store all values before taking median
-    # the indices of the bins/data products? used for looping.
-    xarr = np.arange(numx)
-    zarr = np.arange(numz)
-    # 3d array:  stores the data that is sorted into each bin? - in a deque
-    ans = [[collections.deque() for i in xarr] for k in zarr]
-
-    for inst in const:
-        # do loop to iterate over instrument season
-        # probably iterates by date but that all depends on the
-        # configuration of that particular instrument.
-        # either way, it iterates over the instrument, loading successive
-        # data between start and end bounds
-        for inst in inst:
-            # collect data in bins for averaging
-            if len(inst.data) != 0:
-                # sort the data into bins (x) based on label 1
-                # (stores bin indexes in xind)
-                xind = np.digitize(inst.data[label1], binx) - 1
-                # for each possible x index
-                for xi in xarr:
-                    # get the indicies of those pieces of data in that bin
-                    xindex, = np.where(xind == xi)
-                    if len(xindex) > 0:
-                        # for each data product label zk
-                        for zk in zarr:
-                            # take the data (already filtered by x), select the
-                            # data, put it in a list, and extend the deque
-                            idata = inst.data.iloc[xindex]
-                            ans[zk][xi].extend(idata[data_label[zk]].tolist())
-
     # Calculate the 1D median
-    return _calc_1d_median(ans, data_label, binx, xarr, zarr, numx, numz,
-                           returnData)
+    accum = MedianAccumulator([binx], [label1], data_label, returnData,
+                              relative_accuracy)
+    accum.update(const)
+    return accum.finalize()
 
 
 def median2D(const, bin1, label1, bin2, label2, data_label,
-             returnData=False, auto_bin=True):
+             returnData=False, auto_bin=True, relative_accuracy=None):
     """Return a 2D average of data_label over a season and label1, label2.
 
     .. deprecated:: 2.2.0
@@ -128,6 +102,11 @@ def median2D(const, bin1, label1, bin2, label2, data_label,
             contains strings identifying data product(s) to be averaged
         auto_bin: if True, function will create bins from the min, max and
                   number of bins. If false, bin edges must be manually entered
+        relative_accuracy: float or NoneType
+            If set, each bin keeps a quantile sketch with this relative
+            accuracy rather than every sample, and the statistics are
+            estimated from it. See pysat.ssnl.sketch. May not be used with
+            returnData. (default=None)
 
     Returns
     -------
@@ -135,7 +114,9 @@ def median2D(const, bin1, label1, bin2, label2, data_label,
         2D median accessed by data_label as a function of label1 and label2
         over the season delineated by bounds of passed instrument objects.
         Also includes 'count' and 'avg_abs_dev' as well as the values of
-        the bin edges in 'bin_x' and 'bin_y'.
+        the bin edges in 'bin_x' and 'bin_y'. If relative_accuracy is set,
+        'sketch' holds the BinnedQuantileSketch used, which provides other
+        quantiles and may be merged with other sketches.
 
     """
 
@@ -164,171 +145,10 @@ def median2D(const, bin1, label1, bin2, label2, data_label,
         binx = np.array(bin1)
         biny = np.array(bin2)
 
-    # how many bins are used
-    numx = len(binx)-1
-    numy = len(biny)-1
-    # how many different data products
-    numz = len(data_label)
-
-    # create array to store all values before taking median
-    # the indices of the bins/data products? used for looping.
-    yarr = np.arange(numy)
-    xarr = np.arange(numx)
-    zarr = np.arange(numz)
-    # 3d array:  stores the data that is sorted into each bin? - in a deque
-    ans = [[[collections.deque() for i in xarr] for j in yarr] for k in zarr]
-
-    for inst in const:
-        # do loop to iterate over instrument season
-        # probably iterates by date but that all depends on the
-        # configuration of that particular instrument.
-        # either way, it iterates over the instrument, loading successive
-        # data between start and end bounds
-        for inst in inst:
-            # collect data in bins for averaging
-            if len(inst.data) != 0:
-                # sort the data into bins (x) based on label 1
-                # (stores bin indexes in xind)
-                xind = np.digitize(inst.data[label1], binx)-1
-                # for each possible x index
-                for xi in xarr:
-                    # get the indicies of those pieces of data in that bin
-                    xindex, = np.where(xind == xi)
-                    if len(xindex) > 0:
-                        # look up the data along y (label2) at that set of
-                        # indices (a given x)
-                        yData = inst.data.iloc[xindex]
-                        # digitize that, to sort data into bins along y
-                        # (label2) (get bin indexes)
-                        yind = np.digitize(yData[label2], biny)-1
-                        # for each possible y index
-                        for yj in yarr:
-                            # select data with this y index (and we already
-                            # filtered for this x index)
-                            yindex, = np.where(yind == yj)
-                            if len(yindex) > 0:
-                                # for each data product label zk
-                                for zk in zarr:
-                                    # take the data (already filtered by x)
-                                    # filter it by y and
-                                    # select the data product, put it in a
-                                    # list, and extend the deque
-                                    indlab = yData.columns.get_loc(data_label[zk])
-                                    ans[zk][yj][xi].extend(yData.iloc[yindex,
-                                                                      indlab].tolist())
-
-    return _calc_2d_median(ans, data_label, binx, biny, xarr, yarr, zarr,
-                           numx, numy, numz, returnData)
-
-
-def _calc_2d_median(ans, data_label, binx, biny, xarr, yarr, zarr, numx,
-                    numy, numz, returnData=False):
-
-    # set up output arrays
-    medianAns = [[[None for i in xarr] for j in yarr] for k in zarr]
-    countAns = [[[None for i in xarr] for j in yarr] for k in zarr]
-    devAns = [[[None for i in xarr] for j in yarr] for k in zarr]
-
-    # all of the loading and storing data is done
-    # determine what kind of data is stored
-    # if just numbers, then use numpy arrays to store data
-    # if the data is a more generalized object, use lists to store data
-    # need to find first bin with data
-    dataType = [None for i in np.arange(numz)]
-    # for each data product label, find the first nonempty bin
-    # and select its type
-    for zk in zarr:
-        breakNow = False
-        for yj in yarr:
-            for xi in xarr:
-                if len(ans[zk][yj][xi]) > 0:
-                    dataType[zk] = type(ans[zk][yj][xi][0])
-                    breakNow = True
-                    break
-            if breakNow:
-                break
-
-    # determine if normal number objects are being used or if there
-    # are more complicated objects
-    objArray = [False] * len(zarr)
-    for i, thing in enumerate(dataType):
-        if thing == pds.core.series.Series:
-            objArray[i] = 'S'
-        elif thing == pds.core.frame.DataFrame:
-            objArray[i] = 'F'
-        else:
-            # other, simple scalaRs
-            objArray[i] = 'R'
-
-    objArray = np.array(objArray)
-
-    # if some pandas data series are returned in average, return a list
-    objidx, = np.where(objArray == 'S')
-    if len(objidx) > 0:
-        for zk in zarr[objidx]:
-            for yj in yarr:
-                for xi in xarr:
-                    if len(ans[zk][yj][xi]) > 0:
-                        ans[zk][yj][xi] = list(ans[zk][yj][xi])
-                        medianAns[zk][yj][xi] = \
-                            pds.DataFrame(ans[zk][yj][xi]).median(axis=0)
-                        countAns[zk][yj][xi] = len(ans[zk][yj][xi])
-                        devAns[zk][yj][xi] = \
-                            pds.DataFrame([abs(temp - medianAns[zk][yj][xi])
-                                           for temp in
-                                           ans[zk][yj][xi]]).median(axis=0)
-
-    # if some pandas DataFrames are returned in average, return a list
-    objidx, = np.where(objArray == 'F')
-    if len(objidx) > 0:
-        for zk in zarr[objidx]:
-            for yj in yarr:
-                for xi in xarr:
-                    if len(ans[zk][yj][xi]) > 0:
-                        ans[zk][yj][xi] = list(ans[zk][yj][xi])
-                        countAns[zk][yj][xi] = len(ans[zk][yj][xi])
-                        test = pds.Panel.from_dict(dict([(i, temp)
-                                                   for i, temp in
-                                                   enumerate(ans[zk][yj][xi])]))
-                        medianAns[zk][yj][xi] = test.median(axis=0)
-                        devAns[zk][yj][xi] = \
-                            (test.subtract(medianAns[zk][yj][xi],
-                                           axis=0)).abs().median(axis=0,
-                                                                 skipna=True)
-
-    objidx, = np.where(objArray == 'R')
-    if len(objidx) > 0:
-        for zk in zarr[objidx]:
-            medianAns[zk] = np.zeros((numy, numx))*np.nan
-            countAns[zk] = np.zeros((numy, numx))*np.nan
-            devAns[zk] = np.zeros((numy, numx))*np.nan
-            for yj in yarr:
-                for xi in xarr:
-                    # convert deque storing data into numpy array
-                    ans[zk][yj][xi] = np.array(ans[zk][yj][xi])
-                    # filter out an NaNs in the arrays
-                    idx, = np.where(np.isfinite(ans[zk][yj][xi]))
-                    ans[zk][yj][xi] = (ans[zk][yj][xi])[idx]
-                    # perform median averaging
-                    if len(idx) > 0:
-                        medianAns[zk][yj, xi] = np.median(ans[zk][yj][xi])
-                        countAns[zk][yj, xi] = len(ans[zk][yj][xi])
-                        devAns[zk][yj, xi] = np.median(abs(ans[zk][yj][xi] -
-                                                       medianAns[zk][yj, xi]))
-
-    # prepare output
-    output = {}
-    for i, label in enumerate(data_label):
-        output[label] = {'median': medianAns[i],
-                         'count': countAns[i],
-                         'avg_abs_dev': devAns[i],
-                         'bin_x': binx,
-                         'bin_y': biny}
-
-        if returnData:
-            output[label]['data'] = ans[i]
-
-    return output
+    accum = MedianAccumulator([binx, biny], [label1, label2], data_label,
+                              returnData, relative_accuracy)
+    accum.update(const)
+    return accum.finalize()
 
 
 # simple averaging through multiple iterations
@@ -420,142 +240,905 @@ def mean_by_file(inst, data_label):
 def _core_mean(inst, data_label, by_orbit=False, by_day=False, by_file=False):
 
     if by_orbit:
-        iterator = inst.orbits
-    elif by_day or by_file:
-        iterator = inst
+        by = 'orbit'
+    elif by_day:
+        by = 'day'
+    elif by_file:
+        by = 'file'
     else:
         raise ValueError('A choice must be made, by day, file, or orbit')
 
-    # create empty series to hold result
-    mean_val = pds.Series()
-    # iterate over season, calculate the mean
-    for inst in iterator:
-        if not inst.data.empty:
-            # compute mean absolute using pandas functions and store
-            # data could be an image, or lower dimension, account for 2D
-            # and lower
-            data = inst[data_label]
-            data.dropna(inplace=True)
-
-            if by_orbit or by_file:
-                date = inst.data.index[0]
+    accum = MeanAccumulator(data_label, by=by)
+    accum.update(inst)
+    return accum.finalize()
+
+
+def _filled(name):
+    """Property holding the part of an array filled by days, orbits, or files
+
+    Parameters
+    ----------
+    name : str
+        attribute holding the array
+
+    Returns
+    -------
+    property
+        rows of the array for the days, orbits, or files added
+
+    """
+
+    return property(lambda self: getattr(self, name)[:self._size])
+
+
+class StatsAccumulator(object):
+    """Mergeable accumulator for statistics of data products by day, orbit,
+    or file.
+
+    Parameters
+    ----------
+    data_label : str or list-like of str
+        data products to reduce
+    by : str
+        'day', 'orbit', or 'file' (default='day')
+    stats : str or list-like of str
+        statistics to calculate for each day, orbit, or file, from 'count',
+        'sum', 'mean', 'std', 'var', 'min', and 'max' (default='mean')
+
+    Attributes
+    ----------
+    index : np.array of np.datetime64
+        day, or start of each orbit or file, with data
+    count : np.array
+        number of finite values of each data product, for each of index
+    sum : np.array
+        sum of each data product, for each of index
+    m2 : np.array
+        sum of the squared differences from the mean of each data product,
+        for each of index
+    min : np.array
+        minimum of each data product, for each of index
+    max : np.array
+        maximum of each data product, for each of index
+
+    Note
+    ----
+    Moments for each day, orbit, or file are stored in arrays allocated ahead
+    of time, which grow by doubling, and are converted to statistics by
+    `finalize`. The variance is calculated from the sum of the squared
+    differences from the mean, rather than the sum of squares, and data
+    added for the day, orbit, or file added last is combined with it using
+    the parallel form of Welford's update (Chan, Golub, and LeVeque, 1983,
+    The American Statistician 37, 242). Data products holding pandas objects,
+    such as profiles, only support the mean.
+
+    Accumulators for parts of a season that do not overlap may be combined
+    with `merge`, and stored with `to_dict` and `from_dict`. An orbit that
+    crosses from one part of the season into the next is reduced as two
+    orbits.
+
+    Examples
+    --------
+    ::
+
+        accum = StatsAccumulator(['dummy1', 'mlt'], by='orbit',
+                                 stats=['mean', 'std', 'max'])
+        accum.update(inst)
+        accum.merge(StatsAccumulator.from_dict(other_dict))
+        stats = accum.finalize()
+
+    """
+
+    _moments = ['count', 'sum', 'm2', 'min', 'max']
+
+    def __init__(self, data_label, by='day', stats='mean'):
+        if by not in ['day', 'orbit', 'file']:
+            raise ValueError('A choice must be made, by day, file, or orbit')
+        self._single = isinstance(stats, str)
+        self.stats = [stats] if self._single else list(stats)
+        for stat in self.stats:
+            if stat not in ['count', 'sum', 'mean', 'std', 'var', 'min',
+                            'max']:
+                raise ValueError('Unknown statistic requested: {:}'.format(
+                    stat))
+        self.data_label = [data_label] if isinstance(data_label, str) \
+            else list(data_label)
+        self.by = by
+
+        # data products holding pandas objects, with their means
+        self._pandas = np.zeros(len(self.data_label), dtype=bool)
+        self._means = None
+        self._size = 0
+        self._index = np.empty(0, dtype='datetime64[ns]')
+        for moment in self._moments:
+            setattr(self, '_' + moment, np.empty((0, len(self.data_label))))
+
+    index = _filled('_index')
+    count = _filled('_count')
+    sum = _filled('_sum')
+    m2 = _filled('_m2')
+    min = _filled('_min')
+    max = _filled('_max')
+
+    def _reserve(self, num):
+        """Allocate space for at least num more days, orbits, or files"""
+        if self._size + num <= len(self._index):
+            return
+        capacity = max(2 * len(self._index), self._size + num, 16)
+        names = ['_index'] + ['_' + moment for moment in self._moments]
+        if self._means is not None:
+            names.append('_means')
+        for name in names:
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def _reduce(self, inst):
+        """Moments of each data product in the loaded data"""
+        moments = {moment: np.zeros(len(self.data_label))
+                   for moment in self._moments}
+        means = [None] * len(self.data_label)
+        for i, label in enumerate(self.data_label):
+            values = np.asarray(inst[label])
+            if values.dtype == object:
+                # data could be an image, or lower dimension, account for 2D
+                # and lower
+                if self.stats != ['mean']:
+                    raise ValueError(''.join(('Only the mean may be ',
+                                              'calculated for ', label)))
+                data = inst[label].dropna()
+                self._pandas[i] = True
+                means[i] = pysat.ssnl.computational_form(data).mean(
+                    axis=0, skipna=True)
+                continue
+
+            values = values[~np.isnan(values)]
+            count = len(values)
+            total = values.sum(dtype=np.float64)
+            moments['count'][i] = count
+            moments['sum'][i] = total
+            if count > 0:
+                moments['m2'][i] = ((values - total / count)**2).sum()
+                moments['min'][i] = values.min()
+                moments['max'][i] = values.max()
             else:
-                date = inst.date
-            # perform average
-            mean_val[date] = \
-                pysat.ssnl.computational_form(data).mean(axis=0,
-                                                         skipna=True)
+                moments['min'][i] = np.nan
+                moments['max'][i] = np.nan
+        return moments, means
 
-    del iterator
-    return mean_val
+    def add(self, inst):
+        """Add the data currently loaded in an Instrument.
 
+        Parameters
+        ----------
+        inst : pysat.Instrument
+            Instrument with a day, orbit, or file loaded
 
-def _calc_1d_median(ans, data_label, binx, xarr, zarr, numx, numz,
-                    returnData=False):
-    """Calculate the 1D median
+        Note
+        ----
+        Data for the same day, orbit start, or file as the last added are
+        combined with it.
+
+        """
+
+        if inst.empty:
+            return
+        if self.by == 'day':
+            date = np.datetime64(pds.Timestamp(inst.date))
+        else:
+            date = np.datetime64(pds.Timestamp(inst.index[0]))
+        moments, means = self._reduce(inst)
+
+        if self._size > 0 and self._index[self._size - 1] == date:
+            if np.any(self._pandas):
+                raise ValueError(''.join(('Means of pandas objects may not ',
+                                          'be combined.')))
+            last = {moment: getattr(self, '_' + moment)[self._size - 1]
+                    for moment in self._moments}
+            moments = _combine_moments(last, moments)
+            self._size -= 1
+
+        self._reserve(1)
+        self._index[self._size] = date
+        for moment in self._moments:
+            getattr(self, '_' + moment)[self._size] = moments[moment]
+        if np.any(self._pandas):
+            if self._means is None:
+                self._means = np.empty((len(self._index),
+                                        len(self.data_label)), dtype=object)
+            for i, mean in enumerate(means):
+                self._means[self._size, i] = mean
+        self._size += 1
+
+    def update(self, inst):
+        """Add each day, orbit, or file over a season.
+
+        Parameters
+        ----------
+        inst : pysat.Instrument
+            Instrument to iterate over, within its bounds
+
+        """
+
+        if self.by == 'orbit':
+            iterator = inst.orbits
+        else:
+            iterator = inst
+
+        # iterate over season, reducing each day, orbit, or file
+        for i, inst in enumerate(iterator):
+            if i == 0 and self.by != 'orbit':
+                self._reserve(len(inst._iter_list))
+            self.add(inst)
+        del iterator
+
+    def merge(self, other):
+        """Add the days, orbits, or files from another accumulator.
+
+        Parameters
+        ----------
+        other : StatsAccumulator
+            accumulator for the same data products and statistics, over
+            another part of the season
+
+        """
+
+        if other.data_label != self.data_label or other.by != self.by or \
+                other.stats != self.stats:
+            raise ValueError(''.join(('Accumulators must have the same data ',
+                                      'products, iteration, and statistics ',
+                                      'to be merged.')))
+        if len(np.intersect1d(self.index, other.index)) > 0:
+            raise ValueError('Accumulators to be merged must not overlap.')
+        size = self._size
+        self._reserve(other._size)
+        self._index[size:size + other._size] = other.index
+        for moment in self._moments:
+            getattr(self, '_' + moment)[size:size + other._size] = \
+                getattr(other, moment)
+        self._pandas |= other._pandas
+        if np.any(self._pandas):
+            means = np.empty((len(self._index), len(self.data_label)),
+                             dtype=object)
+            if self._means is not None:
+                means[:size] = self._means[:size]
+            if other._means is not None:
+                means[size:size + other._size] = other._means[:other._size]
+            self._means = means
+        self._size += other._size
+
+    def finalize(self):
+        """Calculate the statistics.
+
+        Returns
+        -------
+        pds.DataFrame
+            Statistics indexed by day, or start of each orbit or file, with a
+            column for each data product. If stats is list-like, the columns
+            are labeled by (data product, statistic).
+
+        """
+
+        if self._size == 0:
+            return pds.DataFrame(None)
+        order = np.argsort(self.index, kind='mergesort')
+        count = self.count[order]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = self.sum[order] / count
+            var = np.where(count > 1, self.m2[order] / (count - 1), np.nan)
+        values = {'count': count.astype(np.int64), 'sum': self.sum[order],
+                  'mean': mean, 'var': var, 'std': np.sqrt(var),
+                  'min': self.min[order], 'max': self.max[order]}
+
+        output = {}
+        columns = []
+        for i, label in enumerate(self.data_label):
+            for stat in self.stats:
+                column = label if self._single else (label, stat)
+                if self._pandas[i]:
+                    output[column] = self._means[order, i]
+                else:
+                    output[column] = values[stat][:, i]
+                columns.append(column)
+
+        output = pds.DataFrame(output, index=pds.DatetimeIndex(
+            self.index[order]), columns=columns)
+        if not self._single:
+            output.columns = pds.MultiIndex.from_tuples(columns)
+        return output
+
+    def to_dict(self):
+        """Describe the accumulator with lists and numbers.
+
+        Returns
+        -------
+        dict
+            accumulator description. Data products holding numbers may be
+            stored as JSON, means of pandas objects are kept as they are.
+
+        """
+
+        accum_dict = {'data_label': self.data_label,
+                      'by': self.by,
+                      'stats': self.stats[0] if self._single else self.stats,
+                      'index': [pds.Timestamp(date).isoformat()
+                                for date in self.index],
+                      'pandas': self._pandas.tolist()}
+        for moment in self._moments:
+            accum_dict[moment] = getattr(self, moment).tolist()
+        if self._means is not None:
+            accum_dict['means'] = self._means[:self._size].tolist()
+        return accum_dict
+
+    @classmethod
+    def from_dict(cls, accum_dict):
+        """Create an accumulator from a description made by to_dict.
+
+        Parameters
+        ----------
+        accum_dict : dict
+            accumulator description
+
+        Returns
+        -------
+        StatsAccumulator
+            accumulator described
+
+        """
+
+        accum = cls.__new__(cls)
+        StatsAccumulator.__init__(accum, accum_dict['data_label'],
+                                  by=accum_dict['by'],
+                                  stats=accum_dict['stats'])
+        accum._pandas = np.asarray(accum_dict['pandas'], dtype=bool)
+        accum._index = np.asarray([np.datetime64(pds.Timestamp(date))
+                                   for date in accum_dict['index']],
+                                  dtype='datetime64[ns]')
+        accum._size = len(accum._index)
+        shape = (accum._size, len(accum.data_label))
+        for moment in accum._moments:
+            setattr(accum, '_' + moment,
+                    np.asarray(accum_dict[moment],
+                               dtype=np.float64).reshape(shape))
+        if 'means' in accum_dict:
+            accum._means = np.empty(shape, dtype=object)
+            for i, means in enumerate(accum_dict['means']):
+                for j, mean in enumerate(means):
+                    accum._means[i, j] = mean
+        return accum
+
+
+class MeanAccumulator(StatsAccumulator):
+    """Mergeable accumulator for the mean of a data product by day, orbit, or
+    file.
 
     Parameters
     ----------
+    data_label : str
+        data product to be averaged
+    by : str
+        'day', 'orbit', or 'file' (default='day')
 
-    Returns
-    ------
+    Note
+    ----
+    See StatsAccumulator, which calculates other statistics and several data
+    products at once.
+
+    Examples
+    --------
+    ::
+
+        accum = MeanAccumulator('dummy1', by='orbit')
+        accum.update(inst)
+        accum.merge(MeanAccumulator.from_dict(other_dict))
+        mean = accum.finalize()
+
+    """
+
+    def __init__(self, data_label, by='day'):
+        super(MeanAccumulator, self).__init__(data_label, by=by,
+                                              stats='mean')
+
+    def finalize(self):
+        """Collect the means.
+
+        Returns
+        -------
+        mean : pandas Series
+            simple mean of data_label indexed by day, or start of each orbit
+            or file
+
+        """
 
-    Notes
-    -----
-    This is an overcomplicated way of doing this.  Try and simplify later
+        if self._size == 0:
+            return pds.Series()
+        mean_val = super(MeanAccumulator, self).finalize()[self.data_label[0]]
+        mean_val.name = None
+        return mean_val
+
+
+class MedianAccumulator(object):
+    """Mergeable accumulator for the median of data products within bins.
+
+    Parameters
+    ----------
+    bins : list of array-like
+        bin edges for each of labels
+    labels : list of str
+        data products binned over, in the order x, y, z
+    data_label : list-like of str
+        data products to calculate the median of
+    returnData : bool
+        Return the data within each bin as well as the statistics
+        (default=False)
+    relative_accuracy : float or NoneType
+        If set, each bin keeps a quantile sketch with this relative accuracy
+        rather than every sample. See pysat.ssnl.sketch. May not be used with
+        returnData. (default=None)
+
+    Attributes
+    ----------
+    ids : list of array-like
+        flattened bin of each sample added, without relative_accuracy
+    values : list of lists of array-like
+        values of each data product for the samples in ids, without
+        relative_accuracy
+    sketches : list of BinnedQuantileSketch
+        sketch for each data product, with relative_accuracy
+
+    Note
+    ----
+    Output arrays are organized z, y, x, as for median2D. Accumulators for
+    different parts of a season may be combined with `merge`, and stored
+    with `to_dict` and `from_dict`. Without relative_accuracy every sample
+    is stored.
+
+    Examples
+    --------
+    ::
+
+        accum = MedianAccumulator([np.linspace(0, 24, 25)], ['mlt'],
+                                  ['dummy1'], relative_accuracy=0.01)
+        accum.update(inst)
+        accum.merge(MedianAccumulator.from_dict(other_dict))
+        median = accum.finalize()
 
     """
 
-    # set up output arrays
-    medianAns = [[None for i in xarr] for k in zarr]
-    countAns = [[None for i in xarr] for k in zarr]
-    devAns = [[None for i in xarr] for k in zarr]
-
-    # all of the loading and storing data is done
-    # determine what kind of data is stored
-    # if just numbers, then use numpy arrays to store data
-    # if the data is a more generalized object, use lists to store data
-    # need to find first bin with data
-    dataType = [None for i in np.arange(numz)]
-    # for each data product label, find the first nonempty bin
-    # and select its type
-    for zk in zarr:
-        for xi in xarr:
-            if len(ans[zk][xi]) > 0:
-                dataType[zk] = type(ans[zk][xi][0])
-                break
-
-    # determine if normal number objects are being used or if there
-    # are more complicated objects
-    objArray = [False] * len(zarr)
-    for i, thing in enumerate(dataType):
-        if thing == pds.core.series.Series:
-            objArray[i] = 'S'
-        elif thing == pds.core.frame.DataFrame:
-            objArray[i] = 'F'
+    def __init__(self, bins, labels, data_label, returnData=False,
+                 relative_accuracy=None):
+        if len(bins) != len(labels):
+            raise ValueError('Must have bins for each of labels')
+        if returnData and relative_accuracy is not None:
+            raise ValueError(''.join(('returnData may not be used along ',
+                                      'with relative_accuracy.')))
+        self.bins = [np.asarray(edges) for edges in bins]
+        self.labels = list(labels)
+        self.data_label = list(data_label)
+        self.returnData = returnData
+        self.relative_accuracy = relative_accuracy
+
+        # bins are stored with the last label varying slowest
+        self._shape = tuple(len(edges) - 1 for edges in self.bins[::-1])
+        self.ids = []
+        self.values = [[] for label in self.data_label]
+        if relative_accuracy is None:
+            self.sketches = None
         else:
-            # other, simple scalaRs
-            objArray[i] = 'R'
-
-    objArray = np.array(objArray)
-
-    # if some pandas data series are returned in average, return a list
-    objidx, = np.where(objArray == 'S')
-    if len(objidx) > 0:
-        for zk in zarr[objidx]:
-            for xi in xarr:
-                if len(ans[zk][xi]) > 0:
-                    ans[zk][xi] = list(ans[zk][xi])
-                    medianAns[zk][xi] = pds.DataFrame(ans[zk][xi]).median(axis=0)
-                    countAns[zk][xi] = len(ans[zk][xi])
-                    devAns[zk][xi] = pds.DataFrame([abs(temp
-                                                        - medianAns[zk][xi]) \
-                                    for temp in ans[zk][xi] ]).median(axis=0)
-
-    # if some pandas DataFrames are returned in average, return a list
-    objidx, = np.where(objArray == 'F')
-    if len(objidx) > 0:
-        for zk in zarr[objidx]:
-            for xi in xarr:
-                if len(ans[zk][xi]) > 0:
-                    ans[zk][xi] = list(ans[zk][xi])
-                    countAns[zk][xi] = len(ans[zk][xi])
-                    test = pds.Panel.from_dict(dict([(i, temp) for i, temp \
-                                                    in enumerate(ans[zk][xi])]))
-                    medianAns[zk][xi] = test.median(axis=0)
-                    devAns[zk][xi] = \
-                        (test.subtract(medianAns[zk][xi],
-                                       axis=0)).abs().median(axis=0,
-                                                             skipna=True)
-
-    objidx, = np.where(objArray == 'R')
-    if len(objidx) > 0:
-        for zk in zarr[objidx]:
-            medianAns[zk] = np.full(numx, fill_value=np.nan)
-            countAns[zk] = np.full(numx, fill_value=np.nan)
-            devAns[zk] = np.full(numx, fill_value=np.nan)
-            for xi in xarr:
-                # convert deque storing data into numpy array
-                ans[zk][xi] = np.array(ans[zk][xi])
-                # filter out an NaNs in the arrays
-                idx, = np.where(np.isfinite(ans[zk][xi]))
-                ans[zk][xi] = (ans[zk][xi])[idx]
-                # perform median averaging
-                if len(idx) > 0:
-                    medianAns[zk][xi] = np.median(ans[zk][xi])
-                    countAns[zk][xi] = len(ans[zk][xi])
-                    devAns[zk][xi] = np.median(abs(ans[zk][xi] -
-                                                   medianAns[zk][xi]))
-
-    # prepare output
-    output = {}
-    for i, label in enumerate(data_label):
-        output[label] = {'median': medianAns[i],
-                         'count': countAns[i],
-                         'avg_abs_dev': devAns[i],
-                         'bin_x': binx}
+            self.sketches = [BinnedQuantileSketch(self._shape,
+                                                  relative_accuracy)
+                             for label in self.data_label]
+
+    def add(self, inst):
+        """Add the data currently loaded in an Instrument.
+
+        Parameters
+        ----------
+        inst : pysat.Instrument
+            Instrument with data loaded
+
+        """
+
+        if len(inst.data) == 0:
+            return
+        # sort the data into bins
+        bin_ids, locs = _bin_locations(inst.data, self.labels[::-1],
+                                       self.bins[::-1])
+        for zk, label in enumerate(self.data_label):
+            if self.sketches is None:
+                self.values[zk].append(inst.data[label].values[locs])
+            else:
+                self.sketches[zk].update(bin_ids,
+                                         inst.data[label].values[locs])
+        if self.sketches is None:
+            self.ids.append(bin_ids)
+
+    def update(self, const):
+        """Add the data over a season.
+
+        Parameters
+        ----------
+        const : Constellation, Instrument, or list of Instruments
+            Instruments to iterate over, within their bounds
+
+        """
+
+        if isinstance(const, pysat.Instrument):
+            const = [const]
+        for inst in const:
+            # iterates over the instrument, loading successive data between
+            # start and end bounds
+            for inst in inst:
+                self.add(inst)
+
+    def merge(self, other):
+        """Add the data from another accumulator.
+
+        Parameters
+        ----------
+        other : MedianAccumulator
+            accumulator with the same bins and data products
+
+        """
+
+        if other.labels != self.labels or \
+                other.data_label != self.data_label or \
+                other.relative_accuracy != self.relative_accuracy or \
+                len(other.bins) != len(self.bins) or \
+                not all(np.array_equal(edges, other_edges) for edges,
+                        other_edges in zip(self.bins, other.bins)):
+            raise ValueError(''.join(('Accumulators must have the same bins ',
+                                      'and data products to be merged.')))
+        if self.sketches is None:
+            self.ids.extend(other.ids)
+            for values, other_values in zip(self.values, other.values):
+                values.extend(other_values)
+        else:
+            for sketch, other_sketch in zip(self.sketches, other.sketches):
+                sketch.merge(other_sketch)
+
+    def finalize(self):
+        """Calculate the statistics within each bin.
+
+        Returns
+        -------
+        median : dict
+            'median', 'count', and 'avg_abs_dev' for each data product, along
+            with 'data' or 'sketch' if used, and the bin edges in 'bin_x',
+            'bin_y', and 'bin_z'
+
+        """
+
+        if self.sketches is None:
+            output = _calc_binned_median(self.ids, self.values,
+                                         self.data_label, self._shape,
+                                         self.returnData)
+        else:
+            output = {}
+            for label, sketch in zip(self.data_label, self.sketches):
+                count = sketch.count().astype(np.float64)
+                count[count == 0] = np.nan
+                output[label] = {'median': sketch.median(),
+                                 'count': count,
+                                 'avg_abs_dev': sketch.avg_abs_dev(),
+                                 'sketch': sketch}
+        for label in self.data_label:
+            for name, edges in zip(['bin_x', 'bin_y', 'bin_z'], self.bins):
+                output[label][name] = edges
+        return output
+
+    def to_dict(self):
+        """Describe the accumulator with lists and numbers.
+
+        Returns
+        -------
+        dict
+            accumulator description. Data products holding numbers may be
+            stored as JSON, pandas objects are kept as they are.
+
+        """
+
+        accum_dict = {'bins': [edges.tolist() for edges in self.bins],
+                      'labels': self.labels,
+                      'data_label': self.data_label,
+                      'returnData': self.returnData,
+                      'relative_accuracy': self.relative_accuracy}
+        if self.sketches is None:
+            accum_dict['ids'] = [bin_ids.tolist() for bin_ids in self.ids]
+            accum_dict['values'] = [[part.tolist() for part in values]
+                                    for values in self.values]
+        else:
+            accum_dict['sketches'] = [sketch.to_dict()
+                                      for sketch in self.sketches]
+        return accum_dict
+
+    @classmethod
+    def from_dict(cls, accum_dict):
+        """Create an accumulator from a description made by to_dict.
+
+        Parameters
+        ----------
+        accum_dict : dict
+            accumulator description
+
+        Returns
+        -------
+        MedianAccumulator
+            accumulator described
+
+        """
+
+        accum = cls(accum_dict['bins'], accum_dict['labels'],
+                    accum_dict['data_label'], accum_dict['returnData'],
+                    accum_dict['relative_accuracy'])
+        if accum.sketches is None:
+            accum.ids = [np.asarray(bin_ids, dtype=int)
+                         for bin_ids in accum_dict['ids']]
+            accum.values = [[_from_list(part) for part in values]
+                            for values in accum_dict['values']]
+        else:
+            accum.sketches = [BinnedQuantileSketch.from_dict(sketch_dict)
+                              for sketch_dict in accum_dict['sketches']]
+        return accum
+
+
+def _bin_locations(data, labels, bins):
+    """Find the flattened bin of each sample within the bins.
+
+    Parameters
+    ----------
+    data : pds.DataFrame
+        data holding the values binned over
+    labels : list of str
+        data labels binned over, slowest varying first
+    bins : list of array-like
+        bin edges for each label
+
+    Returns
+    -------
+    ids : array-like of int
+        flattened bin of each sample within the bins, in sample order
+    locs : array-like of int
+        location of each of these samples within data
+
+    """
+
+    shape = tuple(len(edges) - 1 for edges in bins)
+    inds = [np.digitize(data[label], edges) - 1
+            for label, edges in zip(labels, bins)]
+    good = np.ones(len(inds[0]), dtype=bool)
+    for ind, num in zip(inds, shape):
+        good &= (ind >= 0) & (ind < num)
+    locs, = np.where(good)
+    ids = np.ravel_multi_index([ind[locs] for ind in inds], shape)
+    return ids, locs
+
+
+def _calc_binned_median(ids, values, data_label, shape, returnData=False):
+    """Calculate the median of each data product within each bin
 
-        if returnData:
-            output[label]['data'] = ans[i]
+    Parameters
+    ----------
+    ids : list of array-like
+        flattened bin of each sample, as given by _bin_locations, for each
+        part of the season
+    values : list of lists of array-like
+        values of each data product for the samples in ids
+    data_label : list-like
+        strings identifying the data products
+    shape : tuple of int
+        number of bins along each dimension, slowest varying first
+    returnData : bool
+        Return the data within each bin as well as the statistics
+
+    Returns
+    -------
+    dict
+        'median', 'count', and 'avg_abs_dev' for each data product, and
+        'data' if requested. Numbers give arrays, with NaN for empty bins, and
+        pandas objects give nested lists, with None for empty bins.
+
+    Note
+    ----
+    Samples are grouped by bin with one stable sort, keeping them in the
+    order they were loaded within each bin. Medians of numbers are taken
+    from a single sort of all values by bin and value.
+
+    """
+
+    num = int(np.prod(shape))
+    if len(ids) > 0:
+        ids = np.concatenate(ids)
+    else:
+        ids = np.array([], dtype=int)
+    order = np.argsort(ids, kind='mergesort')
+    ids = ids[order]
+    splits = np.searchsorted(ids, np.arange(1, num))
+
+    output = {}
+    for label, label_values in zip(data_label, values):
+        if len(label_values) > 0:
+            label_values = np.concatenate(label_values)[order]
+        else:
+            label_values = np.array([])
+        output[label] = _binned_median(ids, label_values, splits, num)
+        for key in ['median', 'count', 'avg_abs_dev', 'data']:
+            if isinstance(output[label][key], np.ndarray) and \
+                    output[label][key].dtype != object:
+                output[label][key] = output[label][key].reshape(shape)
+            else:
+                output[label][key] = _nest(output[label][key], shape)
+        if not returnData:
+            del output[label]['data']
 
     return output
+
+
+def _binned_median(ids, values, splits, num):
+    """Calculate the median of values ordered by bin.
+
+    Parameters
+    ----------
+    ids : array-like of int
+        flattened bin of each value, in increasing order
+    values : array-like
+        values, either numbers or pandas objects
+    splits : array-like of int
+        location of the first value of each bin after the first
+    num : int
+        number of bins
+
+    Returns
+    -------
+    dict
+        flat 'median', 'count', 'avg_abs_dev' and 'data' for each bin
+
+    """
+
+    # data type is given by the first value of the first bin with data
+    data_type = type(values[0]) if len(values) > 0 else None
+
+    if data_type in [pds.Series, pds.DataFrame]:
+        median = [None] * num
+        count = [None] * num
+        dev = [None] * num
+        data = [list(bin_values) for bin_values in np.split(values, splits)]
+        for i, bin_values in enumerate(data):
+            if len(bin_values) == 0:
+                continue
+            count[i] = len(bin_values)
+            if data_type == pds.Series:
+                median[i] = pds.DataFrame(bin_values).median(axis=0)
+                dev[i] = pds.DataFrame([abs(temp - median[i])
+                                        for temp in bin_values]).median(axis=0)
+            else:
+                test = pds.Panel.from_dict(dict(enumerate(bin_values)))
+                median[i] = test.median(axis=0)
+                dev[i] = (test.subtract(median[i],
+                                        axis=0)).abs().median(axis=0,
+                                                              skipna=True)
+        return {'median': median, 'count': count, 'avg_abs_dev': dev,
+                'data': data}
+
+    # simple scalars, filter out any NaNs
+    if values.dtype == object:
+        values = np.array(values.tolist())
+    finite = np.isfinite(values)
+    ids = ids[finite]
+    values = values[finite]
+    count = np.bincount(ids, minlength=num)
+
+    # values in each bin, sorted, for medians
+    floats = values.astype(np.float64)
+    median = _sorted_median(ids, floats, count)
+    dev = _sorted_median(ids, np.abs(floats - median[ids]), count)
+
+    count = count.astype(np.float64)
+    count[count == 0] = np.nan
+    data = np.split(values, np.searchsorted(ids, np.arange(1, num)))
+    return {'median': median, 'count': count, 'avg_abs_dev': dev,
+            'data': data}
+
+
+def _sorted_median(ids, values, count):
+    """Median of values within each bin, NaN for empty bins
+
+    Parameters
+    ----------
+    ids : array-like of int
+        flattened bin of each value, in increasing order
+    values : array-like of float
+        values without NaNs
+    count : array-like of int
+        number of values in each bin
+
+    Returns
+    -------
+    array-like of float
+        median of each bin
+
+    """
+
+    ordered = values[np.lexsort((values, ids))]
+    starts = np.cumsum(count) - count
+    median = np.full(len(count), np.nan)
+    good = count > 0
+    median[good] = 0.5 * (ordered[starts[good] + (count[good] - 1) // 2] +
+                          ordered[starts[good] + count[good] // 2])
+    return median
+
+
+def _nest(items, shape):
+    """Arrange a flat list of bin values into nested lists by bin
+
+    Parameters
+    ----------
+    items : list
+        value for each bin
+    shape : tuple of int
+        number of bins along each dimension, slowest varying first
+
+    Returns
+    -------
+    list
+        nested lists of values
+
+    """
+
+    nested = np.empty(len(items), dtype=object)
+    for i, item in enumerate(items):
+        nested[i] = item
+    return nested.reshape(shape).tolist()
+
+
+def _from_list(items):
+    """Create an array of values stored as a list by to_dict
+
+    Parameters
+    ----------
+    items : list
+        numbers or pandas objects
+
+    Returns
+    -------
+    array-like
+        array of numbers, or object array of pandas objects
+
+    """
+
+    if len(items) > 0 and isinstance(items[0], (pds.Series, pds.DataFrame)):
+        values = np.empty(len(items), dtype=object)
+        for i, item in enumerate(items):
+            values[i] = item
+        return values
+    return np.asarray(items)
+
+
+def _combine_moments(first, second):
+    """Combine the moments of two sets of values
+
+    Parameters
+    ----------
+    first : dict
+        'count', 'sum', 'm2', 'min', and 'max' of the first set of values
+    second : dict
+        moments of the second set of values
+
+    Returns
+    -------
+    dict
+        moments of both sets of values
+
+    """
+
+    count = first['count'] + second['count']
+    with np.errstate(invalid='ignore', divide='ignore'):
+        delta = second['sum'] / second['count'] - first['sum'] / first['count']
+        m2 = first['m2'] + second['m2'] + \
+            delta**2 * first['count'] * second['count'] / count
+    m2 = np.where(first['count'] == 0, second['m2'],
+                  np.where(second['count'] == 0, first['m2'], m2))
+    return {'count': count, 'sum': first['sum'] + second['sum'], 'm2': m2,
+            'min': np.fmin(first['min'], second['min']),
+            'max': np.fmax(first['max'], second['max'])}
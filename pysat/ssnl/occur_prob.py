@@ -20,6 +20,8 @@ object as the season of interest.
 import numpy as np
 import warnings
 
+from pysat.ssnl.avg import _bin_locations
+
 
 def daily2D(inst, bin1, label1, bin2, label2, data_label, gate,
             returnBins=False):
@@ -71,8 +73,9 @@ def daily2D(inst, bin1, label1, bin2, label2, data_label, gate,
                             "https://github.com/pysat/pysatSeasons"]),
                   DeprecationWarning, stacklevel=2)
 
-    return _occurrence2D(inst, bin1, label1, bin2, label2, data_label, gate,
-                         by_orbit=False, returnBins=returnBins)
+    output = _occurrence(inst, [bin1, bin2], [label1, label2], data_label,
+                         gate, by_orbit=False, returnBins=returnBins)
+    return _name_bins(output)
 
 
 def by_orbit2D(inst, bin1, label1, bin2, label2, data_label, gate,
@@ -124,74 +127,9 @@ def by_orbit2D(inst, bin1, label1, bin2, label2, data_label, gate,
                             "https://github.com/pysat/pysatSeasons"]),
                   DeprecationWarning, stacklevel=2)
 
-    return _occurrence2D(inst, bin1, label1, bin2, label2, data_label, gate,
-                         by_orbit=True, returnBins=returnBins)
-
-
-def _occurrence2D(inst, bin1, label1, bin2, label2, data_label, gate,
-                  by_orbit=False, returnBins=False):
-    if not hasattr(data_label, '__iter__'):
-        raise ValueError('Data label must be list-like group of variable ' +
-                         'names.')
-    if not hasattr(gate, '__iter__'):
-        raise ValueError('Gate levels must be list-like group of variable ' +
-                         'names.')
-    if len(gate) != len(data_label):
-        raise ValueError('Must have a gate value for each data_label')
-
-    # create bins
-    binx = np.linspace(bin1[0], bin1[1], bin1[2] + 1)
-    biny = np.linspace(bin2[0], bin2[1], bin2[2] + 1)
-
-    numx = len(binx) - 1
-    numy = len(biny) - 1
-    numz = len(data_label)
-    arrx = np.arange(numx)
-    arry = np.arange(numy)
-    arrz = np.arange(numz)
-
-    # create arrays to store all values
-    total = np.zeros((numz, numy, numx))
-    hits = np.zeros((numz, numy, numx))
-    if by_orbit:
-        inst.load(date=inst.bounds[0][0])
-        iterator = inst.orbits
-    else:
-        iterator = inst
-
-    for i, inst in enumerate(iterator):
-        if len(inst.data) != 0:
-            xind = np.digitize(inst.data[label1], binx) - 1
-            for xi in arrx:
-                xindex, = np.where(xind == xi)
-                if len(xindex) > 0:
-                    yData = inst.data.iloc[xindex]
-                    yind = np.digitize(yData[label2], biny) - 1
-                    for yj in arry:
-                        yindex, = np.where(yind == yj)
-                        if len(yindex) > 0:
-                            # iterate over the different data_labels
-                            for zk in arrz:
-                                indlab = yData.columns.get_loc(data_label[zk])
-                                zdata = yData.iloc[yindex, indlab]
-                                if np.any(np.isfinite(zdata)):
-                                    total[zk, yj, xi] += 1.
-                                    if np.any(zdata > gate[zk]):
-                                        hits[zk, yj, xi] += 1.
-
-    # all of the loading and storing data is done
-    # get probability
-    prob = hits/total
-    # make nicer dictionary output
-    output = {}
-    for i, label in enumerate(data_label):
-        output[label] = {'prob': prob[i, :, :], 'count': total[i, :, :]}
-        if returnBins:
-            output[label]['bin_x'] = binx
-            output[label]['bin_y'] = biny
-    # clean up
-    del iterator
-    return output
+    output = _occurrence(inst, [bin1, bin2], [label1, label2], data_label,
+                         gate, by_orbit=True, returnBins=returnBins)
+    return _name_bins(output)
 
 
 def daily3D(inst, bin1, label1, bin2, label2, bin3, label3,
@@ -242,9 +180,10 @@ def daily3D(inst, bin1, label1, bin2, label2, bin3, label3,
                             "https://github.com/pysat/pysatSeasons"]),
                   DeprecationWarning, stacklevel=2)
 
-    return _occurrence3D(inst, bin1, label1, bin2, label2, bin3, label3,
-                         data_label, gate, returnBins=returnBins,
-                         by_orbit=False)
+    output = _occurrence(inst, [bin1, bin2, bin3], [label1, label2, label3],
+                         data_label, gate, by_orbit=False,
+                         returnBins=returnBins)
+    return _name_bins(output)
 
 
 def by_orbit3D(inst, bin1, label1, bin2, label2, bin3, label3,
@@ -295,86 +234,369 @@ def by_orbit3D(inst, bin1, label1, bin2, label2, bin3, label3,
                             "https://github.com/pysat/pysatSeasons"]),
                   DeprecationWarning, stacklevel=2)
 
-    return _occurrence3D(inst, bin1, label1, bin2, label2, bin3, label3,
-                         data_label, gate, returnBins=returnBins,
-                         by_orbit=True)
-
-
-def _occurrence3D(inst, bin1, label1, bin2, label2, bin3, label3,
-                  data_label, gate, returnBins=False, by_orbit=False):
-
-    if not hasattr(data_label, '__iter__'):
-        raise ValueError('Data label must be list-like group of variable ' +
-                         'names.')
-    if not hasattr(gate, '__iter__'):
-        raise ValueError('Gate levels must be list-like group of variable ' +
-                         'names.')
-    if len(gate) != len(data_label):
-        raise ValueError('Must have a gate value for each data_label')
-
-    # create bins
-    binx = np.linspace(bin1[0], bin1[1], bin1[2] + 1)
-    biny = np.linspace(bin2[0], bin2[1], bin2[2] + 1)
-    binz = np.linspace(bin3[0], bin3[1], bin3[2] + 1)
-
-    numx = len(binx) - 1
-    numy = len(biny) - 1
-    numz = len(binz) - 1
-    numd = len(data_label)
-
-    # create array to store all values before taking median
-    yarr = np.arange(numy)
-    xarr = np.arange(numx)
-    zarr = np.arange(numz)
-    darr = np.arange(numd)
-
-    total = np.zeros((numd, numz, numy, numx))
-    hits = np.zeros((numd, numz, numy, numx))
-
-    if by_orbit:
-        iterator = inst.orbits
-    else:
-        iterator = inst
-    # do loop to iterate over given season
-    for i, sat in enumerate(iterator):
-
-        if len(sat.data) != 0:
-            xind = np.digitize(sat.data[label1], binx) - 1
-            for xi in xarr:
-                xindex, = np.where(xind == xi)
-                if len(xindex) > 0:
-                    yData = sat.data.iloc[xindex]
-                    yind = np.digitize(yData[label2], biny) - 1
-                    for yj in yarr:
-                        yindex, = np.where(yind == yj)
-                        if len(yindex) > 0:
-                            zData = yData.iloc[yindex]
-                            zind = np.digitize(zData[label3], binz) - 1
-                            for zk in zarr:
-                                zindex, = np.where(zind == zk)
-                                if len(zindex) > 0:
-                                    for di in darr:
-                                        indlab = zData.columns.get_loc(data_label[di])
-                                        ddata = zData.iloc[zindex, indlab]
-                                        idx, = np.where(np.isfinite(ddata))
-                                        if len(idx) > 0:
-                                            total[di, zk, yj, xi] += 1
-                                            idx, = np.where(ddata > gate[di])
-                                            if len(idx) > 0:
-                                                hits[di, zk, yj, xi] += 1
-
-    # all of the loading and storing data is done
-    # prob = np.zeros((numz, numy, numx))
-    prob = hits/total
-
-    # make nicer dictionary output
-    output = {}
-    for i, label in enumerate(data_label):
-        output[label] = {'prob': prob[i, :, :, :], 'count': total[i, :, :, :]}
-        if returnBins:
-            output[label]['bin_x'] = binx
-            output[label]['bin_y'] = biny
-            output[label]['bin_z'] = binz
-    # clean up
-    del iterator
+    output = _occurrence(inst, [bin1, bin2, bin3], [label1, label2, label3],
+                         data_label, gate, by_orbit=True,
+                         returnBins=returnBins)
+    return _name_bins(output)
+
+
+def dailyND(inst, bins, labels, data_label, gate, returnBins=False):
+    """Daily Occurrence Probability of data_label > gate over any number of
+    binned dimensions.
+
+    If data_label is greater than gate at least once per day within a bin,
+    then a 100% occurrence probability results. Season delineated by the
+    bounds attached to Instrument object.
+    Prob = (# of times with at least one hit)/(# of times in bin)
+
+    Parameters
+    ----------
+    inst: pysat.Instrument()
+        Instrument to use for calculating occurrence probability
+    bins: list of lists
+        [min, max, number of bins] for each binned data product
+    labels: list of strings
+        names of the binned data products, in the same order as bins
+    data_label: list of strings
+        identifies data product(s) to calculate occurrence probability
+    gate: list of values
+        values that data_label must achieve to be counted as an occurrence
+    returnBins: Boolean
+        if True, return a list with the bin edges for each of labels
+
+    Returns
+    -------
+    occur_prob : dictionary
+        A dict of dicts indexed by data_label. Each entry is dict with entries
+        'prob' for the probability and 'count' for the number of days with any
+        data; 'bins' is also returned if requested. Arrays are organized with
+        the last of labels along the first dimension and the first of labels
+        along the last, as for daily2D and daily3D.
+
+    Note
+    ----
+    Season delineated by the bounds attached to Instrument object.
+
+    """
+
+    warnings.warn(' '.join(["This function is deprecated here and will be",
+                            "removed in pysat 3.0.0. Please use",
+                            "pysatSeasons instead:"
+                            "https://github.com/pysat/pysatSeasons"]),
+                  DeprecationWarning, stacklevel=2)
+
+    return _occurrence(inst, bins, labels, data_label, gate, by_orbit=False,
+                       returnBins=returnBins)
+
+
+def by_orbitND(inst, bins, labels, data_label, gate, returnBins=False):
+    """Occurrence Probability of data_label orbit-by-orbit over any number of
+    binned dimensions.
+
+    If data_label is greater than gate at least once per orbit within a bin,
+    then a 100% occurrence probability results. Season delineated by the
+    bounds attached to Instrument object.
+    Prob = (# of times with at least one hit)/(# of times in bin)
+
+    Parameters
+    ----------
+    inst: pysat.Instrument()
+        Instrument to use for calculating occurrence probability
+    bins: list of lists
+        [min, max, number of bins] for each binned data product
+    labels: list of strings
+        names of the binned data products, in the same order as bins
+    data_label: list of strings
+        identifies data product(s) to calculate occurrence probability
+    gate: list of values
+        values that data_label must achieve to be counted as an occurrence
+    returnBins: Boolean
+        if True, return a list with the bin edges for each of labels
+
+    Returns
+    -------
+    occur_prob : dictionary
+        A dict of dicts indexed by data_label. Each entry is dict with entries
+        'prob' for the probability and 'count' for the number of orbits with
+        any data; 'bins' is also returned if requested. Arrays are organized
+        with the last of labels along the first dimension and the first of
+        labels along the last, as for by_orbit2D and by_orbit3D.
+
+    Note
+    ----
+    Season delineated by the bounds attached to Instrument object.
+
+    """
+
+    warnings.warn(' '.join(["This function is deprecated here and will be",
+                            "removed in pysat 3.0.0. Please use",
+                            "pysatSeasons instead:"
+                            "https://github.com/pysat/pysatSeasons"]),
+                  DeprecationWarning, stacklevel=2)
+
+    return _occurrence(inst, bins, labels, data_label, gate, by_orbit=True,
+                       returnBins=returnBins)
+
+
+def _occurrence(inst, bins, labels, data_label, gate, by_orbit=False,
+                returnBins=False):
+    """Calculate the occurrence probability over a season
+
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        Instrument to iterate over
+    bins : list of lists
+        [min, max, number of bins] for each binned data product
+    labels : list of str
+        names of the binned data products
+    data_label : list of str
+        data products to calculate occurrence probability for
+    gate : list of values
+        values that data_label must exceed to be counted as an occurrence
+    by_orbit : bool
+        if True, iterate by orbit rather than by day (default=False)
+    returnBins : bool
+        if True, return the bin edges under 'bins' (default=False)
+
+    Returns
+    -------
+    dict
+        dict of dicts indexed by data_label, with 'prob' and 'count'
+
+    """
+
+    accum = OccurrenceAccumulator(bins, labels, data_label, gate,
+                                  by_orbit=by_orbit)
+    accum.update(inst)
+    return accum.finalize(returnBins=returnBins)
+
+
+class OccurrenceAccumulator(object):
+    """Mergeable accumulator for the occurrence probability of data products
+    above a gate within bins.
+
+    Parameters
+    ----------
+    bins : list of lists
+        [min, max, number of bins] for each binned data product
+    labels : list of str
+        names of the binned data products, in the same order as bins
+    data_label : list of str
+        data products to calculate occurrence probability for
+    gate : list of values
+        values that data_label must exceed to be counted as an occurrence
+    by_orbit : bool
+        if True, count orbits rather than days (default=False)
+
+    Attributes
+    ----------
+    total : np.array
+        number of days or orbits with finite data in each bin, for each
+        data_label
+    hits : np.array
+        number of days or orbits with data above the gate in each bin, for
+        each data_label
+
+    Note
+    ----
+    Arrays are organized with the last of labels along the first dimension
+    after data_label, as for daily3D. Accumulators for parts of a season that
+    do not overlap may be combined with `merge`, and stored with `to_dict`
+    and `from_dict`. An orbit that crosses from one part of the season into
+    the next is counted as two orbits.
+
+    Examples
+    --------
+    ::
+
+        accum = OccurrenceAccumulator([[0, 24, 2], [-60, 60, 3]],
+                                      ['slt', 'latitude'], ['slt'], [12.])
+        accum.update(inst)
+        accum.merge(OccurrenceAccumulator.from_dict(other_dict))
+        occur_prob = accum.finalize()
+
+    """
+
+    def __init__(self, bins, labels, data_label, gate, by_orbit=False):
+        if not hasattr(data_label, '__iter__'):
+            raise ValueError('Data label must be list-like group of ' +
+                             'variable names.')
+        if not hasattr(gate, '__iter__'):
+            raise ValueError('Gate levels must be list-like group of ' +
+                             'variable names.')
+        if len(gate) != len(data_label):
+            raise ValueError('Must have a gate value for each data_label')
+        if len(bins) != len(labels):
+            raise ValueError('Must have bins for each of labels')
+
+        self.bins = [list(limits) for limits in bins]
+        self.labels = list(labels)
+        self.data_label = list(data_label)
+        self.gate = np.asarray(gate, dtype=float)
+        self.by_orbit = by_orbit
+
+        # create bins, with the last label varying slowest to organize the
+        # output arrays z, y, x
+        self._edges = [np.linspace(limits[0], limits[1], limits[2] + 1)
+                       for limits in self.bins]
+        shape = (len(self.data_label),) + \
+            tuple(len(edges) - 1 for edges in self._edges[::-1])
+        self.total = np.zeros(shape)
+        self.hits = np.zeros(shape)
+
+    def add(self, inst):
+        """Add the data currently loaded in an Instrument as one day or orbit.
+
+        Parameters
+        ----------
+        inst : pysat.Instrument
+            Instrument with a day or orbit loaded
+
+        Note
+        ----
+        Every sample is given the flattened id of its bin offset by the
+        data_label it belongs to, so a single bincount over the finite
+        samples, and another over the samples above the gate, flags every bin
+        of every data_label with data and with an occurrence.
+
+        """
+
+        if len(inst.data) == 0:
+            return
+        ids, locs = _bin_locations(inst.data, self.labels[::-1],
+                                   self._edges[::-1])
+        if len(ids) == 0:
+            return
+        values = np.column_stack([np.asarray(inst.data[label],
+                                             dtype=float)[locs]
+                                  for label in self.data_label])
+        num = self.total.size
+        ids = ids[:, np.newaxis] + \
+            num // len(self.data_label) * np.arange(len(self.data_label))
+        with np.errstate(invalid='ignore'):
+            above = values > self.gate
+        good = np.bincount(ids[np.isfinite(values)], minlength=num) > 0
+        hits = good & (np.bincount(ids[above], minlength=num) > 0)
+        self.total += good.reshape(self.total.shape)
+        self.hits += hits.reshape(self.hits.shape)
+
+    def update(self, inst):
+        """Add each day or orbit over a season.
+
+        Parameters
+        ----------
+        inst : pysat.Instrument
+            Instrument to iterate over, within its bounds
+
+        """
+
+        if self.by_orbit:
+            inst.load(date=inst.bounds[0][0])
+            iterator = inst.orbits
+        else:
+            iterator = inst
+
+        for inst in iterator:
+            self.add(inst)
+        del iterator
+
+    def merge(self, other):
+        """Add the days or orbits counted by another accumulator.
+
+        Parameters
+        ----------
+        other : OccurrenceAccumulator
+            accumulator with the same bins, data products, and gates
+
+        """
+
+        if other.bins != self.bins or other.labels != self.labels or \
+                other.data_label != self.data_label or \
+                other.by_orbit != self.by_orbit or \
+                not np.array_equal(other.gate, self.gate):
+            raise ValueError(''.join(('Accumulators must have the same bins, ',
+                                      'data products, and gates to be ',
+                                      'merged.')))
+        self.total += other.total
+        self.hits += other.hits
+
+    def finalize(self, returnBins=False):
+        """Calculate the occurrence probability.
+
+        Parameters
+        ----------
+        returnBins : bool
+            if True, return a list with the bin edges for each of labels
+            under 'bins' (default=False)
+
+        Returns
+        -------
+        occur_prob : dict
+            A dict of dicts indexed by data_label. Each entry is dict with
+            entries 'prob' for the probability and 'count' for the number of
+            days or orbits with any data.
+
+        """
+
+        # get probability
+        prob = self.hits / self.total
+        # make nicer dictionary output
+        output = {}
+        for i, label in enumerate(self.data_label):
+            output[label] = {'prob': prob[i], 'count': self.total[i].copy()}
+            if returnBins:
+                output[label]['bins'] = self._edges
+        return output
+
+    def to_dict(self):
+        """Describe the accumulator with lists and numbers.
+
+        Returns
+        -------
+        dict
+            accumulator description, which may be stored as JSON
+
+        """
+
+        return {'bins': self.bins,
+                'labels': self.labels,
+                'data_label': self.data_label,
+                'gate': self.gate.tolist(),
+                'by_orbit': self.by_orbit,
+                'total': self.total.tolist(),
+                'hits': self.hits.tolist()}
+
+    @classmethod
+    def from_dict(cls, accum_dict):
+        """Create an accumulator from a description made by to_dict.
+
+        Parameters
+        ----------
+        accum_dict : dict
+            accumulator description
+
+        Returns
+        -------
+        OccurrenceAccumulator
+            accumulator described
+
+        """
+
+        accum = cls(accum_dict['bins'], accum_dict['labels'],
+                    accum_dict['data_label'], accum_dict['gate'],
+                    by_orbit=accum_dict['by_orbit'])
+        accum.total = np.asarray(accum_dict['total'], dtype=float)
+        accum.hits = np.asarray(accum_dict['hits'], dtype=float)
+        return accum
+
+
+def _name_bins(output):
+    """Store the bin edges returned by _occurrence as bin_x, bin_y, and bin_z
+    """
+
+    for label in output:
+        edges = output[label].pop('bins', [])
+        for name, bin_edges in zip(['bin_x', 'bin_y', 'bin_z'], edges):
+            output[label][name] = bin_edges
     return output
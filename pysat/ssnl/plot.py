@@ -8,9 +8,11 @@ import numpy as np
 import warnings
 
 from pysat import logger
+from pysat.ssnl.avg import _bin_locations
+
 
 def scatterplot(inst, labelx, labely, data_label, datalim, xlim=None,
-                ylim=None):
+                ylim=None, raster=None, raster_stat='mean'):
     """Return scatterplot of data_label(s) as functions of labelx,y over a
     season.
 
@@ -28,6 +30,13 @@ def scatterplot(inst, labelx, labely, data_label, datalim, xlim=None,
         data product(s) to be scatter plotted
     datalim : numyp array
         plot limits for data_label
+    raster : int, tuple of ints, or NoneType
+        If set, the number of pixels along x and y of a grid that the samples
+        are accumulated into, which is plotted rather than every sample.
+        Requires xlim and ylim. (default=None)
+    raster_stat : string
+        value of each pixel plotted if raster is set, one of 'mean', 'max',
+        or 'count' (default='mean')
 
     Returns
     -------
@@ -35,6 +44,11 @@ def scatterplot(inst, labelx, labely, data_label, datalim, xlim=None,
     of labelx and labely over the season delineated by start and
     stop datetime objects.
 
+    Note
+    ----
+    With raster set, memory use depends on the number of pixels rather than
+    the number of samples, see RasterAccumulator and rasterplot.
+
     """
 
     warnings.warn(' '.join(["This function is deprecated here and will be",
@@ -43,6 +57,14 @@ def scatterplot(inst, labelx, labely, data_label, datalim, xlim=None,
                             "https://github.com/pysat/pysatSeasons"]),
                   DeprecationWarning, stacklevel=2)
 
+    if raster is not None:
+        if xlim is None or ylim is None:
+            raise ValueError('xlim and ylim are required to rasterize.')
+        accum = RasterAccumulator(labelx, labely, data_label, xlim, ylim,
+                                  shape=raster)
+        accum.update(inst)
+        return rasterplot(accum, datalim, stat=raster_stat)
+
     if mpl.is_interactive():
         interactive_mode = True
         # turn interactive plotting off
@@ -50,27 +72,12 @@ def scatterplot(inst, labelx, labely, data_label, datalim, xlim=None,
     else:
         interactive_mode = False
 
-    # create figures for plotting
-    figs = []
-    axs = []
-
     # Check for list-like behaviour of data_label
     if type(data_label) is str:
         data_label = [data_label]
 
-    # multiple data to be plotted
-    for i in np.arange(len(data_label)):
-        figs.append(plt.figure())
-        ax1 = figs[i].add_subplot(211, projection='3d')
-        ax2 = figs[i].add_subplot(212)
-        axs.append((ax1, ax2))
-        plt.suptitle(data_label[i])
-        if xlim is not None:
-            ax1.set_xlim(xlim)
-            ax2.set_xlim(xlim)
-        if ylim is not None:
-            ax1.set_ylim(ylim)
-            ax2.set_ylim(ylim)
+    # create figures for plotting
+    figs, axs = _create_figures(data_label, xlim, ylim)
 
     # norm method so that data may be scaled to colors appropriately
     norm = mpl.colors.Normalize(vmin=datalim[0], vmax=datalim[1])
@@ -91,15 +98,311 @@ def scatterplot(inst, labelx, labely, data_label, datalim, xlim=None,
                                          c=inst.data[data_label[j]],
                                          norm=norm, alpha=0.5, edgecolor=None)
 
-    for j, (fig, ax) in enumerate(zip(figs, axs)):
+    _add_colorbars(axs, p)
+
+    if interactive_mode:
+        # turn interactive plotting back on
+        plt.ion()
+
+    return figs
+
+
+def rasterplot(accum, datalim, stat='mean'):
+    """Return plots of data_label(s) accumulated into a grid of pixels.
+
+    Parameters
+    ----------
+    accum : RasterAccumulator
+        pixels holding data_label as a function of labelx and labely
+    datalim : numpy array
+        plot limits for data_label
+    stat : string
+        value of each pixel plotted, one of 'mean', 'max', or 'count'
+        (default='mean')
+
+    Returns
+    -------
+    Returns a list of plots of data_label as a function of labelx and
+    labely, with the same axes as scatterplot. Pixels without data are not
+    drawn.
+
+    """
+
+    if stat not in ['mean', 'max', 'count']:
+        raise ValueError('Unknown statistic requested: {:}'.format(stat))
+
+    if mpl.is_interactive():
+        interactive_mode = True
+        # turn interactive plotting off
+        plt.ioff()
+    else:
+        interactive_mode = False
+
+    figs, axs = _create_figures(accum.data_label, accum.xlim, accum.ylim)
+    pixels = accum.finalize()
+    xcenters = 0.5 * (accum.xedges[1:] + accum.xedges[:-1])
+    ycenters = 0.5 * (accum.yedges[1:] + accum.yedges[:-1])
+    xgrid, ygrid = np.meshgrid(xcenters, ycenters)
+
+    # norm method so that data may be scaled to colors appropriately
+    norm = mpl.colors.Normalize(vmin=datalim[0], vmax=datalim[1])
+    p = []
+    for label, ax in zip(accum.data_label, axs):
+        values = pixels[label][stat].astype(np.float64)
+        good = pixels[label]['count'] > 0
+        values[~good] = np.nan
+        p.append(ax[0].scatter(xgrid[good], ygrid[good], values[good],
+                               zdir='z', c=values[good], norm=norm,
+                               linewidth=0, edgecolors=None))
+        ax[1].pcolormesh(accum.xedges, accum.yedges,
+                         np.ma.masked_invalid(values), norm=norm)
+
+    _add_colorbars(axs, p)
+
+    if interactive_mode:
+        # turn interactive plotting back on
+        plt.ion()
+
+    return figs
+
+
+def _create_figures(data_label, xlim, ylim):
+    """Create a figure with a 3D and a 2D axis for each data_label"""
+
+    figs = []
+    axs = []
+
+    # multiple data to be plotted
+    for i in np.arange(len(data_label)):
+        figs.append(plt.figure())
+        ax1 = figs[i].add_subplot(211, projection='3d')
+        ax2 = figs[i].add_subplot(212)
+        axs.append((ax1, ax2))
+        plt.suptitle(data_label[i])
+        if xlim is not None:
+            ax1.set_xlim(xlim)
+            ax2.set_xlim(xlim)
+        if ylim is not None:
+            ax1.set_ylim(ylim)
+            ax2.set_ylim(ylim)
+
+    return figs, axs
+
+
+def _add_colorbars(axs, p):
+    """Add a colorbar for each 3D axis and set the viewing angle"""
+
+    for j, ax in enumerate(axs):
         try:
             plt.colorbar(p[j], ax=ax[0], label='Amplitude (m/s)')
         except:
             logger.info('Tried colorbar but failed, thus no colorbar.')
         ax[0].elev = 30.
 
-    if interactive_mode:
-        # turn interactive plotting back on
-        plt.ion()
 
-    return figs
+class RasterAccumulator(object):
+    """Mergeable accumulator of data products within a grid of pixels.
+
+    Parameters
+    ----------
+    labelx : string
+        data product for x-axis
+    labely : string
+        data product for y-axis
+    data_label : string, array-like of strings
+        data product(s) to accumulate
+    xlim : array-like
+        [min, max] of labelx covered by the grid
+    ylim : array-like
+        [min, max] of labely covered by the grid
+    shape : int or tuple of ints
+        number of pixels along x and y (default=(200, 200))
+
+    Attributes
+    ----------
+    xedges : np.array
+        pixel edges along x
+    yedges : np.array
+        pixel edges along y
+    count : np.array
+        number of finite samples within each pixel, for each data_label
+    sum : np.array
+        sum of the samples within each pixel, for each data_label
+    max : np.array
+        maximum of the samples within each pixel, for each data_label
+
+    Note
+    ----
+    Arrays are organized y, x after data_label, as for pcolormesh. Memory
+    use depends on the number of pixels, not the number of samples.
+    Accumulators for parts of a season may be combined with `merge`, and
+    stored with `to_dict` and `from_dict`.
+
+    Examples
+    --------
+    ::
+
+        accum = RasterAccumulator('longitude', 'latitude', 'slt',
+                                  [0, 360], [-90, 90], shape=(360, 180))
+        accum.update(inst)
+        accum.merge(RasterAccumulator.from_dict(other_dict))
+        figs = rasterplot(accum, [0, 24])
+
+    """
+
+    def __init__(self, labelx, labely, data_label, xlim, ylim,
+                 shape=(200, 200)):
+        # Check for list-like behaviour of data_label
+        if type(data_label) is str:
+            data_label = [data_label]
+        shape = np.broadcast_to(shape, 2).astype(int)
+        if np.any(shape < 1):
+            raise ValueError('Must have at least one pixel along x and y.')
+
+        self.labelx = labelx
+        self.labely = labely
+        self.data_label = list(data_label)
+        self.xlim = [float(lim) for lim in xlim]
+        self.ylim = [float(lim) for lim in ylim]
+        self.shape = tuple(shape.tolist())
+        self.xedges = np.linspace(self.xlim[0], self.xlim[1], shape[0] + 1)
+        self.yedges = np.linspace(self.ylim[0], self.ylim[1], shape[1] + 1)
+
+        grid = (len(self.data_label), shape[1], shape[0])
+        self.count = np.zeros(grid, dtype=np.int64)
+        self.sum = np.zeros(grid)
+        self.max = np.full(grid, np.nan)
+
+    def add(self, inst):
+        """Add the data currently loaded in an Instrument.
+
+        Parameters
+        ----------
+        inst : pysat.Instrument
+            Instrument with data loaded
+
+        """
+
+        if inst.empty:
+            return
+        ids, locs = _bin_locations(inst.data, [self.labely, self.labelx],
+                                   [self.yedges, self.xedges])
+        num = self.shape[0] * self.shape[1]
+        for i, label in enumerate(self.data_label):
+            values = np.asarray(inst.data[label], dtype=np.float64)[locs]
+            good = np.isfinite(values)
+            label_ids = ids[good]
+            values = values[good]
+            self.count[i] += np.bincount(label_ids, minlength=num).reshape(
+                self.count.shape[1:])
+            self.sum[i] += np.bincount(label_ids, weights=values,
+                                       minlength=num).reshape(
+                                           self.sum.shape[1:])
+            if len(values) > 0:
+                # maximum of each pixel from one sort by pixel
+                order = np.argsort(label_ids, kind='mergesort')
+                label_ids = label_ids[order]
+                starts = np.flatnonzero(np.hstack((True, label_ids[1:] !=
+                                                   label_ids[:-1])))
+                pixels = np.unravel_index(label_ids[starts],
+                                          self.max.shape[1:])
+                self.max[i][pixels] = np.fmax(
+                    self.max[i][pixels],
+                    np.maximum.reduceat(values[order], starts))
+
+    def update(self, inst):
+        """Add the data over a season.
+
+        Parameters
+        ----------
+        inst : pysat.Instrument
+            Instrument to iterate over, within its bounds
+
+        """
+
+        for inst in inst:
+            self.add(inst)
+
+    def merge(self, other):
+        """Add the samples from another accumulator.
+
+        Parameters
+        ----------
+        other : RasterAccumulator
+            accumulator with the same grid and data products
+
+        """
+
+        if other.labelx != self.labelx or other.labely != self.labely or \
+                other.data_label != self.data_label or \
+                other.xlim != self.xlim or other.ylim != self.ylim or \
+                other.shape != self.shape:
+            raise ValueError(''.join(('Accumulators must have the same grid ',
+                                      'and data products to be merged.')))
+        self.count += other.count
+        self.sum += other.sum
+        self.max = np.fmax(self.max, other.max)
+
+    def finalize(self):
+        """Calculate the value of each pixel.
+
+        Returns
+        -------
+        dict
+            'count', 'mean', and 'max' of each pixel for each data_label,
+            with NaN for pixels without data
+
+        """
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = self.sum / self.count
+        output = {}
+        for i, label in enumerate(self.data_label):
+            output[label] = {'count': self.count[i].copy(),
+                             'mean': mean[i],
+                             'max': self.max[i].copy()}
+        return output
+
+    def to_dict(self):
+        """Describe the accumulator with lists and numbers.
+
+        Returns
+        -------
+        dict
+            accumulator description, which may be stored as JSON
+
+        """
+
+        return {'labelx': self.labelx,
+                'labely': self.labely,
+                'data_label': self.data_label,
+                'xlim': self.xlim,
+                'ylim': self.ylim,
+                'shape': list(self.shape),
+                'count': self.count.tolist(),
+                'sum': self.sum.tolist(),
+                'max': self.max.tolist()}
+
+    @classmethod
+    def from_dict(cls, accum_dict):
+        """Create an accumulator from a description made by to_dict.
+
+        Parameters
+        ----------
+        accum_dict : dict
+            accumulator description
+
+        Returns
+        -------
+        RasterAccumulator
+            accumulator described
+
+        """
+
+        accum = cls(accum_dict['labelx'], accum_dict['labely'],
+                    accum_dict['data_label'], accum_dict['xlim'],
+                    accum_dict['ylim'], shape=accum_dict['shape'])
+        accum.count = np.asarray(accum_dict['count'], dtype=np.int64)
+        accum.sum = np.asarray(accum_dict['sum'], dtype=np.float64)
+        accum.max = np.asarray(accum_dict['max'], dtype=np.float64)
+        return accum
@@ -0,0 +1,322 @@
+"""Mergeable quantile sketches of data sorted into bins.
+
+A sketch keeps a count of the values that fall within logarithmically
+spaced buckets for every bin, as in DDSketch (Masson, Rim, and Lee, 2019,
+Proc. VLDB Endowment 12, 2195). Memory use depends on the spread of the
+values in each bin, not on the number of values, so statistics may be
+gathered over seasons that do not fit in memory. Sketches built from
+different parts of a season, in different processes or runs, may be merged,
+and stored using `to_dict` and `from_dict`.
+
+Note
+----
+Each quantile returned is within `relative_accuracy` of the exact value at
+that rank, |estimate - exact| <= relative_accuracy * |exact|, regardless of
+the number of values. Medians average the two middle values, each within
+this bound. The average absolute deviation is calculated from the
+sketched values, and is accurate to about relative_accuracy times the
+magnitude of the values near the median.
+
+"""
+
+import numpy as np
+
+
+class BinnedQuantileSketch(object):
+    """Mergeable quantile sketch of the values within each bin.
+
+    Parameters
+    ----------
+    shape : int or tuple of int
+        number of bins along each dimension
+    relative_accuracy : float
+        relative accuracy of the quantiles, between 0 and 1 (default=0.01)
+
+    Attributes
+    ----------
+    shape : tuple of int
+        number of bins along each dimension
+    relative_accuracy : float
+        relative accuracy of the quantiles
+    keys : np.array of int
+        bin and bucket of each bucket holding values, in increasing order
+    counts : np.array of int
+        number of values within each bucket
+
+    Examples
+    --------
+    ::
+
+        sketch = BinnedQuantileSketch((2, 3), relative_accuracy=0.01)
+        sketch.update(np.array([0, 0, 4]), np.array([1., 2., 10.]))
+        sketch.median()
+        sketch.quantile([0.1, 0.9])
+
+        # combine with a sketch from another process
+        sketch.merge(BinnedQuantileSketch.from_dict(other_dict))
+
+    """
+
+    def __init__(self, shape, relative_accuracy=0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError('relative_accuracy must be between 0 and 1.')
+        self.shape = tuple(np.atleast_1d(shape).astype(int).tolist())
+        self.relative_accuracy = float(relative_accuracy)
+        self.keys = np.array([], dtype=np.int64)
+        self.counts = np.array([], dtype=np.int64)
+
+        # buckets (gamma**(i - 1), gamma**i] for i in [-max_index, max_index]
+        # cover all float magnitudes, with magnitudes at or below
+        # gamma**-max_index counted as zero
+        self._gamma = (1. + self.relative_accuracy) / \
+            (1. - self.relative_accuracy)
+        self._log_gamma = np.log(self._gamma)
+        self._max_index = int(np.ceil(np.log(np.finfo(np.float64).max) /
+                                      self._log_gamma))
+        # buckets within a bin are ordered by value, with negative values,
+        # zero, and positive values
+        self._width = 4 * self._max_index + 3
+
+    def __repr__(self):
+        return ''.join(('pysat.ssnl.sketch.BinnedQuantileSketch(shape=',
+                        repr(self.shape), ', relative_accuracy=',
+                        repr(self.relative_accuracy), ')'))
+
+    @property
+    def num_bins(self):
+        """Total number of bins."""
+        return int(np.prod(self.shape))
+
+    def _bucket(self, values):
+        """Order of the bucket holding each value within its bin"""
+        magnitude = np.abs(values)
+        zero = magnitude <= self._gamma**-self._max_index
+        index = np.zeros(len(values), dtype=np.int64)
+        index[~zero] = np.ceil(np.log(magnitude[~zero]) /
+                               self._log_gamma).astype(np.int64)
+        index = np.clip(index, -self._max_index, self._max_index)
+        bucket = np.where(values > 0, 3 * self._max_index + 2 + index,
+                          self._max_index - index)
+        bucket[zero] = 2 * self._max_index + 1
+        return bucket
+
+    def _value(self, bucket):
+        """Value representing each bucket"""
+        positive = bucket > 2 * self._max_index + 1
+        index = np.where(positive, bucket - 3 * self._max_index - 2,
+                         self._max_index - bucket)
+        value = np.exp(index * self._log_gamma +
+                       np.log(2. / (self._gamma + 1.)))
+        value[~positive] *= -1.
+        value[bucket == 2 * self._max_index + 1] = 0.
+        return value
+
+    def _combine(self, keys, counts):
+        """Store the total count for each unique key"""
+        order = np.argsort(keys, kind='mergesort')
+        keys = keys[order]
+        counts = counts[order]
+        if len(keys) > 0:
+            starts = np.flatnonzero(np.hstack((True, keys[1:] != keys[:-1])))
+            keys = keys[starts]
+            counts = np.add.reduceat(counts, starts)
+        self.keys = keys
+        self.counts = counts
+
+    def update(self, ids, values):
+        """Add values to the sketch.
+
+        Parameters
+        ----------
+        ids : array-like of int
+            flattened bin of each value
+        values : array-like of numbers
+            values to add. NaN and infinite values are ignored.
+
+        """
+
+        ids = np.asarray(ids, dtype=np.int64)
+        values = np.asarray(values)
+        if values.dtype == object or not np.issubdtype(values.dtype,
+                                                       np.number):
+            raise ValueError('Only numbers may be added to a sketch.')
+        values = values.astype(np.float64)
+        good = np.isfinite(values)
+        keys = ids[good] * self._width + self._bucket(values[good])
+        keys, counts = np.unique(keys, return_counts=True)
+        self._combine(np.hstack((self.keys, keys)),
+                      np.hstack((self.counts, counts)))
+
+    def merge(self, other):
+        """Add the values counted by another sketch.
+
+        Parameters
+        ----------
+        other : BinnedQuantileSketch
+            sketch with the same shape and relative accuracy
+
+        """
+
+        if other.shape != self.shape or \
+                other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(''.join(('Sketches must have the same shape ',
+                                      'and relative accuracy to be merged.')))
+        self._combine(np.hstack((self.keys, other.keys)),
+                      np.hstack((self.counts, other.counts)))
+
+    def count(self):
+        """Number of values within each bin.
+
+        Returns
+        -------
+        np.array of int
+            count for each bin
+
+        """
+
+        count = np.bincount(self.keys // self._width, weights=self.counts,
+                            minlength=self.num_bins)
+        return count.astype(np.int64).reshape(self.shape)
+
+    def _at_rank(self, bins, values, counts, rank):
+        """Value at a rank within each bin, from values in order
+
+        Parameters
+        ----------
+        bins : np.array of int
+            bin of each value, in increasing order
+        values : np.array of float
+            values, in increasing order within each bin
+        counts : np.array of int
+            number of samples with each value
+        rank : function
+            returns the zero based rank to select from the number of
+            samples in each bin
+
+        Returns
+        -------
+        np.array
+            value for each bin, NaN for bins without values
+
+        """
+
+        total = np.bincount(bins, weights=counts, minlength=self.num_bins)
+        total = total.astype(np.int64)
+        before = np.cumsum(total) - total
+        result = np.full(self.num_bins, np.nan)
+        good = total > 0
+        locs = np.searchsorted(np.cumsum(counts),
+                               before[good] + rank(total[good]), side='right')
+        result[good] = values[locs]
+        return result.reshape(self.shape)
+
+    def _median(self, bins, values, counts):
+        """Median within each bin, from values in order"""
+        return 0.5 * (self._at_rank(bins, values, counts,
+                                    lambda num: (num - 1) // 2) +
+                      self._at_rank(bins, values, counts,
+                                    lambda num: num // 2))
+
+    def quantile(self, q):
+        """Estimate quantiles of the values within each bin.
+
+        Parameters
+        ----------
+        q : float or array-like of float
+            quantiles to estimate, between 0 and 1
+
+        Returns
+        -------
+        np.array
+            quantiles for each bin, NaN for bins without values. If q is
+            array-like, the first dimension matches q.
+
+        Note
+        ----
+        The quantile q is the value at zero based rank floor(q (n - 1)).
+
+        """
+
+        if np.any((np.asarray(q) < 0) | (np.asarray(q) > 1)):
+            raise ValueError('Quantiles must be between 0 and 1.')
+        bins = self.keys // self._width
+        values = self._value(self.keys % self._width)
+        quantiles = [self._at_rank(bins, values, self.counts,
+                                   lambda num: np.floor(qval * (num - 1)
+                                                        ).astype(np.int64))
+                     for qval in np.atleast_1d(q)]
+        return quantiles[0] if np.ndim(q) == 0 else np.array(quantiles)
+
+    def median(self):
+        """Estimate the median of the values within each bin.
+
+        Returns
+        -------
+        np.array
+            median for each bin, NaN for bins without values
+
+        Note
+        ----
+        As for np.median, the two middle values are averaged for bins with an
+        even number of values.
+
+        """
+
+        return self._median(self.keys // self._width,
+                            self._value(self.keys % self._width),
+                            self.counts)
+
+    def avg_abs_dev(self):
+        """Estimate the median absolute deviation from the median.
+
+        Returns
+        -------
+        np.array
+            median of the absolute deviation from the median for each bin,
+            NaN for bins without values
+
+        """
+
+        bins = self.keys // self._width
+        median = self.median().ravel()
+        deviation = np.abs(self._value(self.keys % self._width) -
+                           median[bins])
+        order = np.lexsort((deviation, bins))
+        return self._median(bins[order], deviation[order], self.counts[order])
+
+    def to_dict(self):
+        """Describe the sketch with lists and numbers.
+
+        Returns
+        -------
+        dict
+            sketch description, which may be stored as JSON
+
+        """
+
+        return {'shape': list(self.shape),
+                'relative_accuracy': self.relative_accuracy,
+                'keys': self.keys.tolist(),
+                'counts': self.counts.tolist()}
+
+    @classmethod
+    def from_dict(cls, sketch_dict):
+        """Create a sketch from a description made by to_dict.
+
+        Parameters
+        ----------
+        sketch_dict : dict
+            sketch description
+
+        Returns
+        -------
+        BinnedQuantileSketch
+            sketch described
+
+        """
+
+        sketch = cls(tuple(sketch_dict['shape']),
+                     sketch_dict['relative_accuracy'])
+        sketch.keys = np.asarray(sketch_dict['keys'], dtype=np.int64)
+        sketch.counts = np.asarray(sketch_dict['counts'], dtype=np.int64)
+        return sketch
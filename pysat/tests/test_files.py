@@ -2,6 +2,7 @@
 tests the pysat meta object and code
 """
 import glob
+import multiprocessing
 import numpy as np
 import os
 import sys
@@ -19,6 +20,12 @@ else:
     re_load = reload
 
 
+def fetch_to_cache(args):
+    """Copy a file into a cache, run in a separate process"""
+    cache, source = args
+    return cache.fetch(os.path.basename(source), source)
+
+
 def create_dir(inst=None, temporary_file_list=False):
     if inst is None:
         # create instrument
@@ -982,3 +989,182 @@ class TestInstrumentWithVersionedFiles():
 class TestInstrumentWithVersionedFilesNoFileListStorage(TestInstrumentWithVersionedFiles):
 
     temporary_file_list = True
+
+
+class TestInstrumentWithMultipleDataDirs():
+
+    temporary_file_list = True
+
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        # store current pysat directories
+        self.data_path = pysat.data_dir
+        self.saved_cache = (pysat.cache_dir, pysat.cache_size)
+        # create temporary directories, a primary and an archive directory
+        self.dir_names = [tempfile.mkdtemp(), tempfile.mkdtemp()]
+        pysat.utils.set_data_dir(self.dir_names, store=False)
+        self.cache_dir = tempfile.mkdtemp()
+
+        re_load(pysat.instruments.pysat_testing)
+        pysat.instruments.pysat_testing.list_files = list_files
+        self.testInst = \
+            pysat.Instrument(inst_module=pysat.instruments.pysat_testing,
+                             clean_level='clean',
+                             temporary_file_list=self.temporary_file_list)
+        self.root_fname = ''.join(('pysat_testing_junk_{year:04d}_gold_',
+                                   '{day:03d}_stuff_{month:02d}_{hour:02d}_',
+                                   '{minute:02d}_{second:02d}.pysat_testing_',
+                                   'file'))
+        self.sub_dir = self.testInst.files.sub_dir_path
+        # the primary directory holds the first two days, the archive
+        # directory holds all four days
+        self.create_files(self.dir_names[0], pysat.datetime(2008, 1, 1),
+                          pysat.datetime(2008, 1, 2))
+        self.create_files(self.dir_names[1], pysat.datetime(2008, 1, 1),
+                          pysat.datetime(2008, 1, 4))
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        import shutil
+
+        del self.testInst
+        re_load(pysat.instruments.pysat_testing)
+        re_load(pysat.instruments)
+        for dir_name in self.dir_names + [self.cache_dir]:
+            shutil.rmtree(dir_name)
+        pysat.utils.set_data_dir(self.data_path, store=False)
+        if self.saved_cache[0] == '':
+            pysat.utils.set_cache_dir(None, store=False)
+        else:
+            pysat.utils.set_cache_dir(self.saved_cache[0],
+                                      max_size=self.saved_cache[1],
+                                      store=False)
+
+    def create_files(self, root_dir, start, stop):
+        data_path = os.path.join(root_dir, self.sub_dir)
+        if not os.path.isdir(data_path):
+            os.makedirs(data_path)
+        for date in pysat.utils.time.create_date_range(start, stop):
+            fname = self.root_fname.format(year=date.year, day=date.day,
+                                           month=date.month, hour=0,
+                                           minute=0, second=0)
+            with open(os.path.join(data_path, fname), 'w') as fout:
+                fout.write(root_dir)
+
+    def new_instrument(self):
+        return pysat.Instrument(inst_module=pysat.instruments.pysat_testing,
+                                clean_level='clean', update_files=True,
+                                temporary_file_list=self.temporary_file_list)
+
+    def test_data_dirs(self):
+        assert pysat.data_dir == self.dir_names[0]
+        assert pysat.data_dirs == self.dir_names
+        assert len(self.testInst.files.data_paths) == 2
+
+    def test_files_from_all_data_dirs(self):
+        self.testInst = self.new_instrument()
+        dates = pysat.utils.time.create_date_range(pysat.datetime(2008, 1, 1),
+                                                   pysat.datetime(2008, 1, 4))
+        assert np.all(self.testInst.files.files.index == dates)
+
+    def test_full_path_uses_first_data_dir(self):
+        self.testInst = self.new_instrument()
+        for fname, root_dir in zip(self.testInst.files.files,
+                                   [0, 0, 1, 1]):
+            full_path = self.testInst.files.get_full_path(fname)
+            assert full_path == os.path.join(self.dir_names[root_dir],
+                                             self.sub_dir, fname)
+
+    def test_full_path_to_missing_file(self):
+        full_path = self.testInst.files.get_full_path('not_a_file')
+        assert full_path == os.path.join(self.testInst.files.data_path,
+                                         'not_a_file')
+
+    @raises(ValueError)
+    def test_set_cache_dir_to_data_dir(self):
+        pysat.utils.set_cache_dir(self.dir_names[0], store=False)
+
+    def test_files_promoted_to_cache(self):
+        pysat.utils.set_cache_dir(self.cache_dir, store=False)
+        self.testInst = self.new_instrument()
+        fname = self.testInst.files[3]
+        full_path = self.testInst.files.get_full_path(fname)
+        assert full_path == os.path.join(self.cache_dir, self.sub_dir, fname)
+        with open(full_path, 'r') as fin:
+            assert fin.read() == self.dir_names[1]
+
+        # cached copy is used without copying again
+        assert self.testInst.files.get_full_path(fname,
+                                                 promote=False) == full_path
+
+    def test_empty_file_filter_reads_cache_index_once(self):
+        pysat.utils.set_cache_dir(self.cache_dir, store=False)
+        self.testInst = self.new_instrument()
+        self.testInst.files.get_full_path(self.testInst.files[3])
+
+        cache = self.testInst.files._cache
+        load_index = cache._load_index
+        loads = []
+
+        def count_loads():
+            loads.append(1)
+            return load_index()
+        cache._load_index = count_loads
+        self.testInst.files.ignore_empty_files = True
+        self.testInst.files.refresh()
+        assert len(loads) == 1
+        assert len(self.testInst.files.files) == 4
+
+    def test_cache_evicts_least_recently_used(self):
+        # every file is the same size, allow two in the cache
+        size = len(self.dir_names[1])
+        pysat.utils.set_cache_dir(self.cache_dir, max_size=2 * size,
+                                  store=False)
+        self.testInst = self.new_instrument()
+        fnames = self.testInst.files[2:4]
+        cached = [self.testInst.files.get_full_path(fname)
+                  for fname in fnames]
+        self.testInst.files._cache.in_use_time = 0.
+        # use the first file again, making the second file the oldest
+        self.testInst.files.get_full_path(fnames[0])
+        self.testInst.files.get_full_path(self.testInst.files[0])
+
+        assert os.path.isfile(cached[0])
+        assert not os.path.isfile(cached[1])
+
+    def test_file_larger_than_cache_not_promoted(self):
+        pysat.utils.set_cache_dir(self.cache_dir, max_size=1, store=False)
+        self.testInst = self.new_instrument()
+        fname = self.testInst.files[3]
+        full_path = self.testInst.files.get_full_path(fname)
+        assert full_path == os.path.join(self.dir_names[1], self.sub_dir,
+                                         fname)
+
+    def test_cache_keeps_files_in_use(self):
+        # allow one file in the cache, the last file is still in use
+        size = len(self.dir_names[1])
+        pysat.utils.set_cache_dir(self.cache_dir, max_size=size,
+                                  store=False)
+        self.testInst = self.new_instrument()
+        cached = [self.testInst.files.get_full_path(fname)
+                  for fname in self.testInst.files[2:4]]
+        assert os.path.isfile(cached[0])
+        assert os.path.isfile(cached[1])
+
+    def test_cache_shared_by_processes(self):
+        cache = pysat._files._DataCache(self.cache_dir)
+        sources = [os.path.join(self.dir_names[1], self.sub_dir, fname)
+                   for fname in os.listdir(os.path.join(self.dir_names[1],
+                                                        self.sub_dir))]
+        pool = multiprocessing.Pool(4)
+        try:
+            cached = pool.map(fetch_to_cache,
+                              [(cache, source) for source in sources * 4])
+        finally:
+            pool.close()
+            pool.join()
+        assert all(path.startswith(self.cache_dir) for path in cached)
+        # every file is recorded in the index, none are lost
+        assert sorted(cache._load_index().keys()) == \
+            sorted([os.path.basename(source) for source in sources])
+        assert not os.path.isfile(cache.index_file + '.lock')
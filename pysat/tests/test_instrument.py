@@ -181,6 +181,18 @@ class TestBasics():
         assert (test_date == pds.datetime(2009, 1, 3))
         assert (test_date == self.testInst.date)
 
+    def test_download_skip_listed(self):
+        requested = []
+
+        def download(date_array, **kwargs):
+            requested.extend(date_array)
+        self.testInst._download_rtn = download
+        listed = self.testInst.files.files.index[-1]
+        unlisted = listed + pds.DateOffset(days=1)
+        self.testInst.download(date_array=[listed, unlisted],
+                               skip_listed=True)
+        assert requested == [unlisted]
+
     # --------------------------------------------------------------------------
     #
     # Test date helpers
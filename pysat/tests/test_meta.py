@@ -390,6 +390,46 @@ class TestBasics():
 
         assert (self.meta['new3'].units == 'hey3')
 
+    def test_from_dict(self):
+        meta_dict = {'new1': {'units': 'hey1', 'long_name': 'crew'},
+                     'new2': {'units': 'hey', 'description': 'boohoo'}}
+        meta = pysat.Meta.from_dict(meta_dict)
+        self.meta['new1'] = meta_dict['new1']
+        self.meta['new2'] = meta_dict['new2']
+
+        assert meta == self.meta
+        assert meta['new2', 'long_name'] == 'new2'
+        assert meta['new2', 'Description'] == 'boohoo'
+        assert meta_dict['new1'] == {'units': 'hey1', 'long_name': 'crew'}
+
+    def test_update_many(self):
+        self.meta['new1'] = {'units': 'hey1', 'long_name': 'crew'}
+        self.meta.update_many({'NEW1': {'Units': 'hey2'},
+                               'new2': {'units': ['a', 'b']}})
+
+        assert list(self.meta.keys()) == ['new1', 'new2']
+        assert self.meta['new1', 'units'] == 'hey2'
+        assert self.meta['new1', 'long_name'] == 'crew'
+        assert self.meta['new2', 'units'] == 'a\n\nb'
+        assert np.isnan(self.meta['new2', 'fill'])
+
+    def test_update_many_higher_order(self):
+        meta2 = pysat.Meta.from_dict({'new21': {'units': 'hey2'}})
+        self.meta.update_many({'new': {'units': 'hey', 'meta': meta2},
+                               'new2': {'units': 'hey3'}})
+
+        assert self.meta['new'].children['new21', 'units'] == 'hey2'
+        assert self.meta['new2', 'units'] == 'hey3'
+        assert 'new' in self.meta.keys_nD()
+
+    def test_update_many_empty_keeps_sharing(self):
+        self.meta['new1'] = {'units': 'hey1', 'long_name': 'crew'}
+        meta_copy = self.meta.copy()
+        meta_copy.update_many({})
+
+        assert meta_copy._frame is self.meta._frame
+        assert meta_copy == self.meta
+
     @raises(RuntimeError)
     def test_concat_w_name_collision_strict(self):
         self.meta['new1'] = {'units': 'hey1', 'long_name': 'crew'}
@@ -1045,6 +1085,77 @@ class TestBasics():
         assert (self.meta['NEW21'].long_name == 'boo2')
         assert (self.meta['NEW21'].YoYoYO == 'yolo')
 
+    def test_copy_is_independent(self):
+        self.meta['new'] = {'units': 'hey', 'long_name': 'boo'}
+        meta2 = pysat.Meta()
+        meta2['new21'] = {'units': 'hey2'}
+        self.meta['new2'] = meta2
+        self.meta.mutable = True
+        self.meta.bespoke = ['test']
+        meta_copy = self.meta.copy()
+        assert meta_copy == self.meta
+
+        meta_copy['new'] = {'units': 'hey3'}
+        meta_copy['new3'] = {'units': 'hey4'}
+        meta_copy.bespoke.append('attribute')
+        self.meta.data.loc['new', 'long_name'] = 'boo2'
+        self.meta['new2'].children['new21', 'units'] = 'hey5'
+        assert self.meta['new', 'units'] == 'hey'
+        assert self.meta['new', 'long_name'] == 'boo2'
+        assert 'new3' not in self.meta
+        assert self.meta.bespoke == ['test']
+        assert meta_copy['new', 'units'] == 'hey3'
+        assert meta_copy['new', 'long_name'] == 'boo'
+        assert meta_copy['new2'].children['new21', 'units'] == 'hey2'
+
+    def test_copied_children_are_independent(self):
+        meta2 = pysat.Meta()
+        meta2['new21'] = {'units': 'hey2'}
+        self.meta['new2'] = meta2
+        meta_copy = self.meta.copy()
+
+        meta_copy.ho_data['new2']['new21'] = {'units': 'hey3'}
+        meta_copy.ho_data['new2']['new22'] = {'units': 'hey4'}
+        assert self.meta['new2'].children['new21', 'units'] == 'hey2'
+        assert 'new22' not in self.meta['new2'].children
+        assert meta_copy['new2'].children['new21', 'units'] == 'hey3'
+
+    def test_case_names_after_drop_and_pop(self):
+        self.meta['New'] = {'units': 'hey', 'YoYoYO': 'yolo'}
+        self.meta['NEW21'] = {'units': 'hey2'}
+        assert self.meta.var_case_name('new') == 'New'
+        assert self.meta.attr_case_name('yoyoyo') == 'YoYoYO'
+
+        self.meta.drop(['New'])
+        self.meta.pop('new21')
+        assert 'new' not in self.meta
+        assert 'new21' not in self.meta
+        assert self.meta.var_case_name('new') == 'new'
+
+        self.meta['NEW'] = {'units': 'hey3'}
+        self.meta.units_label = 'Units'
+        assert self.meta.var_case_name('new') == 'NEW'
+        assert self.meta.attr_case_name('UNITS') == 'Units'
+        assert self.meta['new', 'units'] == 'hey3'
+
+    def test_ho_case_names_after_changes(self):
+        meta2 = pysat.Meta()
+        meta2['new21'] = {'units': 'hey2'}
+        self.meta['New2'] = meta2
+        meta_copy = self.meta.copy()
+        assert 'NEW2' in self.meta
+        assert self.meta.var_case_name('new2') == 'New2'
+
+        self.meta.drop(['New2'])
+        assert 'new2' not in self.meta
+        assert self.meta.var_case_name('new2') == 'new2'
+        assert meta_copy.var_case_name('new2') == 'New2'
+
+        meta_copy.ho_data.pop('New2')
+        meta_copy.ho_data['Other'] = meta2
+        assert 'other' in meta_copy
+        assert meta_copy.var_case_name('OTHER') == 'Other'
+
     @raises(AttributeError)
     def test_meta_immutable(self):
 
@@ -1,3 +1,4 @@
+import pandas as pds
 import requests
 import warnings
 
@@ -67,3 +68,21 @@ class TestCDAWeb():
         assert len(war1) >= 1
         assert war1[0].category == DeprecationWarning
         assert len(war2) == 0
+
+    def test_listed_range(self):
+        """Test that cached listings cover the dates crawled"""
+        start, stop = cdw._listed_range(year=2009, month=2, day=3)
+        assert start == pds.datetime(2009, 2, 3)
+        assert stop == pds.datetime(2009, 2, 3, 23, 59, 59, 999999)
+
+        start, stop = cdw._listed_range(year=2009, month=2)
+        assert start == pds.datetime(2009, 2, 1)
+        assert stop == pds.datetime(2009, 2, 28, 23, 59, 59, 999999)
+
+        # a day without a month lists the whole year
+        for day in [None, 15]:
+            start, stop = cdw._listed_range(year=2009, day=day)
+            assert start == pds.datetime(2009, 1, 1)
+            assert stop == pds.datetime(2009, 12, 31, 23, 59, 59, 999999)
+
+        assert cdw._listed_range(month=2, day=3) == (None, None)
@@ -1,6 +1,7 @@
 from dateutil.relativedelta import relativedelta as relativedelta
 from nose.tools import raises
 import numpy as np
+import os
 import pandas as pds
 
 import pysat
@@ -104,6 +105,123 @@ class TestOrbitsUserInterface():
         self.testInst.orbits.next()
         
 
+class TestOrbitCatalog():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        info = {'index': 'mlt'}
+        self.testInst = pysat.Instrument('pysat', 'testing',
+                                         clean_level='clean',
+                                         orbit_info=info, update_files=True)
+        self.testInst.bounds = (pysat.datetime(2009, 1, 1),
+                                pysat.datetime(2009, 1, 3))
+        self.fname = self.testInst.orbits._catalog_file()
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+        del self.testInst
+
+    def test_stored_catalog(self):
+        catalog = self.testInst.orbits.build_catalog()
+        assert os.path.isfile(self.fname)
+
+        # stored orbits are used without loading data
+        self.testInst.load(2009, 10)
+        self.testInst.bounds = (pysat.datetime(2009, 1, 2),
+                                pysat.datetime(2009, 1, 3))
+        stored = self.testInst.orbits.build_catalog()
+        assert self.testInst.date == pysat.datetime(2009, 1, 10)
+        assert np.all(stored['start'].values[1:] ==
+                      catalog['start'].values[-len(stored) + 1:])
+
+        # orbits are cut at the bounds, as in a new catalog
+        fresh = self.testInst.orbits.build_catalog(use_stored=False,
+                                                   store=False)
+        assert stored.equals(fresh)
+        assert stored['start'].iloc[0] >= pysat.datetime(2009, 1, 2)
+
+    def test_stored_catalog_not_used_for_other_settings(self):
+        self.testInst.orbits.build_catalog()
+        self.testInst.custom.add(filter_data, 'modify')
+        self.testInst.load(2009, 10)
+        self.testInst.orbits.build_catalog()
+        assert self.testInst.date == pysat.datetime(2009, 1, 3)
+
+    def test_stored_catalog_not_used_for_edited_function(self):
+        def custom_func(inst):
+            inst['mlt'] = inst['mlt']
+        self.testInst.custom.add(custom_func, 'modify')
+        self.testInst.orbits.build_catalog()
+
+        def custom_func(inst):
+            inst['mlt'] = (inst['mlt'] + 1.) % 24.
+        self.testInst.custom.clear()
+        self.testInst.custom.add(custom_func, 'modify')
+        self.testInst.load(2009, 10)
+        self.testInst.orbits.build_catalog()
+        assert self.testInst.date == pysat.datetime(2009, 1, 3)
+
+    @raises(ValueError)
+    def test_load_catalog_orbit_without_catalog(self):
+        self.testInst.orbits.load_catalog_orbit(0)
+
+
+class TestOrbitStream():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        info = {'index': 'mlt'}
+        self.testInst = pysat.Instrument('pysat', 'testing',
+                                         clean_level='clean',
+                                         orbit_info=info, update_files=True)
+        self.testInst.bounds = (pysat.datetime(2009, 1, 1),
+                                pysat.datetime(2009, 1, 3))
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.testInst
+
+    def test_stream_loads_each_day_once(self):
+        dates = []
+
+        def store_date(inst):
+            dates.append(inst.date)
+        self.testInst.custom.add(store_date, 'modify')
+        for inst in self.testInst.orbits.stream():
+            pass
+        assert dates == [pysat.datetime(2009, 1, 1),
+                         pysat.datetime(2009, 1, 2),
+                         pysat.datetime(2009, 1, 3)]
+
+    def test_stream_with_pad(self):
+        pad = pds.DateOffset(minutes=5)
+        times = [(inst.index[0], inst.index[-1])
+                 for inst in self.testInst.orbits.stream()]
+        padded = [(inst.index[0], inst.index[-1])
+                  for inst in self.testInst.orbits.stream(pad={'minutes': 5})]
+        assert len(padded) == len(times)
+        # padding is limited to data within the bounds
+        assert padded[0] == (times[0][0], times[0][1] + pad)
+        assert padded[-1] == (times[-1][0] - pad, times[-1][1])
+        for (start, stop), (pad_start, pad_stop) in zip(times[1:-1],
+                                                        padded[1:-1]):
+            assert pad_start == start - pad
+            assert pad_stop == stop + pad
+
+    def test_stream_without_data_in_days(self):
+        def shift_data(inst):
+            inst.data.index = inst.data.index + pds.Timedelta('5 days')
+        self.testInst.custom.add(shift_data, 'modify')
+        orbits = [inst for inst in self.testInst.orbits.stream()]
+        assert len(orbits) == 0
+
+    @raises(ValueError)
+    def test_stream_bad_pad(self):
+        next(self.testInst.orbits.stream(pad=5))
+
+
 class TestSpecificUTOrbits():
 
     def setup(self):
@@ -148,6 +266,55 @@ class TestSpecificUTOrbits():
         assert (self.testInst.index[-1] ==
                 (pds.datetime(2009, 1, 1)-relativedelta(seconds=1)))
 
+    def test_single_orbit_calls_with_bad_orbit_index_values(self):
+        self.testInst.load(2009, 1)
+        self.testInst.orbits._calcOrbits()
+        breaks = self.testInst.orbits._orbit_breaks.copy()
+        # single bad values produce a negative gradient in local time that
+        # is followed by a large positive one, and aren't orbit breaks
+        self.testInst.data.loc[self.testInst.index[500::1000], 'mlt'] = 0.
+        self.testInst.orbits._calcOrbits()
+        assert np.all(self.testInst.orbits._orbit_breaks == breaks)
+
+    def test_orbit_is_view_of_loaded_data(self):
+        self.testInst.load(2009, 1)
+        day = self.testInst.data
+        self.testInst.orbits[2]
+        assert self.testInst.orbits._fullDayData is day
+        assert np.shares_memory(self.testInst['mlt'].values,
+                                day['mlt'].values)
+
+    def test_aggregate_list_of_stats(self):
+        self.testInst.load(2009, 1)
+        stats = self.testInst.orbits.aggregate(['count', 'max', np.ptp],
+                                               ['mlt', 'slt'])
+        assert list(stats.columns) == [('mlt', 'count'), ('mlt', 'max'),
+                                       ('mlt', 'ptp'), ('slt', 'count'),
+                                       ('slt', 'max'), ('slt', 'ptp')]
+        self.testInst.orbits[1]
+        assert stats.index[1] == self.testInst.index[0]
+        assert stats.loc[stats.index[1], ('mlt', 'count')] == \
+            len(self.testInst.index)
+        assert stats.loc[stats.index[1], ('slt', 'ptp')] == \
+            np.ptp(self.testInst['slt'])
+
+    def test_aggregate_ignores_nans(self):
+        self.testInst.load(2009, 1)
+        self.testInst.data.loc[self.testInst.index[1:10], 'mlt'] = np.nan
+        means = self.testInst.orbits.aggregate('mean', 'mlt')
+        self.testInst.orbits._getBasicOrbit(1)
+        assert np.isclose(means['mlt'].iloc[0],
+                          self.testInst['mlt'].mean())
+
+    @raises(ValueError)
+    def test_aggregate_unknown_stat(self):
+        self.testInst.load(2009, 1)
+        self.testInst.orbits.aggregate('mode', 'mlt')
+
+    def test_aggregate_no_data(self):
+        self.testInst.load(1958, 31)
+        assert self.testInst.orbits.aggregate('mean', 'mlt').empty
+
     @raises(Exception)
     def test_single_orbit_call_too_many(self):
         self.testInst.load(2008, 366)
@@ -457,6 +624,43 @@ class TestGeneralOrbitsMLT():
         check = np.all(p_time == n_time[::-1])
         assert all(control.data == self.testInst.data) & check
 
+    def test_orbit_stream_matches_orbit_iteration(self):
+        self.testInst.bounds = (pysat.datetime(2009, 1, 1),
+                                pysat.datetime(2009, 1, 3))
+        times = [(inst.index[0], inst.index[-1], len(inst.index))
+                 for inst in self.testInst.orbits]
+        stream_times = [(inst.index[0], inst.index[-1], len(inst.index))
+                        for inst in self.testInst.orbits.stream()]
+        assert stream_times == times
+
+    def test_aggregate_matches_orbit_iteration(self):
+        self.testInst.load(2009, 1)
+        stats = self.testInst.orbits.aggregate(['mean', 'median', 'std'],
+                                               ['mlt', 'slt'])
+        for i in range(self.testInst.orbits.num):
+            self.testInst.orbits._getBasicOrbit(i + 1)
+            for label in ['mlt', 'slt']:
+                values = pds.Series(self.testInst[label].values)
+                test = stats.loc[self.testInst.index[0], label]
+                assert np.allclose(test.values, [values.mean(),
+                                                 values.median(),
+                                                 values.std()])
+
+    def test_orbit_catalog_matches_orbit_iteration(self):
+        self.testInst.bounds = (pysat.datetime(2009, 1, 1),
+                                pysat.datetime(2009, 1, 3))
+        times = [(inst.index[0], inst.index[-1])
+                 for inst in self.testInst.orbits]
+        catalog = self.testInst.orbits.build_catalog(use_stored=False,
+                                                     store=False)
+        assert list(zip(catalog['start'], catalog['stop'])) == times
+
+        catalog_times = [(inst.index[0], inst.index[-1])
+                         for inst in self.testInst.orbits]
+        assert catalog_times == times
+        self.testInst.orbits.load_catalog_orbit(-1)
+        assert self.testInst.index[0] == times[-1][0]
+
 
 class TestGeneralOrbitsMLTxarray(TestGeneralOrbitsMLT):
     def setup(self):
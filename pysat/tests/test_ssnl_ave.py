@@ -2,6 +2,7 @@
 tests the pysat averaging code
 """
 from nose.tools import raises
+import json
 import numpy as np
 import pandas as pds
 import warnings
@@ -63,6 +64,58 @@ class TestBasics():
 
         assert np.all(check)
 
+    def test_median1D_statistics_of_binned_data(self):
+        """Test 1D median statistics against the data in each bin"""
+        self.testInst.bounds = self.bounds2
+        results = avg.median1D(self.testInst, [0., 24, 7], 'mlt',
+                               ['longitude', 'dummy4'], returnData=True)
+        for label in ['longitude', 'dummy4']:
+            for i, data in enumerate(results[label]['data']):
+                median = np.median(data)
+                assert results[label]['median'][i] == median
+                assert results[label]['count'][i] == len(data)
+                assert (results[label]['avg_abs_dev'][i] ==
+                        np.median(np.abs(data - median)))
+
+    def test_median2D_ignores_nans(self):
+        """Test that NaNs are dropped from the 2D median"""
+        def add_nans(inst):
+            inst['nan_dummy1'] = inst['dummy1'].astype(float)
+            inst[::2, 'nan_dummy1'] = np.nan
+        self.testInst.custom.add(add_nans, 'modify')
+        self.testInst.bounds = self.bounds2
+        results = avg.median2D(self.testInst, [0., 360., 24], 'longitude',
+                               [0., 24, 24], 'mlt',
+                               ['dummy1', 'nan_dummy1'])
+        assert np.all(results['nan_dummy1']['median'] ==
+                      results['dummy1']['median'])
+        assert (np.nansum(results['nan_dummy1']['count']) ==
+                np.nansum(results['dummy1']['count']) // 2)
+
+    def test_median2D_relative_accuracy(self):
+        """Test 2D median estimated from quantile sketches"""
+        self.testInst.bounds = self.bounds2
+        labels = ['longitude', 'dummy3']
+        exact = avg.median2D(self.testInst, [0., 360., 24], 'longitude',
+                             [0., 24, 24], 'mlt', labels)
+        results = avg.median2D(self.testInst, [0., 360., 24], 'longitude',
+                               [0., 24, 24], 'mlt', labels,
+                               relative_accuracy=0.001)
+        for label in labels:
+            assert np.all(np.abs(results[label]['median'] -
+                                 exact[label]['median']) <=
+                          0.001 * np.abs(exact[label]['median']) + 1.e-9)
+            assert np.array_equal(results[label]['count'],
+                                  exact[label]['count'])
+            assert results[label]['sketch'].shape == (24, 24)
+
+    @raises(ValueError)
+    def test_median1D_relative_accuracy_and_returnData(self):
+        """Test that data can't be returned from quantile sketches"""
+        self.testInst.bounds = self.bounds2
+        avg.median1D(self.testInst, [0., 24, 24], 'mlt', ['dummy1'],
+                     returnData=True, relative_accuracy=0.01)
+
     def test_basic_daily_mean(self):
         """ Test basic daily mean"""
         self.testInst.bounds = self.bounds1
@@ -89,6 +142,156 @@ class TestBasics():
         assert np.all(ans == 86399/2.0)
 
 
+class TestAccumulators():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.testInst = pysat.Instrument('pysat', 'testing',
+                                         clean_level='clean')
+        self.bins = [np.linspace(0., 360., 13), np.linspace(0., 24., 13)]
+        self.labels = ['longitude', 'mlt']
+        self.data_label = ['dummy1', 'dummy3']
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.testInst, self.bins, self.labels, self.data_label
+
+    def accumulate(self, accum, bounds):
+        """Update an accumulator over bounds and store it as JSON"""
+        self.testInst.bounds = bounds
+        accum.update(self.testInst)
+        return json.loads(json.dumps(accum.to_dict()))
+
+    def test_median_accumulator_merge_matches_season(self):
+        """Test merged median accumulators match a single pass"""
+        accums = [avg.MedianAccumulator(self.bins, self.labels,
+                                        self.data_label) for i in range(3)]
+        self.accumulate(accums[0], (pysat.datetime(2008, 1, 1),
+                                    pysat.datetime(2008, 1, 3)))
+        first = self.accumulate(accums[1], (pysat.datetime(2008, 1, 1),
+                                            pysat.datetime(2008, 1, 1)))
+        second = self.accumulate(accums[2], (pysat.datetime(2008, 1, 2),
+                                             pysat.datetime(2008, 1, 3)))
+        merged = avg.MedianAccumulator.from_dict(first)
+        merged.merge(avg.MedianAccumulator.from_dict(second))
+        results = merged.finalize()
+        season = accums[0].finalize()
+        for label in self.data_label:
+            for key in ['median', 'count', 'avg_abs_dev', 'bin_x', 'bin_y']:
+                assert np.array_equal(results[label][key],
+                                      season[label][key])
+
+    def test_median_accumulator_sketch_merge(self):
+        """Test merged median sketch accumulators match a single pass"""
+        accums = [avg.MedianAccumulator(self.bins, self.labels,
+                                        self.data_label,
+                                        relative_accuracy=0.01)
+                  for i in range(3)]
+        self.accumulate(accums[0], (pysat.datetime(2008, 1, 1),
+                                    pysat.datetime(2008, 1, 2)))
+        self.accumulate(accums[1], (pysat.datetime(2008, 1, 1),
+                                    pysat.datetime(2008, 1, 1)))
+        second = self.accumulate(accums[2], (pysat.datetime(2008, 1, 2),
+                                             pysat.datetime(2008, 1, 2)))
+        accums[1].merge(avg.MedianAccumulator.from_dict(second))
+        results = accums[1].finalize()
+        season = accums[0].finalize()
+        for label in self.data_label:
+            assert np.array_equal(results[label]['median'],
+                                  season[label]['median'])
+            assert np.array_equal(results[label]['count'],
+                                  season[label]['count'])
+
+    @raises(ValueError)
+    def test_median_accumulator_merge_different_bins(self):
+        """Test that accumulators with different bins can't be merged"""
+        accum = avg.MedianAccumulator(self.bins, self.labels,
+                                      self.data_label)
+        accum.merge(avg.MedianAccumulator(self.bins[::-1], self.labels,
+                                          self.data_label))
+
+    def test_mean_accumulator_merge_matches_season(self):
+        """Test merged mean accumulators match a single pass"""
+        accums = [avg.MeanAccumulator('dummy1', by='day') for i in range(3)]
+        self.accumulate(accums[0], (pysat.datetime(2008, 1, 1),
+                                    pysat.datetime(2008, 1, 3)))
+        first = self.accumulate(accums[1], (pysat.datetime(2008, 1, 1),
+                                            pysat.datetime(2008, 1, 2)))
+        second = self.accumulate(accums[2], (pysat.datetime(2008, 1, 3),
+                                             pysat.datetime(2008, 1, 3)))
+        merged = avg.MeanAccumulator.from_dict(second)
+        merged.merge(avg.MeanAccumulator.from_dict(first))
+        results = merged.finalize()
+        season = accums[0].finalize()
+        assert np.all(results.index == season.index)
+        assert np.all(results == season)
+
+    @raises(ValueError)
+    def test_mean_accumulator_merge_overlap(self):
+        """Test that accumulators over the same days can't be merged"""
+        accum = avg.MeanAccumulator('dummy1', by='day')
+        self.accumulate(accum, (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 1)))
+        accum.merge(avg.MeanAccumulator.from_dict(accum.to_dict()))
+
+    def test_stats_accumulator_statistics(self):
+        """Test statistics of several data products by day"""
+        accum = avg.StatsAccumulator(['dummy1', 'dummy4'], by='day',
+                                     stats=['count', 'mean', 'std', 'min',
+                                            'max'])
+        self.testInst.bounds = (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 2))
+        accum.update(self.testInst)
+        results = accum.finalize()
+        assert results.shape == (2, 10)
+        self.testInst.load(2008, 2)
+        for label in ['dummy1', 'dummy4']:
+            values = self.testInst[label]
+            day = results.loc[pysat.datetime(2008, 1, 2), label]
+            assert day['count'] == len(values)
+            assert np.isclose(day['mean'], values.mean())
+            assert np.isclose(day['std'], values.std())
+            assert day['min'] == values.min()
+            assert day['max'] == values.max()
+
+    def test_stats_accumulator_combines_day_added_in_parts(self):
+        """Test data added for the same day in parts is combined"""
+        stats = ['count', 'sum', 'var', 'min', 'max']
+        whole = avg.StatsAccumulator('dummy4', stats=stats)
+        parts = avg.StatsAccumulator('dummy4', stats=stats)
+        self.testInst.load(2008, 1)
+        whole.add(self.testInst)
+        data = self.testInst.data
+        for part in [data.iloc[:1000], data.iloc[1000:]]:
+            self.testInst.data = part
+            parts.add(self.testInst)
+        assert len(parts.index) == 1
+        assert np.allclose(parts.finalize(), whole.finalize())
+
+    def test_stats_accumulator_merge_matches_season(self):
+        """Test merged stats accumulators match a single pass"""
+        args = (['dummy1', 'mlt'], 'file', ['mean', 'var'])
+        accums = [avg.StatsAccumulator(*args) for i in range(3)]
+        self.accumulate(accums[0], (pysat.datetime(2008, 1, 1),
+                                    pysat.datetime(2008, 1, 3)))
+        first = self.accumulate(accums[1], (pysat.datetime(2008, 1, 1),
+                                            pysat.datetime(2008, 1, 1)))
+        second = self.accumulate(accums[2], (pysat.datetime(2008, 1, 2),
+                                             pysat.datetime(2008, 1, 3)))
+        merged = avg.StatsAccumulator.from_dict(second)
+        merged.merge(avg.StatsAccumulator.from_dict(first))
+        assert merged.finalize().equals(accums[0].finalize())
+
+    @raises(ValueError)
+    def test_stats_accumulator_unknown_stat(self):
+        """Test that unknown statistics are caught"""
+        avg.StatsAccumulator('dummy1', stats=['mean', 'median'])
+
+    @raises(ValueError)
+    def test_mean_accumulator_bad_iteration(self):
+        """Test that means must be by day, orbit, or file"""
+        avg.MeanAccumulator('dummy1', by='week')
+
+
 class TestDeprecation():
 
     def setup(self):
@@ -3,6 +3,8 @@ tests the pysat occur_prob object and code
 """
 
 from nose.tools import raises
+import json
+import numpy as np
 import warnings
 import pysat
 from pysat.ssnl import occur_prob
@@ -108,6 +110,84 @@ class TestBasics():
         assert abs(ans['slt']['bin_y'] - [-60, -20, 20, 60]).max() < 1.0e-6
         assert abs(ans['slt']['bin_z'] - [0, 12, 24]).max() < 1.0e-6
 
+    def test_occur_prob_daily_ND_matches_3D(self):
+        """Runs the N dimensional probability routine as daily 3D"""
+        bins = [[0, 360, 4], [-60, 60, 3], [0, 24, 2]]
+        labels = ['longitude', 'latitude', 'slt']
+        ans = occur_prob.dailyND(self.testInst, bins, labels,
+                                 ['slt', 'mlt'], [12., 12.], returnBins=True)
+        ans3D = occur_prob.daily3D(self.testInst, bins[0], labels[0],
+                                   bins[1], labels[1], bins[2], labels[2],
+                                   ['slt', 'mlt'], [12., 12.])
+        for label in ['slt', 'mlt']:
+            assert (ans[label]['prob']).shape == (2, 3, 4)
+            assert np.all(ans[label]['prob'] == ans3D[label]['prob'])
+            assert np.all(ans[label]['count'] == ans3D[label]['count'])
+        assert len(ans['slt']['bins']) == 3
+        assert abs(ans['slt']['bins'][2] - [0, 12, 24]).max() < 1.0e-6
+
+    def test_occur_prob_by_orbit_1D(self):
+        """Runs the N dimensional probability routine by orbit in 1D"""
+        ans = occur_prob.by_orbitND(self.testInst, [[0, 24, 2]], ['slt'],
+                                    ['slt'], [12.])
+        assert (ans['slt']['prob']).shape == (2,)
+        assert abs(ans['slt']['prob'] - [0.0, 1.0]).max() < 1.0e-6
+        assert np.all(ans['slt']['count'] > 0)
+
+    def test_occur_prob_ignores_nans(self):
+        """Days with only NaN values within a bin are not counted"""
+        def nan_dummy(inst):
+            inst['dummy1'] = np.where(inst['slt'] < 12., np.nan,
+                                      inst['dummy1'])
+        self.testInst.custom.add(nan_dummy, 'modify')
+        self.testInst.bounds = (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 3))
+        ans = occur_prob.dailyND(self.testInst, [[0, 24, 2]], ['slt'],
+                                 ['dummy1'], [-1.])
+        assert np.all(ans['dummy1']['count'] == [0, 3])
+        assert np.isnan(ans['dummy1']['prob'][0])
+        assert ans['dummy1']['prob'][1] == 1.
+
+    @raises(ValueError)
+    def test_occur_prob_daily_ND_w_mismatched_bins_and_labels(self):
+        """Catch bins that do not match the labels"""
+        occur_prob.dailyND(self.testInst, [[0, 360, 4], [-60, 60, 3]],
+                           ['longitude'], ['slt'], [12.])
+
+    def test_occurrence_accumulator_merge_matches_season(self):
+        """Test merged occurrence accumulators match a single pass"""
+        bins = [[0, 24, 4], [-60, 60, 3]]
+        args = (bins, ['slt', 'latitude'], ['slt', 'dummy1'], [12., 5.])
+        self.testInst.bounds = (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 4))
+        season = occur_prob.OccurrenceAccumulator(*args)
+        season.update(self.testInst)
+        parts = []
+        for bounds in [(pysat.datetime(2008, 1, 1),
+                        pysat.datetime(2008, 1, 2)),
+                       (pysat.datetime(2008, 1, 3),
+                        pysat.datetime(2008, 1, 4))]:
+            self.testInst.bounds = bounds
+            accum = occur_prob.OccurrenceAccumulator(*args)
+            accum.update(self.testInst)
+            parts.append(json.loads(json.dumps(accum.to_dict())))
+        merged = occur_prob.OccurrenceAccumulator.from_dict(parts[0])
+        merged.merge(occur_prob.OccurrenceAccumulator.from_dict(parts[1]))
+        results = merged.finalize()
+        for label, ans in season.finalize().items():
+            assert np.all(results[label]['count'] == ans['count'])
+            assert np.allclose(results[label]['prob'], ans['prob'],
+                               equal_nan=True)
+        assert results['slt']['count'].max() == 4
+
+    @raises(ValueError)
+    def test_occurrence_accumulator_merge_different_gate(self):
+        """Catch accumulators with different gates"""
+        accum = occur_prob.OccurrenceAccumulator([[0, 24, 2]], ['slt'],
+                                                 ['slt'], [12.])
+        accum.merge(occur_prob.OccurrenceAccumulator([[0, 24, 2]], ['slt'],
+                                                     ['slt'], [6.]))
+
 
 class TestDeprecation():
     def setup(self):
@@ -178,3 +258,33 @@ class TestDeprecation():
 
         assert len(war) >= 1
         assert war[0].category == DeprecationWarning
+
+    def test_deprecation_warning_daily_ND(self):
+        """Test if occur_prob.dailyND is deprecated"""
+
+        with warnings.catch_warnings(record=True) as war:
+            try:
+                occur_prob.dailyND(None, [[0, 24, 2], [-60, 60, 3]],
+                                   ['slt', 'latitude'], ['slt'], [12.])
+            except TypeError:
+                # Setting inst to None should produce a TypeError after
+                # warning is generated
+                pass
+
+        assert len(war) >= 1
+        assert war[0].category == DeprecationWarning
+
+    def test_deprecation_warning_by_orbit_ND(self):
+        """Test if occur_prob.by_orbitND is deprecated"""
+
+        with warnings.catch_warnings(record=True) as war:
+            try:
+                occur_prob.by_orbitND(None, [[0, 24, 2], [-60, 60, 3]],
+                                      ['slt', 'latitude'], ['slt'], [12.])
+            except AttributeError:
+                # Setting inst to None should produce a AttributeError after
+                # warning is generated
+                pass
+
+        assert len(war) >= 1
+        assert war[0].category == DeprecationWarning
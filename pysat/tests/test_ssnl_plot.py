@@ -2,8 +2,11 @@
 tests the pysat averaging code
 """
 
+import json
 import matplotlib as mpl
 import matplotlib.pyplot as plt
+from nose.tools import raises
+import numpy as np
 import warnings
 import pysat
 from pysat.ssnl import plot
@@ -72,6 +75,71 @@ class TestBasics():
         assert len(axes) == 3
         assert len(axes2) == 3
 
+    def test_rasterized_scatterplot(self):
+        """Check if a rasterized scatterplot generates"""
+        figs = plot.scatterplot(self.testInst, 'longitude', 'latitude',
+                                ['slt', 'mlt'], [0.0, 24.0],
+                                xlim=[0, 360], ylim=[-90, 90],
+                                raster=(36, 18), raster_stat='max')
+
+        axes = figs[0].get_axes()
+        assert len(figs) == 2
+        assert len(axes) == 3
+        assert axes[1].get_xlim() == (0, 360)
+        assert axes[1].get_ylim() == (-90, 90)
+
+    @raises(ValueError)
+    def test_rasterized_scatterplot_without_limits(self):
+        """Check that a raster requires the plot limits"""
+        plot.scatterplot(self.testInst, 'longitude', 'latitude', 'slt',
+                         [0.0, 24.0], raster=10)
+
+    def test_raster_accumulator_pixels(self):
+        """Check pixel count, mean, and maximum of accumulated samples"""
+        accum = plot.RasterAccumulator('longitude', 'latitude', 'slt',
+                                       [0, 360], [-90, 90], shape=(4, 2))
+        accum.update(self.testInst)
+        pixels = accum.finalize()['slt']
+        assert pixels['count'].shape == (2, 4)
+
+        self.testInst.load(2008, 1)
+        data = self.testInst.data
+        xind = np.digitize(data['longitude'], accum.xedges) - 1
+        yind = np.digitize(data['latitude'], accum.yedges) - 1
+        for j in range(2):
+            for i in range(4):
+                values = data['slt'][(xind == i) & (yind == j)]
+                assert pixels['count'][j, i] == len(values)
+                assert np.isclose(pixels['mean'][j, i], values.mean())
+                assert pixels['max'][j, i] == values.max()
+
+    def test_raster_accumulator_merge(self):
+        """Check merged raster accumulators match a single pass"""
+        args = ('longitude', 'latitude', ['slt', 'mlt'], [0, 360], [-90, 90])
+        self.testInst.bounds = (pysat.datetime(2008, 1, 1),
+                                pysat.datetime(2008, 1, 2))
+        season = plot.RasterAccumulator(*args, shape=(36, 18))
+        season.update(self.testInst)
+        merged = plot.RasterAccumulator(*args, shape=(36, 18))
+        for day in [1, 2]:
+            self.testInst.load(2008, day)
+            accum = plot.RasterAccumulator(*args, shape=(36, 18))
+            accum.add(self.testInst)
+            accum = json.loads(json.dumps(accum.to_dict()))
+            merged.merge(plot.RasterAccumulator.from_dict(accum))
+        for label, pixels in season.finalize().items():
+            for stat in ['count', 'mean', 'max']:
+                assert np.allclose(merged.finalize()[label][stat],
+                                   pixels[stat], equal_nan=True)
+
+    @raises(ValueError)
+    def test_raster_accumulator_merge_different_grid(self):
+        """Check accumulators with different grids can't be merged"""
+        accum = plot.RasterAccumulator('longitude', 'latitude', 'slt',
+                                       [0, 360], [-90, 90], shape=10)
+        accum.merge(plot.RasterAccumulator('longitude', 'latitude', 'slt',
+                                           [0, 360], [-90, 90], shape=20))
+
 
 class TestDeprecation():
     def setup(self):
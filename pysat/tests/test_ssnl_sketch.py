@@ -0,0 +1,84 @@
+"""
+tests the pysat quantile sketch code
+"""
+import json
+
+from nose.tools import raises
+import numpy as np
+
+from pysat.ssnl.sketch import BinnedQuantileSketch
+
+
+class TestBinnedQuantileSketch():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        rng = np.random.RandomState(0)
+        self.ids = rng.randint(0, 6, 10000)
+        self.values = rng.lognormal(0., 2., 10000) * \
+            np.where(rng.rand(10000) < 0.3, -1., 1.)
+        self.values[::100] = 0.
+        self.sketch = BinnedQuantileSketch((2, 3), relative_accuracy=0.01)
+        self.sketch.update(self.ids, self.values)
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.ids, self.values, self.sketch
+
+    def test_quantiles_within_relative_accuracy(self):
+        quantiles = self.sketch.quantile([0., 0.1, 0.5, 0.99, 1.])
+        assert quantiles.shape == (5, 2, 3)
+        for i, q in enumerate([0., 0.1, 0.5, 0.99, 1.]):
+            for j in range(6):
+                values = np.sort(self.values[self.ids == j])
+                exact = values[int(np.floor(q * (len(values) - 1)))]
+                assert (abs(quantiles[i].ravel()[j] - exact) <=
+                        0.01 * abs(exact) * (1. + 1.e-9))
+
+    def test_median_and_avg_abs_dev(self):
+        median = self.sketch.median().ravel()
+        dev = self.sketch.avg_abs_dev().ravel()
+        for j in range(6):
+            values = np.sort(self.values[self.ids == j])
+            exact = np.median(values)
+            exact_dev = np.median(np.abs(values - exact))
+            middle = values[[(len(values) - 1) // 2, len(values) // 2]]
+            assert (abs(median[j] - exact) <=
+                    0.01 * np.abs(middle).max() * (1. + 1.e-9))
+            assert abs(dev[j] - exact_dev) <= 0.02 * exact_dev
+        assert np.all(self.sketch.count().ravel() ==
+                      np.bincount(self.ids, minlength=6))
+
+    def test_merge(self):
+        first = BinnedQuantileSketch((2, 3), relative_accuracy=0.01)
+        first.update(self.ids[:4000], self.values[:4000])
+        second = BinnedQuantileSketch((2, 3), relative_accuracy=0.01)
+        second.update(self.ids[4000:], self.values[4000:])
+        first.merge(second)
+        assert np.all(first.keys == self.sketch.keys)
+        assert np.all(first.counts == self.sketch.counts)
+
+    def test_dict_round_trip(self):
+        sketch_dict = json.loads(json.dumps(self.sketch.to_dict()))
+        sketch = BinnedQuantileSketch.from_dict(sketch_dict)
+        assert sketch.shape == self.sketch.shape
+        assert np.all(sketch.median() == self.sketch.median())
+
+    def test_empty_bins(self):
+        sketch = BinnedQuantileSketch(4)
+        sketch.update([1, 1], [np.nan, 2.])
+        median = sketch.median()
+        assert np.all(np.isnan(median[[0, 2, 3]]))
+        assert abs(median[1] - 2.) <= 0.01 * 2.
+        assert np.all(sketch.count() == [0, 1, 0, 0])
+
+    @raises(ValueError)
+    def test_merge_different_shape(self):
+        self.sketch.merge(BinnedQuantileSketch(6, relative_accuracy=0.01))
+
+    @raises(ValueError)
+    def test_update_with_objects(self):
+        self.sketch.update([0], np.array(['a'], dtype=object))
+
+    @raises(ValueError)
+    def test_bad_relative_accuracy(self):
+        BinnedQuantileSketch(6, relative_accuracy=1.)
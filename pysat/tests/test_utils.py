@@ -94,6 +94,12 @@ class TestBasics():
 
         assert check1 & check2
 
+    def test_set_data_dir_unicode(self):
+        """update data_dir with a unicode path"""
+        pysat.utils.set_data_dir(u'.', store=False)
+        assert pysat.data_dir == u'.'
+        assert pysat.data_dirs == [u'.']
+
     @raises(ValueError)
     def test_set_data_dir_wrong_path(self):
         """update data_dir with an invalid path"""
@@ -283,6 +289,152 @@ class TestBasicNetCDF4():
         for key in keys:
             assert(np.all(self.testInst[key] == loaded_inst[key]))
 
+    def write_days(self, inst, days):
+        """Write one netCDF4 file per day, returning the filenames"""
+        fnames = []
+        for day in days:
+            inst.load(2009, day)
+            fnames.append(os.path.join(inst.files.data_path,
+                                       'pysat_test_ncdf_{:d}.nc'.format(day)))
+            inst.to_netcdf4(fnames[-1])
+        return fnames
+
+    def test_read_multiple_netcdf4(self):
+        prep_dir(self.testInst)
+        fnames = self.write_days(self.testInst, [1, 2, 3])
+        try:
+            serial, meta = pysat.utils.load_netcdf4(fnames)
+            parallel, pmeta = pysat.utils.load_netcdf4(fnames, n_workers=2)
+        finally:
+            for fname in fnames:
+                os.remove(fname)
+
+        assert len(serial) == 3 * len(self.testInst.data)
+        assert serial.index.is_monotonic_increasing
+        assert np.all(serial.index == parallel.index)
+        for key in self.testInst.data.columns:
+            assert np.all(serial[key] == parallel[key])
+            assert np.all(serial[key].iloc[-len(self.testInst.data):]
+                          == self.testInst[key])
+        assert meta == pmeta
+
+    def test_read_multiple_netcdf4_higher_order(self):
+        test_inst = pysat.Instrument('pysat', 'testing2d')
+        prep_dir(test_inst)
+        fnames = self.write_days(test_inst, [1, 2])
+        try:
+            loaded, meta = pysat.utils.load_netcdf4(fnames, n_workers=2)
+        finally:
+            for fname in fnames:
+                os.remove(fname)
+
+        assert len(loaded) == 2 * len(test_inst.data)
+        for frame1, frame2 in zip(test_inst['profiles'],
+                                  loaded['profiles'].iloc[len(test_inst.data):]):
+            assert np.all((frame1 == frame2).all())
+        assert 'profiles' in meta.keys_nD()
+
+    @raises(ValueError)
+    def test_read_multiple_netcdf4_strict_meta(self):
+        prep_dir(self.testInst)
+        fnames = self.write_days(self.testInst, [1, 2])
+        self.testInst.meta['mlt'] = {self.testInst.meta.units_label: 'min'}
+        self.testInst.to_netcdf4(fnames[-1])
+        try:
+            pysat.utils.load_netcdf4(fnames, strict_meta=True)
+        finally:
+            for fname in fnames:
+                os.remove(fname)
+
+    def test_read_multiple_netcdf4_cached_meta(self):
+        prep_dir(self.testInst)
+        fnames = self.write_days(self.testInst, [1, 2])
+        try:
+            _, meta1 = pysat.utils.load_netcdf4(fnames[0])
+            meta1['mlt'] = {meta1.units_label: 'min'}
+            _, meta2 = pysat.utils.load_netcdf4(fnames[1])
+            assert meta2['mlt', meta2.units_label] == 'hours'
+            assert meta1.Date_End != meta2.Date_End
+
+            self.testInst.meta['mlt'] = {self.testInst.meta.units_label: 's'}
+            self.testInst.to_netcdf4(fnames[1])
+            _, meta2 = pysat.utils.load_netcdf4(fnames[1])
+            assert meta2['mlt', meta2.units_label] == 's'
+        finally:
+            for fname in fnames:
+                os.remove(fname)
+
+    def test_netcdf4_writer(self):
+        prep_dir(self.testInst)
+        outfile = os.path.join(self.testInst.files.data_path,
+                               'pysat_test_ncdf.nc')
+        self.testInst.bounds = (pysat.datetime(2009, 1, 1),
+                                pysat.datetime(2009, 1, 3))
+        days = []
+        with pysat.utils.NetCDF4Writer(outfile) as writer:
+            for inst in self.testInst:
+                writer.append(inst)
+                days.append(inst.data.copy())
+        loaded, meta = pysat.utils.load_netcdf4(outfile)
+        data = pysat.DataFrame.append(days[0], days[1:])
+
+        assert len(loaded) == len(data)
+        assert np.all(loaded.index == data.index)
+        for key in data.columns:
+            assert np.all(loaded[key] == data[key])
+        assert meta.Date_End.startswith(data.index[-1].strftime('%a, %d %b'))
+
+    def test_netcdf4_writer_higher_order(self):
+        test_inst = pysat.Instrument('pysat', 'testing2d')
+        prep_dir(test_inst)
+        outfile = os.path.join(test_inst.files.data_path, 'pysat_test_ncdf.nc')
+        writer = pysat.utils.NetCDF4Writer(outfile, zlib=True)
+        for day in [1, 2]:
+            test_inst.load(2009, day)
+            writer.append(test_inst)
+        assert len(writer) == 2 * len(test_inst.index)
+        writer.close()
+        loaded, meta = pysat.utils.load_netcdf4(outfile)
+
+        assert len(loaded) == 2 * len(test_inst.index)
+        for key in ['profiles', 'alt_profiles', 'series_profiles']:
+            for frame1, frame2 in zip(test_inst[key],
+                                      loaded[key].iloc[len(test_inst.index):]):
+                assert np.all((frame1 == frame2).all())
+                assert np.all(frame1.index == frame2.index)
+
+    @raises(ValueError)
+    def test_netcdf4_writer_mismatched_variables(self):
+        prep_dir(self.testInst)
+        outfile = os.path.join(self.testInst.files.data_path,
+                               'pysat_test_ncdf.nc')
+        with pysat.utils.NetCDF4Writer(outfile) as writer:
+            self.testInst.load(2009, 1)
+            writer.append(self.testInst)
+            self.testInst.load(2009, 2)
+            self.testInst['new_variable'] = 1.
+            writer.append(self.testInst)
+
+    @raises(ValueError)
+    def test_netcdf4_writer_overlapping_times(self):
+        prep_dir(self.testInst)
+        outfile = os.path.join(self.testInst.files.data_path,
+                               'pysat_test_ncdf.nc')
+        with pysat.utils.NetCDF4Writer(outfile) as writer:
+            self.testInst.load(2009, 1)
+            writer.append(self.testInst)
+            writer.append(self.testInst)
+
+    @raises(ValueError)
+    def test_netcdf4_writer_unordered_times(self):
+        prep_dir(self.testInst)
+        outfile = os.path.join(self.testInst.files.data_path,
+                               'pysat_test_ncdf.nc')
+        self.testInst.load(2009, 1)
+        self.testInst.data = self.testInst.data.iloc[::-1]
+        with pysat.utils.NetCDF4Writer(outfile) as writer:
+            writer.append(self.testInst)
+
     def test_basic_write_and_read_netcdf4_mixed_case_format(self):
         # create a bunch of files by year and doy
         prep_dir(self.testInst)
@@ -438,6 +590,38 @@ class TestBasicNetCDF4():
         assert (np.all((test_inst.data == loaded_inst).all()))
         assert np.all(test_list)
 
+    def test_read_netcdf4_higher_order_index(self):
+        test_inst = pysat.Instrument('pysat', 'testing2d')
+        prep_dir(test_inst)
+        outfile = os.path.join(test_inst.files.data_path, 'pysat_test_ncdf.nc')
+        test_inst.load(2009, 1)
+        test_inst.to_netcdf4(outfile)
+        loaded_inst, meta = pysat.utils.load_netcdf4(outfile)
+
+        # each time has its own index
+        for key in ['profiles', 'alt_profiles', 'series_profiles']:
+            for i in [0, -1]:
+                frame1 = test_inst[key].iloc[i]
+                frame2 = loaded_inst[key].iloc[i]
+                assert np.all(frame1.index == frame2.index)
+                assert frame1.shape == frame2.shape
+
+    def test_read_netcdf4_higher_order_built_when_used(self):
+        test_inst = pysat.Instrument('pysat', 'testing2d')
+        prep_dir(test_inst)
+        outfile = os.path.join(test_inst.files.data_path, 'pysat_test_ncdf.nc')
+        test_inst.load(2009, 1)
+        test_inst.to_netcdf4(outfile)
+        loaded_inst, meta = pysat.utils.load_netcdf4(outfile)
+
+        frames = loaded_inst['profiles']
+        assert all([frame._lazy_data is None for frame in frames.values])
+        frame = frames.iloc[3]
+        assert isinstance(frame, pds.DataFrame)
+        assert np.all(frame == test_inst['profiles'].iloc[3])
+        assert frame._lazy_data is not None
+        assert frames.iloc[4]._lazy_data is None
+
     def test_netcdf_prevent_attribute_override(self):
         """Test that attributes will not be overridden by default"""
         self.testInst.load(2009, 1)
@@ -0,0 +1,187 @@
+"""
+tests the pysat utils.compression area
+"""
+import bz2
+import gzip
+import io
+import os
+import shutil
+import tempfile
+
+from nose.tools import raises
+import numpy as np
+
+import pysat
+from pysat.utils import compression
+
+
+class TestCompression():
+
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.text = 'line one\nline two\n'
+        self.fname = os.path.join(self.temp_dir, 'test_file.txt')
+        with open(self.fname, 'w') as fout:
+            fout.write(self.text)
+        with gzip.open(self.fname + '.gz', 'wb') as fout:
+            fout.write(self.text.encode('utf-8'))
+        with bz2.BZ2File(self.fname + '.bz2', 'wb') as fout:
+            fout.write(self.text.encode('utf-8'))
+
+        self.saved_scratch = (compression.scratch_dir,
+                              compression.scratch_size)
+        compression.scratch_dir = os.path.join(self.temp_dir, 'scratch')
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        compression.scratch_dir, compression.scratch_size = self.saved_scratch
+        shutil.rmtree(self.temp_dir)
+
+    def test_split_compression_ext(self):
+        assert compression.split_compression_ext('a.nc.gz') == ('a.nc', '.gz')
+        assert compression.split_compression_ext('a.nc.zst') == ('a.nc',
+                                                                 '.zst')
+        assert compression.split_compression_ext('a.nc') == ('a.nc', '')
+
+    def test_is_compressed(self):
+        assert compression.is_compressed(self.fname + '.bz2')
+        assert not compression.is_compressed(self.fname)
+
+    def test_open_file_text(self):
+        for ext in ['', '.gz', '.bz2']:
+            with compression.open_file(self.fname + ext) as fin:
+                assert fin.readline() == 'line one\n'
+                assert fin.read() == 'line two\n'
+
+    def test_open_file_text_encoding(self):
+        text = u'temperature \u00b0C\n'
+        with gzip.open(self.fname + '.gz', 'wb') as fout:
+            fout.write(text.encode('latin-1'))
+        with compression.open_file(self.fname + '.gz',
+                                   encoding='latin-1') as fin:
+            assert fin.read() == text
+
+    def test_open_file_xz(self):
+        try:
+            import lzma
+        except ImportError:
+            return
+        with lzma.open(self.fname + '.xz', 'wb') as fout:
+            fout.write(self.text.encode('utf-8'))
+        with compression.open_file(self.fname + '.xz') as fin:
+            assert fin.read() == self.text
+
+    def test_raw_reader(self):
+        # used for bz2 files on Python 2
+        raw = compression._RawReader(bz2.BZ2File(self.fname + '.bz2', 'rb'))
+        with io.TextIOWrapper(io.BufferedReader(raw),
+                              encoding='utf-8') as fin:
+            assert fin.readline() == 'line one\n'
+            assert fin.read() == 'line two\n'
+        assert raw.closed
+
+    def test_read_file(self):
+        for ext in ['', '.gz', '.bz2']:
+            fbytes = compression.read_file(self.fname + ext)
+            assert fbytes == self.text.encode('utf-8')
+
+    @raises(ValueError)
+    def test_open_file_for_writing(self):
+        compression.open_file(self.fname + '.gz', 'w')
+
+    def test_scratch_copy_uncompressed(self):
+        assert compression.scratch_copy(self.fname) == self.fname
+
+    def test_scratch_copy(self):
+        copy_name = compression.scratch_copy(self.fname + '.gz')
+        assert os.path.dirname(copy_name) == compression.scratch_dir
+        with open(copy_name, 'r') as fin:
+            assert fin.read() == self.text
+
+        # an unchanged file reuses the same copy
+        assert compression.scratch_copy(self.fname + '.gz') == copy_name
+
+    def test_scratch_copy_size_limit(self):
+        compression.scratch_size = len(self.text)
+        gz_copy = compression.scratch_copy(self.fname + '.gz')
+        bz2_copy = compression.scratch_copy(self.fname + '.bz2')
+        assert not os.path.isfile(gz_copy)
+        assert os.path.isfile(bz2_copy)
+
+
+class TestCompressedFiles():
+
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        # store current pysat directory
+        self.data_path = pysat.data_dir
+        self.temp_dir = tempfile.mkdtemp()
+        pysat.utils.set_data_dir(self.temp_dir, store=False)
+
+        self.testInst = pysat.Instrument(platform='pysat', name='testing',
+                                         sat_id='100', clean_level='clean')
+        self.testInst.load(2009, 1)
+        self.fname = os.path.join(self.temp_dir, 'pysat_test_ncdf.nc')
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        pysat.utils.set_data_dir(self.data_path, store=False)
+        shutil.rmtree(self.temp_dir)
+        del self.testInst
+
+    def compress(self, fname):
+        with open(fname, 'rb') as fin:
+            with gzip.open(fname + '.gz', 'wb') as fout:
+                shutil.copyfileobj(fin, fout)
+        os.remove(fname)
+        return fname + '.gz'
+
+    def test_from_os_finds_compressed_files(self):
+        fmt = 'pysat_test_{year:04d}{month:02d}{day:02d}.nc'
+        for day in [1, 2]:
+            fname = os.path.join(self.temp_dir, fmt.format(year=2009, month=1,
+                                                           day=day))
+            with open(fname, 'w') as fout:
+                fout.write('test')
+        self.compress(fname)
+
+        files = pysat.Files.from_os(data_path=self.temp_dir, format_str=fmt)
+        assert len(files) == 2
+        assert files[pysat.datetime(2009, 1, 2)].endswith('.nc.gz')
+
+    def test_from_os_prefers_uncompressed_files(self):
+        fmt = 'pysat_test_{year:04d}{month:02d}{day:02d}.nc'
+        fname = os.path.join(self.temp_dir, fmt.format(year=2009, month=1,
+                                                       day=1))
+        with open(fname, 'w') as fout:
+            fout.write('test')
+        self.compress(fname)
+        with open(fname, 'w') as fout:
+            fout.write('test')
+
+        for search_str in ['pysat_test_????????.nc', 'pysat_test_*']:
+            files = pysat._files.search_local_system_formatted_filename(
+                self.temp_dir, search_str)
+            assert files == [os.path.sep + os.path.basename(fname)] or \
+                files == [os.path.basename(fname)]
+        files = pysat.Files.from_os(data_path=self.temp_dir, format_str=fmt)
+        assert len(files) == 1
+        assert files[pysat.datetime(2009, 1, 1)].endswith('.nc')
+
+    def test_load_compressed_netcdf4(self):
+        self.testInst.to_netcdf4(self.fname)
+        plain, _ = pysat.utils.load_netcdf4(self.fname)
+        loaded, meta = pysat.utils.load_netcdf4(self.compress(self.fname))
+
+        assert np.all(plain.columns == loaded.columns)
+        for key in plain.columns:
+            assert np.all(plain[key] == loaded[key])
+
+    def test_load_compressed_netcdf4_xarray(self):
+        self.testInst.to_netcdf4(self.fname)
+        plain, _ = pysat.utils.load_netcdf4(self.fname, pandas_format=False)
+        loaded, _ = pysat.utils.load_netcdf4(self.compress(self.fname),
+                                             pandas_format=False)
+        for key in plain.variables:
+            assert np.all(plain[key].values == loaded[key].values)
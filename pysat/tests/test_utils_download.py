@@ -0,0 +1,334 @@
+"""
+tests the pysat utils.download area
+"""
+from email.utils import formatdate
+import functools
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from nose.tools import raises
+import numpy as np
+import pandas as pds
+import requests
+
+from pysat.utils import download
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+
+class _TestHandler(BaseHTTPRequestHandler):
+    """Serves the files in server.files, failing as set by server.fails"""
+
+    def send_empty(self, code):
+        self.send_response(code)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_HEAD(self):
+        self.server.methods.append('HEAD')
+        content = self.server.files.get(self.path)
+        if content is None:
+            self.send_empty(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('ETag', self.server.etag)
+        self.send_header('Last-Modified', formatdate(self.server.mtime,
+                                                     usegmt=True))
+        self.end_headers()
+
+    def do_GET(self):
+        self.server.methods.append('GET')
+        self.server.requests.append(self.path)
+        self.server.headers.append(self.headers)
+        if self.server.fails.get(self.path, 0) > 0:
+            self.server.fails[self.path] -= 1
+            self.send_empty(503)
+            return
+
+        content = self.server.files.get(self.path)
+        if content is None:
+            self.send_empty(404)
+            return
+
+        start = 0
+        if (self.headers.get('Range') is not None
+                and self.headers.get('If-Range') == self.server.etag):
+            start = int(self.headers['Range'][6:-1])
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes {:d}-{:d}/{:d}'.format(
+                start, len(content) - 1, len(content)))
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(content) - start))
+        self.send_header('ETag', self.server.etag)
+        self.send_header('Last-Modified', formatdate(self.server.mtime,
+                                                     usegmt=True))
+        self.end_headers()
+
+        # drop the connection part way through, if requested
+        if self.server.drops.get(self.path, 0) > 0:
+            self.server.drops[self.path] -= 1
+            self.wfile.write(content[start:start + 100])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(content[start:])
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDownload():
+
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.server = HTTPServer(('127.0.0.1', 0), _TestHandler)
+        self.server.files = {'/file_{:d}.txt'.format(i):
+                             'data {:d}\n'.format(i).encode('utf-8') * 100
+                             for i in range(5)}
+        self.server.fails = {}
+        self.server.drops = {}
+        self.server.requests = []
+        self.server.headers = []
+        self.server.methods = []
+        self.server.etag = '"version1"'
+        self.server.mtime = 1500000000
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = 'http://127.0.0.1:{:d}'.format(self.server.server_port)
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        shutil.rmtree(self.temp_dir)
+
+    def check_file(self, fname, remote_name):
+        with open(fname, 'rb') as fin:
+            assert fin.read() == self.server.files[remote_name]
+        assert not os.path.isfile(fname + '.part')
+
+    def test_download_file(self):
+        fname = os.path.join(self.temp_dir, 'file_0.txt')
+        assert download.download_file(self.url + '/file_0.txt', fname)
+        self.check_file(fname, '/file_0.txt')
+
+    def test_download_missing_file(self):
+        fname = os.path.join(self.temp_dir, 'missing.txt')
+        assert not download.download_file(self.url + '/missing.txt', fname)
+        assert not os.path.isfile(fname)
+        assert not os.path.isfile(fname + '.part')
+
+    def test_download_retries(self):
+        self.server.fails['/file_1.txt'] = 2
+        fname = os.path.join(self.temp_dir, 'file_1.txt')
+        assert download.download_file(self.url + '/file_1.txt', fname,
+                                      backoff=0.01)
+        self.check_file(fname, '/file_1.txt')
+        assert self.server.requests.count('/file_1.txt') == 3
+
+    @raises(requests.exceptions.HTTPError)
+    def test_download_retries_exhausted(self):
+        self.server.fails['/file_1.txt'] = 5
+        fname = os.path.join(self.temp_dir, 'file_1.txt')
+        try:
+            download.download_file(self.url + '/file_1.txt', fname,
+                                   retries=1, backoff=0.01)
+        finally:
+            assert not os.path.isfile(fname)
+            assert not os.path.isfile(fname + '.part')
+
+    def test_download_files(self):
+        remote = sorted(self.server.files.keys()) + ['/missing.txt']
+        fnames = [os.path.join(self.temp_dir, rname[1:]) for rname in remote]
+        found = download.download_files([self.url + rname
+                                         for rname in remote], fnames,
+                                        n_workers=3)
+        assert found == [True] * 5 + [False]
+        for fname, rname in zip(fnames[:-1], remote[:-1]):
+            self.check_file(fname, rname)
+
+    def test_download_files_logs_errors(self):
+        self.server.fails['/file_2.txt'] = 5
+        remote = ['/file_2.txt', '/file_3.txt']
+        fnames = [os.path.join(self.temp_dir, rname[1:]) for rname in remote]
+        found = download.download_files([self.url + rname
+                                         for rname in remote], fnames,
+                                        n_workers=2, retries=0)
+        assert found == [False, True]
+
+    def test_download_sets_remote_mtime(self):
+        fname = os.path.join(self.temp_dir, 'file_0.txt')
+        download.download_file(self.url + '/file_0.txt', fname)
+        assert os.path.getmtime(fname) == self.server.mtime
+
+    def test_skip_unchanged(self):
+        fname = os.path.join(self.temp_dir, 'file_0.txt')
+        download.download_file(self.url + '/file_0.txt', fname)
+        assert self.server.methods == ['GET']
+
+        # the local file matches the remote size and time, so only the
+        # headers are requested
+        assert download.download_file(self.url + '/file_0.txt', fname)
+        assert self.server.methods == ['GET', 'HEAD']
+
+        # unless requested
+        assert download.download_file(self.url + '/file_0.txt', fname,
+                                      skip_unchanged=False)
+        assert self.server.methods == ['GET', 'HEAD', 'GET']
+        self.check_file(fname, '/file_0.txt')
+
+    def test_changed_local_file_downloaded(self):
+        fname = os.path.join(self.temp_dir, 'file_0.txt')
+        download.download_file(self.url + '/file_0.txt', fname)
+        with open(fname, 'ab') as fout:
+            fout.write(b'local change')
+        os.utime(fname, (time.time(), time.time()))
+
+        # a newer local file with a different size is fetched again
+        assert download.download_file(self.url + '/file_0.txt', fname)
+        self.check_file(fname, '/file_0.txt')
+
+    def test_updated_file_downloaded(self):
+        fname = os.path.join(self.temp_dir, 'file_0.txt')
+        download.download_file(self.url + '/file_0.txt', fname)
+        self.server.files['/file_0.txt'] = b'new version'
+        self.server.mtime += 100
+        assert download.download_file(self.url + '/file_0.txt', fname)
+        self.check_file(fname, '/file_0.txt')
+
+    def test_resume_download(self):
+        self.server.drops['/file_1.txt'] = 1
+        fname = os.path.join(self.temp_dir, 'file_1.txt')
+        assert download.download_file(self.url + '/file_1.txt', fname,
+                                      backoff=0.01, chunk_size=10)
+        self.check_file(fname, '/file_1.txt')
+        assert self.server.headers[-1]['Range'] == 'bytes=100-'
+        assert not os.path.isfile(fname + '.part.info')
+
+    def test_resume_download_later(self):
+        self.server.drops['/file_1.txt'] = 1
+        fname = os.path.join(self.temp_dir, 'file_1.txt')
+        try:
+            download.download_file(self.url + '/file_1.txt', fname,
+                                   retries=0, chunk_size=10)
+        except requests.exceptions.RequestException:
+            pass
+        assert os.path.getsize(fname + '.part') == 100
+
+        assert download.download_file(self.url + '/file_1.txt', fname)
+        self.check_file(fname, '/file_1.txt')
+        assert len(self.server.requests) == 2
+
+    def test_resume_changed_file(self):
+        self.server.drops['/file_1.txt'] = 1
+        fname = os.path.join(self.temp_dir, 'file_1.txt')
+        try:
+            download.download_file(self.url + '/file_1.txt', fname,
+                                   retries=0, chunk_size=10)
+        except requests.exceptions.RequestException:
+            pass
+
+        # remote file changed, so the partial download is discarded
+        self.server.etag = '"version2"'
+        self.server.files['/file_1.txt'] = b'new version'
+        assert download.download_file(self.url + '/file_1.txt', fname)
+        self.check_file(fname, '/file_1.txt')
+
+    @raises(ValueError)
+    def test_download_files_bad_input(self):
+        download.download_files([self.url + '/file_0.txt'], [])
+
+
+class TestCachedFileList():
+
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.saved = (download.remote_list_dir, download.remote_list_ttl)
+        download.remote_list_dir = os.path.join(self.temp_dir, 'lists')
+        self.dates = pds.date_range('2009-01-01', '2010-12-31', freq='D')
+        self.calls = []
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        download.remote_list_dir, download.remote_list_ttl = self.saved
+        shutil.rmtree(self.temp_dir)
+
+    def list_rtn(self, start=None, stop=None, version=1):
+        self.calls.append((start, stop))
+        dates = pds.Series(self.dates, index=self.dates)[start:stop].index
+        return pds.Series(['file_{:s}_v{:d}'.format(date.strftime('%Y%j'),
+                                                    version)
+                           for date in dates], index=dates)
+
+    def cached_list(self, start=None, stop=None, version=1, ttl=None):
+        list_rtn = functools.partial(self.list_rtn, start=start, stop=stop,
+                                     version=version)
+        return download.cached_file_list('test listing', list_rtn,
+                                         start=start, stop=stop, ttl=ttl)
+
+    def test_listing_reused(self):
+        files = self.cached_list()
+        assert len(files) == len(self.dates)
+        assert os.path.isdir(download.remote_list_dir)
+
+        again = self.cached_list()
+        assert len(self.calls) == 1
+        assert np.all(files == again)
+        assert np.all(files.index == again.index)
+
+    def test_covered_range_reused(self):
+        self.cached_list()
+        files = self.cached_list(start=pds.datetime(2009, 2, 1),
+                                 stop=pds.datetime(2009, 2, 28))
+        assert len(self.calls) == 1
+        assert len(files) == 28
+        assert files.index[0] == pds.datetime(2009, 2, 1)
+
+    def test_uncovered_range_listed(self):
+        self.cached_list(start=pds.datetime(2009, 1, 1),
+                         stop=pds.datetime(2009, 12, 31))
+        files = self.cached_list(start=pds.datetime(2010, 1, 1),
+                                 stop=pds.datetime(2010, 12, 31))
+        assert len(self.calls) == 2
+        assert files.index[0] == pds.datetime(2010, 1, 1)
+
+        # both years are now stored
+        self.cached_list(start=pds.datetime(2009, 6, 1),
+                         stop=pds.datetime(2009, 6, 30))
+        self.cached_list(start=pds.datetime(2010, 6, 1),
+                         stop=pds.datetime(2010, 6, 30))
+        assert len(self.calls) == 2
+
+    def test_relisted_range_replaced(self):
+        self.cached_list()
+        files = self.cached_list(start=pds.datetime(2009, 2, 1),
+                                 stop=pds.datetime(2009, 2, 28), version=2,
+                                 ttl=0)
+        assert len(self.calls) == 2
+        assert files.values[0].endswith('v2')
+
+        # updated files are stored, others kept
+        files = self.cached_list()
+        assert len(self.calls) == 2
+        assert len(files) == len(self.dates)
+        assert files[pds.datetime(2009, 2, 1)].endswith('v2')
+        assert files[pds.datetime(2009, 3, 1)].endswith('v1')
+
+    def test_expired_listing(self):
+        self.cached_list()
+        download.remote_list_ttl = 0.1
+        time.sleep(0.2)
+        self.cached_list()
+        assert len(self.calls) == 2
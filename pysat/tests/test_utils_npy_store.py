@@ -0,0 +1,88 @@
+"""
+tests the pysat utils.npy_store area
+"""
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import pysat
+from pysat.instruments.templates import npy_pandas
+from pysat.utils import npy_store
+
+
+class TestNpyStore():
+
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        # store current pysat directory
+        self.data_path = pysat.data_dir
+        self.temp_dir = tempfile.mkdtemp()
+        pysat.utils.set_data_dir(self.temp_dir, store=False)
+        self.testInst = pysat.Instrument(platform='pysat', name='testing',
+                                         sat_id='100', clean_level='clean')
+        self.testInst.load(2009, 1)
+        self.store = os.path.join(self.temp_dir, 'test.npys')
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        pysat.utils.set_data_dir(self.data_path, store=False)
+        shutil.rmtree(self.temp_dir)
+        del self.testInst
+
+    def test_write_and_load(self):
+        npy_store.write_npy_store(self.store, self.testInst.data,
+                                  self.testInst.meta)
+        data, meta = npy_store.load_npy_store(self.store)
+
+        assert np.all(data.index == self.testInst.index)
+        assert np.all(data.columns == self.testInst.data.columns)
+        for key in self.testInst.data.columns:
+            assert np.all(data[key] == self.testInst[key])
+            assert meta[key, 'units'] == self.testInst.meta[key, 'units']
+
+    def test_load_unicode_dirname(self):
+        npy_store.write_npy_store(self.store, self.testInst.data,
+                                  self.testInst.meta)
+        data, meta = npy_store.load_npy_store(u'' + self.store)
+
+        assert np.all(data.index == self.testInst.index)
+        assert np.all(data['mlt'] == self.testInst['mlt'])
+
+    def test_load_is_memory_mapped(self):
+        npy_store.write_npy_store(self.store, self.testInst.data,
+                                  self.testInst.meta)
+        data, _ = npy_store.load_npy_store(self.store)
+        values = data['mlt'].values
+        while not isinstance(values, np.memmap) and values.base is not None:
+            values = values.base
+        assert isinstance(values, np.memmap)
+
+        # changes to loaded data don't change the store
+        data['mlt'] *= 2.
+        reloaded, _ = npy_store.load_npy_store(self.store)
+        assert np.all(reloaded['mlt'] == self.testInst['mlt'])
+
+    def test_load_columns(self):
+        npy_store.write_npy_store(self.store, self.testInst.data,
+                                  self.testInst.meta)
+        data, meta = npy_store.load_npy_store(self.store,
+                                              columns=['slt', 'MLT'])
+        assert list(data.columns) == ['mlt', 'slt']
+        assert sorted(meta.keys()) == ['mlt', 'slt']
+
+    def test_instrument_load(self):
+        data_path = os.path.join(self.temp_dir, 'npy', 'pandas')
+        for day in [1, 2]:
+            self.testInst.load(2009, day)
+            npy_store.write_npy_store(os.path.join(
+                data_path, npy_store.default_format_str.format(
+                    year=2009, month=1, day=day)), self.testInst.data,
+                self.testInst.meta)
+
+        inst = pysat.Instrument(inst_module=npy_pandas, columns=['mlt'])
+        assert len(inst.files.files) == 2
+        inst.load(2009, 2)
+        assert np.all(inst.index == self.testInst.index)
+        assert np.all(inst['mlt'] == self.testInst['mlt'])
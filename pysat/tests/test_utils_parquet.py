@@ -0,0 +1,141 @@
+"""
+tests the pysat utils.parquet area
+"""
+import os
+import shutil
+import tempfile
+
+from nose.plugins import skip
+import numpy as np
+
+import pysat
+from pysat.instruments.templates import parquet_pandas
+from pysat.utils import parquet
+
+
+class TestParquetMeta():
+
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.testInst = pysat.Instrument(platform='pysat', name='testing',
+                                         sat_id='10', clean_level='clean')
+        self.testInst.load(2009, 1)
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.testInst
+
+    def test_meta_round_trip(self):
+        meta = self.testInst.meta
+        meta.mutable = True
+        meta.bespoke = 'test attribute'
+        meta_json = parquet._meta_to_json(meta, self.testInst.data.columns)
+        loaded = parquet._meta_from_json(meta_json)
+
+        assert loaded.bespoke == 'test attribute'
+        for key in self.testInst.data.columns:
+            for label in [meta.units_label, meta.name_label,
+                          meta.fill_label]:
+                assert (loaded[key, label] == meta[key, label]
+                        or (np.isnan(loaded[key, label])
+                            and np.isnan(meta[key, label])))
+
+    def test_meta_subset(self):
+        meta_json = parquet._meta_to_json(self.testInst.meta, ['mlt', 'slt'])
+        loaded = parquet._meta_from_json(meta_json, columns=['MLT'])
+        assert list(loaded.keys()) == ['mlt']
+
+
+class TestParquetFiles():
+
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_list_files(self):
+        for day in [1, 2]:
+            fname = os.path.join(self.temp_dir, parquet.default_format_str
+                                 .format(year=2009, month=1, day=day))
+            if not os.path.isdir(os.path.dirname(fname)):
+                os.makedirs(os.path.dirname(fname))
+            with open(fname, 'w') as fout:
+                fout.write('test')
+
+        files = parquet_pandas.list_files(data_path=self.temp_dir + os.sep)
+        assert len(files) == 2
+        assert files.index[1] == pysat.datetime(2009, 1, 2)
+
+
+class TestParquet():
+
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        try:
+            parquet._import_pyarrow()
+        except ImportError:
+            raise skip.SkipTest('pyarrow is not installed')
+
+        # store current pysat directory
+        self.data_path = pysat.data_dir
+        self.temp_dir = tempfile.mkdtemp()
+        pysat.utils.set_data_dir(self.temp_dir, store=False)
+        self.testInst = pysat.Instrument(platform='pysat', name='testing',
+                                         sat_id='100', clean_level='clean')
+        self.fname = os.path.join(self.temp_dir, 'test.parquet')
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        pysat.utils.set_data_dir(self.data_path, store=False)
+        shutil.rmtree(self.temp_dir)
+        del self.testInst
+
+    def test_write_and_load(self):
+        self.testInst.load(2009, 1)
+        parquet.write_parquet(self.fname, self.testInst.data,
+                              self.testInst.meta)
+        data, meta = parquet.load_parquet(self.fname)
+
+        assert np.all(data.index == self.testInst.index)
+        for key in self.testInst.data.columns:
+            assert np.all(data[key] == self.testInst[key])
+            assert meta[key, 'units'] == self.testInst.meta[key, 'units']
+
+    def test_load_unicode_filename(self):
+        self.testInst.load(2009, 1)
+        parquet.write_parquet(self.fname, self.testInst.data,
+                              self.testInst.meta)
+        data, meta = parquet.load_parquet(u'' + self.fname)
+
+        assert np.all(data.index == self.testInst.index)
+        assert np.all(data['mlt'] == self.testInst['mlt'])
+
+    def test_load_columns_and_times(self):
+        self.testInst.load(2009, 1)
+        parquet.write_parquet(self.fname, self.testInst.data,
+                              self.testInst.meta, row_group_size=10)
+        start = self.testInst.index[25]
+        stop = self.testInst.index[44]
+        data, meta = parquet.load_parquet(self.fname, columns=['mlt'],
+                                          start=start, stop=stop)
+
+        assert list(data.columns) == ['mlt']
+        assert list(meta.keys()) == ['mlt']
+        assert np.all(data.index == self.testInst.index[25:45])
+
+    def test_instrument_export(self):
+        self.testInst.bounds = (pysat.datetime(2009, 1, 1),
+                                pysat.datetime(2009, 1, 3))
+        data_path = os.path.join(self.temp_dir, 'parquet', 'pandas', '')
+        fnames = self.testInst.to_parquet(data_path, n_workers=2)
+        assert len(fnames) == 3
+
+        inst = pysat.Instrument(inst_module=parquet_pandas,
+                                columns=['mlt', 'slt'])
+        inst.load(2009, 3)
+        assert list(inst.data.columns) == ['mlt', 'slt']
+        assert np.all(inst.index == self.testInst.index)
+        assert np.all(inst['mlt'] == self.testInst['mlt'])
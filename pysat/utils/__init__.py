@@ -9,5 +9,8 @@ of formats, loading of files, and user-supplied info
 for the pysat data directory structure.
 """
 
-from . import coords, stats, time
-from ._core import set_data_dir, scale_units, load_netcdf4, computational_form
+from . import coords, compression, download, npy_store, parquet, stats
+from . import time
+from ._core import set_data_dir, set_cache_dir, scale_units, load_netcdf4
+from ._core import NetCDF4Writer
+from ._core import computational_form
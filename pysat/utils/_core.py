@@ -1,12 +1,23 @@
 from __future__ import print_function
 from __future__ import absolute_import
 
+from collections import OrderedDict
+import hashlib
+import json
+import multiprocessing
 import numpy as np
+import pandas as pds
 import warnings
 
 import xarray as xr
+# python 2/3 compatibility
+try:
+    basestring
+except NameError:
+    basestring = str
 
 import pysat
+from pysat.utils import compression
 
 
 def set_data_dir(path=None, store=True):
@@ -15,10 +26,14 @@ def set_data_dir(path=None, store=True):
 
     Parameters
     ----------
-    path : string
-        valid path to directory pysat uses to look for data
+    path : string or list-like of strings
+        valid path to directory pysat uses to look for data. If a list of
+        paths is supplied, pysat will search each directory in order for
+        instrument files. The first directory is the primary directory,
+        where new data will be downloaded.
     store : bool
         if True, store data directory for future runs
+
     """
 
     import os
@@ -29,21 +44,88 @@ def set_data_dir(path=None, store=True):
     else:
         re_load = reload
 
+    if isinstance(path, basestring):
+        paths = [path]
+    else:
+        paths = list(path)
+
     # account for a user prefix in the path, such as ~
-    path = os.path.expanduser(path)
+    paths = [os.path.expanduser(ppath) for ppath in paths]
     # account for the presence of $HOME or similar
-    path = os.path.expandvars(path)
-
-    if os.path.isdir(path):
-        if store:
-            with open(os.path.join(os.path.expanduser('~'), '.pysat',
-                                   'data_path.txt'), 'w') as f:
-                f.write(path)
-        pysat.data_dir = path
-        pysat._files = re_load(pysat._files)
-        pysat._instrument = re_load(pysat._instrument)
+    paths = [os.path.expandvars(ppath) for ppath in paths]
+
+    for ppath in paths:
+        if not os.path.isdir(ppath):
+            raise ValueError(''.join(('Path ', ppath, ' does not lead to a ',
+                                      'valid directory.')))
+
+    if store:
+        with open(os.path.join(os.path.expanduser('~'), '.pysat',
+                               'data_path.txt'), 'w') as f:
+            f.write('\n'.join(paths))
+    pysat.data_dir = paths[0]
+    pysat.data_dirs = paths
+    pysat._files = re_load(pysat._files)
+    pysat._instrument = re_load(pysat._instrument)
+
+
+def set_cache_dir(path=None, max_size=None, store=True):
+    """
+    Set a local cache directory that data files are copied into upon load.
+
+    Parameters
+    ----------
+    path : string or NoneType
+        valid path to a directory on fast storage. Files loaded from any of
+        the pysat data directories are copied here, and subsequent loads
+        use the local copy. If None, the cache is disabled. (default=None)
+    max_size : int or NoneType
+        Maximum size of the cache in bytes. When exceeded, the least recently
+        used files are removed from the cache. If None, the cache size is not
+        limited. (default=None)
+    store : bool
+        if True, store cache directory and size for future runs
+
+    Note
+    ----
+    Only copies made by the cache are ever removed from the cache directory.
+    The cache directory should not be one of the pysat data directories.
+
+    """
+
+    import os
+    import sys
+    import pysat
+    if sys.version_info[0] >= 3:
+        from importlib import reload as re_load
     else:
-        raise ValueError('Path %s does not lead to a valid directory.' % path)
+        re_load = reload
+
+    if path is None:
+        path = ''
+    else:
+        path = os.path.expandvars(os.path.expanduser(path))
+        if not os.path.isdir(path):
+            raise ValueError(''.join(('Path ', path, ' does not lead to a ',
+                                      'valid directory.')))
+        if path in pysat.data_dirs:
+            raise ValueError('Cache directory must not be a data directory')
+
+    if max_size is not None:
+        max_size = int(max_size)
+        if max_size < 0:
+            raise ValueError('Cache size must be a positive number of bytes')
+
+    if store:
+        with open(os.path.join(os.path.expanduser('~'), '.pysat',
+                               'cache_path.txt'), 'w') as f:
+            f.write(path)
+            if max_size is not None:
+                f.write('\n{:d}'.format(max_size))
+    pysat.cache_dir = path
+    pysat.cache_size = max_size
+    pysat._files = re_load(pysat._files)
+    pysat._instrument = re_load(pysat._instrument)
 
 
 def computational_form(data):
@@ -158,13 +240,542 @@ def scale_units(out_unit, in_unit):
     return unit_scale
 
 
+def _read_block(variable):
+    """Read all of a netCDF4 variable as an ndarray
+
+    Parameters
+    ----------
+    variable : netCDF4.Variable
+        Variable with time as the first dimension
+
+    Returns
+    -------
+    numpy.ndarray
+        Values of the variable, with masked numbers replaced by NaN as
+        pandas does when building a DataFrame from a masked array
+
+    """
+
+    block = variable[:]
+    if np.ma.is_masked(block) and block.dtype.kind in 'iuf':
+        block = block.astype(float).filled(np.nan)
+    return np.ma.getdata(block)
+
+
+def _nest_row(block, num):
+    """Build the DataFrame or Series for one time of a 2D/3D block
+
+    Parameters
+    ----------
+    block : dict
+        Block prepared by _nest_block
+    num : int
+        Position of the time within the block
+
+    Returns
+    -------
+    pandas.DataFrame or pandas.Series
+        Data for the time, sharing memory with the block where possible
+
+    """
+
+    if block['index'] is None:
+        index = block['shared_index']
+    else:
+        index = pds.Index(block['index'][num], name=block['index_name'])
+
+    values = block['values']
+    if block['name'] is not None:
+        return pds.Series(list(values.values())[0][num], index=index,
+                          name=block['name'])
+    first = list(values.values())[0]
+    if first.ndim == 3:
+        return pds.DataFrame(first[num], index=index)
+    return pds.DataFrame(OrderedDict([(key, value[num])
+                                      for key, value in values.items()]),
+                         index=index, columns=list(values))
+
+
+class _LazyNested(object):
+    """Builds the data of a nested DataFrame or Series when first used
+
+    Only the block and the position of the time are stored until the
+    data, index, or columns are accessed. pandas keeps the data of each
+    object in _data, which is built here on first access.
+
+    """
+
+    def __init__(self, block, num):
+        object.__setattr__(self, '_block', (block, num))
+        object.__setattr__(self, '_lazy_data', None)
+        object.__setattr__(self, '_is_copy', None)
+        object.__setattr__(self, '_item_cache', {})
+
+    @property
+    def _data(self):
+        if self._lazy_data is None:
+            block, num = self._block
+            object.__setattr__(self, '_lazy_data',
+                               _nest_row(block, num)._data)
+            object.__setattr__(self, '_block', None)
+        return self._lazy_data
+
+    @_data.setter
+    def _data(self, new_data):
+        object.__setattr__(self, '_block', None)
+        object.__setattr__(self, '_lazy_data', new_data)
+
+
+class _LazyFrame(_LazyNested, pds.DataFrame):
+    """DataFrame for one time of a 2D/3D variable, built when first used"""
+
+    @property
+    def _constructor(self):
+        return pds.DataFrame
+
+
+class _LazySeries(_LazyNested, pds.Series):
+    """Series for one time of a 2D variable, built when first used"""
+
+    def __init__(self, block, num):
+        super(_LazySeries, self).__init__(block, num)
+        object.__setattr__(self, '_name', block['name'])
+
+    @property
+    def _constructor(self):
+        return pds.Series
+
+
+# pandas 1.1 and later keep the data in _mgr, so nested objects are built
+# when loaded
+_lazy_nesting = not hasattr(pds.DataFrame(), '_mgr')
+
+
+def _nest_block(block):
+    """Create the DataFrame or Series for each time from a 2D/3D block
+
+    Parameters
+    ----------
+    block : dict
+        'values' holds an OrderedDict of arrays with time as the first
+        dimension and the nested index as the second. 'index' holds the
+        index values for each time and nested row, or None for integer
+        indexing, and 'index_name' names the nested index. If 'name' is
+        not None the single array is loaded as a Series with that name.
+
+    Returns
+    -------
+    numpy.ndarray
+        Object array with the DataFrame or Series for each time
+
+    Note
+    ----
+    Each DataFrame or Series holds the block and its time, and is only
+    built when it is used. Operations on it return regular pandas objects.
+
+    """
+
+    first = list(block['values'].values())[0]
+    loop_lim, step_size = first.shape[:2]
+    block = dict(block)
+    block['shared_index'] = pds.Index(np.arange(step_size, dtype=int),
+                                      name=block['index_name'])
+
+    nested = np.empty(loop_lim, dtype=object)
+    if not _lazy_nesting:
+        for num in range(loop_lim):
+            nested[num] = _nest_row(block, num)
+    elif block['name'] is not None:
+        for num in range(loop_lim):
+            nested[num] = _LazySeries(block, num)
+    else:
+        for num in range(loop_lim):
+            nested[num] = _LazyFrame(block, num)
+    return nested
+
+
+# Meta objects built for each netCDF4 file schema, most recently used last
+_meta_cache = OrderedDict()
+_meta_cache_size = 16
+
+
+def _netcdf4_fingerprint(data, epoch_name, meta_labels):
+    """Hash the structure and variable attributes of a netCDF4 Dataset
+
+    Parameters
+    ----------
+    data : netCDF4.Dataset
+        Open netCDF4 file
+    epoch_name : string
+        Name of the time variable
+    meta_labels : dict
+        Label keyword arguments for pysat.Meta
+
+    Returns
+    -------
+    string
+        Hex digest identifying the variable names, dimensions, dtypes,
+        and attributes, which determine the Meta object loaded from the
+        file. Global attributes are not included.
+
+    """
+
+    def attr_value(value):
+        # array reprs are abbreviated, so use the data itself
+        if isinstance(value, np.ndarray):
+            return (value.dtype.str, value.shape, value.tobytes())
+        return value
+
+    schema = [epoch_name, sorted(meta_labels.items())]
+    for key, var in data.variables.items():
+        schema.append((key, str(var.dtype), var.dimensions,
+                       [(attr, attr_value(var.getncattr(attr)))
+                        for attr in var.ncattrs()]))
+    return hashlib.sha1(repr(schema).encode('utf-8')).hexdigest()
+
+
+def _load_netcdf4_pandas(fname, file_format, epoch_name, meta_labels):
+    """Load a single netCDF4 file produced by pysat into pandas structures
+
+    Parameters
+    ----------
+    fname : string
+        Filename
+    file_format : string
+        file_format keyword passed to netCDF4 routine
+    epoch_name : string
+        Name of the time variable
+    meta_labels : dict
+        Label keyword arguments for pysat.Meta
+
+    Returns
+    -------
+    loadedVars : dict
+        Data for each variable, with the times in epoch_name. 2D and 3D
+        variables are blocks, as described in _nest_block
+    mdata : pysat.Meta
+        Meta data for this file
+    found_3d : bool
+        True if the file contains 3D variables
+    fingerprint : string
+        Hash of the file variables and their attributes
+
+    Note
+    ----
+    The DataFrame or Series for each time of a 2D or 3D variable is not
+    built here, so that files decoded in other processes send arrays
+    rather than many small pickled frames back to the parent.
+
+    Meta objects are cached by fingerprint, so files with the same
+    variables and attributes as a recently loaded file receive a copy of
+    the cached metadata rather than building it again.
+
+    """
+
+    import netCDF4
+    import pandas as pds
+    import pysat
+
+    two_d_keys = []
+    two_d_dims = []
+    three_d_keys = []
+    three_d_dims = []
+    found_3d = False
+    name_label = meta_labels['name_label']
+
+    if compression.is_compressed(fname):
+        # decompress into memory rather than onto disk
+        nc_kwargs = {'memory': compression.read_file(fname)}
+    else:
+        nc_kwargs = {}
+    with netCDF4.Dataset(fname, mode='r', format=file_format,
+                         **nc_kwargs) as data:
+        # only build metadata for files not seen recently
+        fingerprint = _netcdf4_fingerprint(data, epoch_name, meta_labels)
+        build_meta = fingerprint not in _meta_cache
+        if build_meta:
+            mdata = pysat.Meta(**meta_labels)
+        else:
+            mdata = _meta_cache.pop(fingerprint)
+            _meta_cache[fingerprint] = mdata
+            mdata = mdata.copy()
+
+        loadedVars = {}
+        meta_1d = OrderedDict()
+        for key in data.variables.keys():
+            # load up metadata.  From here group unique
+            # dimensions and act accordingly, 1D, 2D, 3D
+            if len(data.variables[key].dimensions) == 1:
+                # load 1D data variable
+                # assuming basic time dimension
+                loadedVars[key] = data.variables[key][:]
+                # load up metadata
+                if build_meta:
+                    meta_dict = {}
+                    for nc_key in data.variables[key].ncattrs():
+                        meta_dict[nc_key] = \
+                                data.variables[key].getncattr(nc_key)
+                    meta_1d[key] = meta_dict
+            if len(data.variables[key].dimensions) == 2:
+                # part of dataframe within dataframe
+                two_d_keys.append(key)
+                two_d_dims.append(data.variables[key].dimensions)
+
+            if len(data.variables[key].dimensions) == 3:
+                found_3d = True
+                # part of full/dedicated dataframe within dataframe
+                three_d_keys.append(key)
+                three_d_dims.append(data.variables[key].dimensions)
+        if build_meta:
+            mdata.update_many(meta_1d)
+
+        # we now have a list of keys that need to go into a dataframe,
+        # could be more than one, collect unique dimensions for 2D keys
+        for dim in set(two_d_dims):
+            # first or second dimension could be epoch
+            # Use other dimension name as variable name
+            if dim[0] == epoch_name:
+                obj_key_name = dim[1]
+            elif dim[1] == epoch_name:
+                obj_key_name = dim[0]
+            else:
+                raise KeyError('Epoch not found!')
+            # collect variable names associated with dimension
+            idx_bool = [dim == i for i in two_d_dims]
+            idx, = np.where(np.array(idx_bool))
+            obj_var_keys = []
+            clean_var_keys = []
+            for i in idx:
+                obj_var_keys.append(two_d_keys[i])
+                clean_var_keys.append(
+                        two_d_keys[i].split(obj_key_name + '_')[-1])
+
+            # figure out how to index this data, it could provide its
+            # own index - or we may have to create simple integer based
+            # DataFrame access. If the dimension is stored as its own
+            # variable then use that info for index
+            if obj_key_name in obj_var_keys:
+                # string used to indentify dimension also in
+                # data.variables will be used as an index
+                index_key_name = obj_key_name
+                # if the object index uses UNIX time, process into
+                # datetime index
+                if data.variables[obj_key_name].getncattr(name_label) == \
+                        epoch_name:
+                    # name to be used in DataFrame index
+                    index_name = epoch_name
+                    time_index_flag = True
+                else:
+                    time_index_flag = False
+                    # label to be used in DataFrame index
+                    index_name = \
+                        data.variables[obj_key_name].getncattr(name_label)
+            else:
+                # dimension is not itself a variable
+                index_key_name = None
+
+            # iterate over the variables and grab metadata
+            if build_meta and index_key_name is not None:
+                dim_meta_vars = OrderedDict()
+                for key, clean_key in zip(obj_var_keys, clean_var_keys):
+                    # store attributes in metadata, exept for dim name
+                    meta_dict = {}
+                    for nc_key in data.variables[key].ncattrs():
+                        meta_dict[nc_key] = \
+                            data.variables[key].getncattr(nc_key)
+                    dim_meta_vars[clean_key] = meta_dict
+                dim_meta_data = pysat.Meta.from_dict(dim_meta_vars,
+                                                     **meta_labels)
+
+                dim_meta_dict = {'meta': dim_meta_data}
+                # add top level meta
+                for nc_key in data.variables[obj_key_name].ncattrs():
+                    dim_meta_dict[nc_key] = \
+                        data.variables[obj_key_name].getncattr(nc_key)
+                mdata[obj_key_name] = dim_meta_dict
+
+            # read each variable once, with a row per time
+            values = OrderedDict()
+            for key, clean_key in zip(obj_var_keys, clean_var_keys):
+                values[clean_key] = _read_block(data.variables[key])
+            # check if there is an index we should use
+            if index_key_name is not None:
+                # an index was found
+                index = values.pop(index_key_name)
+                if time_index_flag:
+                    # create datetime index from data
+                    index = pds.to_datetime(
+                        1E6 * index.ravel()).values.reshape(index.shape)
+            else:
+                # using integer indexing
+                index = None
+                index_name = 'index'
+            if len(values) > 1:
+                name = None
+            else:
+                # a single variable is loaded as a Series
+                name = obj_var_keys[clean_var_keys.index(list(values)[0])]
+            block = {'values': values, 'index': index,
+                     'index_name': index_name, 'name': name}
+
+            # add 2D object data, all based on a unique dimension within
+            # netCDF, to loaded data dictionary
+            loadedVars[obj_key_name] = block
+
+        # we now have a list of keys that need to go into a dataframe,
+        # could be more than one, collect unique dimensions for 2D keys
+        for dim in set(three_d_dims):
+            # collect variable names associated with dimension
+            idx_bool = [dim == i for i in three_d_dims]
+            idx, = np.where(np.array(idx_bool))
+            obj_var_keys = []
+            for i in idx:
+                obj_var_keys.append(three_d_keys[i])
+
+            for obj_key_name in obj_var_keys:
+                # store attributes in metadata
+                if build_meta:
+                    meta_dict = {}
+                    for nc_key in data.variables[obj_key_name].ncattrs():
+                        meta_dict[nc_key] = \
+                            data.variables[obj_key_name].getncattr(nc_key)
+                    mdata[obj_key_name] = meta_dict
+
+                # each time holds a DataFrame with integer indexing
+                values = OrderedDict()
+                values[obj_key_name] = \
+                    _read_block(data.variables[obj_key_name])
+                block = {'values': values, 'index': None,
+                         'index_name': 'index', 'name': None}
+                loadedVars[obj_key_name] = block
+
+        # prepare dataframe index for this netcdf file
+        time_var = loadedVars.pop(epoch_name)
+
+        # convert from GPS seconds to seconds used in pandas (unix time,
+        # no leap)
+        # time_var = convert_gps_to_unix_seconds(time_var)
+        loadedVars[epoch_name] = \
+            pds.to_datetime((1E6 * time_var).astype(int))
+
+        if build_meta:
+            _meta_cache[fingerprint] = mdata.copy()
+            while len(_meta_cache) > _meta_cache_size:
+                _meta_cache.popitem(last=False)
+
+        # add the global ncattrs, which differ between files, to the
+        # pysat meta object
+        ncattrsList = data.ncattrs()
+        for d in ncattrsList:
+            if hasattr(mdata, d):
+                mdata.__setattr__(d+'_', data.getncattr(d))
+            else:
+                mdata.__setattr__(d, data.getncattr(d))
+
+    return loadedVars, mdata, found_3d, fingerprint
+
+
+def _load_netcdf4_file(args):
+    """Unpack arguments for _load_netcdf4_pandas, for use with Pool.map"""
+    return _load_netcdf4_pandas(*args)
+
+
+def _join_blocks(blocks):
+    """Join 2D/3D blocks from several files along time
+
+    Parameters
+    ----------
+    blocks : list
+        Blocks for the same variable from each file, see _nest_block
+
+    Returns
+    -------
+    dict or NoneType
+        Block with the times of all blocks, or None if the variables or
+        the size of the nested dimensions differ between blocks
+
+    """
+
+    first = blocks[0]
+    for block in blocks[1:]:
+        if list(block['values']) != list(first['values']) or \
+                block['name'] != first['name'] or \
+                block['index_name'] != first['index_name'] or \
+                (block['index'] is None) != (first['index'] is None):
+            return None
+        for key, value in block['values'].items():
+            if value.shape[1:] != first['values'][key].shape[1:]:
+                return None
+
+    values = OrderedDict()
+    for key in first['values']:
+        values[key] = np.concatenate([block['values'][key]
+                                      for block in blocks])
+    if first['index'] is None:
+        index = None
+    else:
+        index = np.concatenate([block['index'] for block in blocks])
+    return {'values': values, 'index': index,
+            'index_name': first['index_name'], 'name': first['name']}
+
+
+def _combine_netcdf4_pandas(loaded, epoch_name):
+    """Combine data loaded from several files into one DataFrame
+
+    Parameters
+    ----------
+    loaded : list
+        Dicts of data for each file, as returned by _load_netcdf4_pandas
+    epoch_name : string
+        Name of the time variable
+
+    Returns
+    -------
+    pandas.DataFrame
+        Data from all of the files, indexed by time
+
+    """
+
+    import pandas as pds
+
+    keys = set(loaded[0].keys())
+    if any([set(item.keys()) != keys for item in loaded[1:]]):
+        # variables differ between files, let pandas align them
+        frames = []
+        for item in loaded:
+            item = {key: _nest_block(value) if isinstance(value, dict)
+                    else value for key, value in item.items()}
+            frames.append(pds.DataFrame.from_records(item, index=epoch_name))
+        return pds.concat(frames, axis=0)
+
+    # join each variable across files once, then build a single frame
+    combined = {}
+    for key in keys:
+        values = [item[key] for item in loaded]
+        if key == epoch_name:
+            combined[key] = values[0].append(values[1:])
+        elif isinstance(values[0], dict):
+            # build the nested frames once for all files where possible
+            block = _join_blocks(values)
+            if block is not None:
+                combined[key] = _nest_block(block)
+            else:
+                combined[key] = np.concatenate([_nest_block(value)
+                                                for value in values])
+        elif any([isinstance(val, np.ma.MaskedArray) for val in values]):
+            combined[key] = np.ma.concatenate(values)
+        else:
+            combined[key] = np.concatenate(values)
+    return pds.DataFrame.from_records(combined, index=epoch_name)
+
+
 def load_netcdf4(fnames=None, strict_meta=False, file_format=None,
                  epoch_name='Epoch', units_label='units',
                  name_label='long_name', notes_label='notes',
                  desc_label='desc', plot_label='label', axis_label='axis',
                  scale_label='scale', min_label='value_min',
                  max_label='value_max', fill_label='fill',
-                 pandas_format=True):
+                 pandas_format=True, n_workers=1):
     # unix_time=False, **kwargs):
     """Load netCDF-3/4 file produced by pysat.
 
@@ -198,6 +809,11 @@ def load_netcdf4(fnames=None, strict_meta=False, file_format=None,
         keyword for maximum in allowable value range
     fill_label : string ('fill')
         keyword for fill values
+    pandas_format : bool (True)
+        If True, return a pandas DataFrame, otherwise an xarray Dataset
+    n_workers : int (1)
+        Number of processes used to decode files at the same time, when
+        pandas_format is True and there are several fnames
 
     Returns
     --------
@@ -205,17 +821,20 @@ def load_netcdf4(fnames=None, strict_meta=False, file_format=None,
         DataFrame output
     mdata : pysat._meta.Meta
         Meta data
+
+    Note
+    ----
+    Compressed files, as identified by pysat.utils.compression, are
+    decompressed into memory when pandas_format is True, and into the
+    pysat scratch directory otherwise.
+
+    When n_workers is greater than 1 on platforms that start new processes
+    rather than forking (Windows, macOS), the calling script must be
+    guarded by ``if __name__ == '__main__':``.
+
     """
 
-    import copy
-    import netCDF4
-    import pandas as pds
     import pysat
-    try:
-        basestring
-    except NameError:
-        basestring = str
-
     if fnames is None:
         raise ValueError("Must supply a filename/list of filenames")
     if isinstance(fnames, basestring):
@@ -226,13 +845,6 @@ def load_netcdf4(fnames=None, strict_meta=False, file_format=None,
     else:
         file_format = file_format.upper()
 
-    saved_mdata = None
-    running_idx = 0
-    running_store = []
-    two_d_keys = []
-    two_d_dims = []
-    three_d_keys = []
-    three_d_dims = []
     mdata = pysat.Meta(units_label=units_label,
                        name_label=name_label,
                        notes_label=notes_label,
@@ -245,270 +857,67 @@ def load_netcdf4(fnames=None, strict_meta=False, file_format=None,
                        fill_label=fill_label)
 
     if pandas_format:
-        for fname in fnames:
-            with netCDF4.Dataset(fname, mode='r', format=file_format) as data:
-                # build up dictionary with all global ncattrs
-                # and add those attributes to a pysat meta object
-                ncattrsList = data.ncattrs()
-                for d in ncattrsList:
-                    if hasattr(mdata, d):
-                        mdata.__setattr__(d+'_', data.getncattr(d))
-                    else:
-                        mdata.__setattr__(d, data.getncattr(d))
-
-                loadedVars = {}
-                for key in data.variables.keys():
-                    # load up metadata.  From here group unique
-                    # dimensions and act accordingly, 1D, 2D, 3D
-                    if len(data.variables[key].dimensions) == 1:
-                        if pandas_format:
-                            # load 1D data variable
-                            # assuming basic time dimension
-                            loadedVars[key] = data.variables[key][:]
-                        # load up metadata
-                        meta_dict = {}
-                        for nc_key in data.variables[key].ncattrs():
-                            meta_dict[nc_key] = \
-                                    data.variables[key].getncattr(nc_key)
-                        mdata[key] = meta_dict
-                    if len(data.variables[key].dimensions) == 2:
-                        # part of dataframe within dataframe
-                        two_d_keys.append(key)
-                        two_d_dims.append(data.variables[key].dimensions)
-
-                    if len(data.variables[key].dimensions) == 3:
-                        warnings.warn(' '.join(["Support for 3D data in pandas",
-                                                "will be removed in pysat 3.0",
-                                                "Please use xarray for",
-                                                "multi-dimension data."]),
-                                      DeprecationWarning, stacklevel=2)
-                        # part of full/dedicated dataframe within dataframe
-                        three_d_keys.append(key)
-                        three_d_dims.append(data.variables[key].dimensions)
-
-                # we now have a list of keys that need to go into a dataframe,
-                # could be more than one, collect unique dimensions for 2D keys
-                for dim in set(two_d_dims):
-                    # first or second dimension could be epoch
-                    # Use other dimension name as variable name
-                    if dim[0] == epoch_name:
-                        obj_key_name = dim[1]
-                    elif dim[1] == epoch_name:
-                        obj_key_name = dim[0]
-                    else:
-                        raise KeyError('Epoch not found!')
-                    # collect variable names associated with dimension
-                    idx_bool = [dim == i for i in two_d_dims]
-                    idx, = np.where(np.array(idx_bool))
-                    obj_var_keys = []
-                    clean_var_keys = []
-                    for i in idx:
-                        obj_var_keys.append(two_d_keys[i])
-                        clean_var_keys.append(
-                                two_d_keys[i].split(obj_key_name + '_')[-1])
-
-                    # figure out how to index this data, it could provide its
-                    # own index - or we may have to create simple integer based
-                    # DataFrame access. If the dimension is stored as its own
-                    # variable then use that info for index
-                    if obj_key_name in obj_var_keys:
-                        # string used to indentify dimension also in
-                        # data.variables will be used as an index
-                        index_key_name = obj_key_name
-                        # if the object index uses UNIX time, process into
-                        # datetime index
-                        if data.variables[obj_key_name].getncattr(name_label) == \
-                                epoch_name:
-                            # name to be used in DataFrame index
-                            index_name = epoch_name
-                            time_index_flag = True
-                        else:
-                            time_index_flag = False
-                            # label to be used in DataFrame index
-                            index_name = \
-                                data.variables[obj_key_name].getncattr(name_label)
-                    else:
-                        # dimension is not itself a variable
-                        index_key_name = None
-
-                    # iterate over the variables and grab metadata
-                    dim_meta_data = pysat.Meta(units_label=units_label,
-                                               name_label=name_label,
-                                               notes_label=notes_label,
-                                               desc_label=desc_label,
-                                               plot_label=plot_label,
-                                               axis_label=axis_label,
-                                               scale_label=scale_label,
-                                               min_label=min_label,
-                                               max_label=max_label,
-                                               fill_label=fill_label)
-
-                    for key, clean_key in zip(obj_var_keys, clean_var_keys):
-                        # store attributes in metadata, exept for dim name
-                        meta_dict = {}
-                        for nc_key in data.variables[key].ncattrs():
-                            meta_dict[nc_key] = \
-                                data.variables[key].getncattr(nc_key)
-                        dim_meta_data[clean_key] = meta_dict
-
-                    dim_meta_dict = {'meta': dim_meta_data}
-                    if index_key_name is not None:
-                        # add top level meta
-                        for nc_key in data.variables[obj_key_name].ncattrs():
-                            dim_meta_dict[nc_key] = \
-                                data.variables[obj_key_name].getncattr(nc_key)
-                        mdata[obj_key_name] = dim_meta_dict
-
-                    # iterate over all variables with this dimension
-                    # data storage, whole shebang
-                    loop_dict = {}
-                    # list holds a series of slices, parsed from dict above
-                    loop_list = []
-                    for key, clean_key in zip(obj_var_keys, clean_var_keys):
-                        # data
-                        loop_dict[clean_key] = \
-                            data.variables[key][:, :].flatten(order='C')
-                    # number of values in time
-                    loop_lim = data.variables[obj_var_keys[0]].shape[0]
-                    # number of values per time
-                    step_size = len(data.variables[obj_var_keys[0]][0, :])
-                    # check if there is an index we should use
-                    if not (index_key_name is None):
-                        # an index was found
-                        time_var = loop_dict.pop(index_key_name)
-                        if time_index_flag:
-                            # create datetime index from data
-                            time_var = pds.to_datetime(1E6 * time_var)
-                        new_index = time_var
-                        new_index_name = index_name
-                    else:
-                        # using integer indexing
-                        new_index = np.arange(loop_lim*step_size,
-                                              dtype=int) % step_size
-                        new_index_name = 'index'
-                    # load all data into frame
-                    if len(loop_dict.keys()) > 1:
-                        loop_frame = pds.DataFrame(loop_dict,
-                                                   columns=clean_var_keys)
-                        if obj_key_name in loop_frame:
-                            del loop_frame[obj_key_name]
-                        # break massive frame into bunch of smaller frames
-                        for i in np.arange(loop_lim, dtype=int):
-                            loop_list.append(loop_frame.iloc[step_size*i:step_size*(i+1), :])
-                            loop_list[-1].index = new_index[step_size*i:step_size*(i+1)]
-                            loop_list[-1].index.name = new_index_name
-                    else:
-                        loop_frame = pds.Series(loop_dict[clean_var_keys[0]],
-                                                name=obj_var_keys[0])
-                        # break massive series into bunch of smaller series
-                        for i in np.arange(loop_lim, dtype=int):
-                            loop_list.append(loop_frame.iloc[step_size*i:step_size*(i+1)])
-                            loop_list[-1].index = new_index[step_size*i:step_size*(i+1)]
-                            loop_list[-1].index.name = new_index_name
-
-                    # add 2D object data, all based on a unique dimension within
-                    # netCDF, to loaded data dictionary
-                    loadedVars[obj_key_name] = loop_list
-                    del loop_list
-
-                # we now have a list of keys that need to go into a dataframe,
-                # could be more than one, collect unique dimensions for 2D keys
-                for dim in set(three_d_dims):
-                    # collect variable names associated with dimension
-                    idx_bool = [dim == i for i in three_d_dims]
-                    idx, = np.where(np.array(idx_bool))
-                    obj_var_keys = []
-                    for i in idx:
-                        obj_var_keys.append(three_d_keys[i])
-
-                    for obj_key_name in obj_var_keys:
-                        # store attributes in metadata
-                        meta_dict = {}
-                        for nc_key in data.variables[obj_key_name].ncattrs():
-                            meta_dict[nc_key] = \
-                                data.variables[obj_key_name].getncattr(nc_key)
-                        mdata[obj_key_name] = meta_dict
-
-                        # iterate over all variables with this dimension and store
-                        # data
-                        loop_dict = {}
-                        # list holds a series of slices, parsed from dict above
-                        loop_list = []
-                        loop_dict[obj_key_name] = \
-                            data.variables[obj_key_name][:, :, :]
-                        # number of values in time
-                        loop_lim = data.variables[obj_key_name].shape[0]
-                        # number of values per time
-                        step_size_x = len(data.variables[obj_key_name][0, :, 0])
-                        step_size_y = len(data.variables[obj_key_name][0, 0, :])
-                        step_size = step_size_x
-                        loop_dict[obj_key_name] = \
-                            loop_dict[obj_key_name].reshape((loop_lim*step_size_x,
-                                                             step_size_y))
-                        # check if there is an index we should use
-                        if not (index_key_name is None):
-                            # an index was found
-                            time_var = loop_dict.pop(index_key_name)
-                            if time_index_flag:
-                                # create datetime index from data
-                                time_var = pds.to_datetime(1E6 * time_var)
-                            new_index = time_var
-                            new_index_name = index_name
-                        else:
-                            # using integer indexing
-                            new_index = np.arange(loop_lim*step_size,
-                                                  dtype=int) % step_size
-                            new_index_name = 'index'
-                        # load all data into frame
-                        loop_frame = pds.DataFrame(loop_dict[obj_key_name])
-                        # del loop_frame['dimension_1']
-                        # break massive frame into bunch of smaller frames
-                        for i in np.arange(loop_lim, dtype=int):
-                            loop_list.append(loop_frame.iloc[step_size*i:step_size*(i+1), :])
-                            loop_list[-1].index = new_index[step_size*i:step_size*(i+1)]
-                            loop_list[-1].index.name = new_index_name
-
-                        # add 2D object data, all based on a unique dimension
-                        # within netCDF, to loaded data dictionary
-                        loadedVars[obj_key_name] = loop_list
-                        del loop_list
-
-                # prepare dataframe index for this netcdf file
-                time_var = loadedVars.pop(epoch_name)
-
-                # convert from GPS seconds to seconds used in pandas (unix time,
-                # no leap)
-                # time_var = convert_gps_to_unix_seconds(time_var)
-                loadedVars[epoch_name] = \
-                    pds.to_datetime((1E6 * time_var).astype(int))
-                running_store.append(loadedVars)
-                running_idx += len(loadedVars[epoch_name])
-
-                if strict_meta:
-                    if saved_mdata is None:
-                        saved_mdata = copy.deepcopy(mdata)
-                    elif (mdata != saved_mdata):
-                        raise ValueError(' '.join(('Metadata across filenames',
-                                                   'is not the same.')))
+        meta_labels = {'units_label': units_label, 'name_label': name_label,
+                       'notes_label': notes_label, 'desc_label': desc_label,
+                       'plot_label': plot_label, 'axis_label': axis_label,
+                       'scale_label': scale_label, 'min_label': min_label,
+                       'max_label': max_label, 'fill_label': fill_label}
+        load_args = [(fname, file_format, epoch_name, meta_labels)
+                     for fname in fnames]
+        n_workers = min(n_workers, len(fnames))
+        if n_workers > 1:
+            # decode the files in parallel
+            pool = multiprocessing.Pool(n_workers)
+            try:
+                loaded = pool.map(_load_netcdf4_file, load_args)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            loaded = [_load_netcdf4_file(largs) for largs in load_args]
+
+        if any([found_3d for _, _, found_3d, _ in loaded]):
+            warnings.warn(' '.join(["Support for 3D data in pandas",
+                                    "will be removed in pysat 3.0",
+                                    "Please use xarray for",
+                                    "multi-dimension data."]),
+                          DeprecationWarning, stacklevel=2)
+
+        if strict_meta:
+            # files with the same fingerprint have the same metadata
+            for _, file_mdata, _, fingerprint in loaded[1:]:
+                if fingerprint != loaded[0][3] and file_mdata != loaded[0][1]:
+                    raise ValueError(' '.join(('Metadata across filenames',
+                                               'is not the same.')))
+
+        # metadata from later files takes precedence
+        mdata = loaded[-1][1]
+        for _, file_mdata, _, _ in loaded[-2::-1]:
+            mdata.merge(file_mdata)
+            for attr, value in file_mdata.__dict__.items():
+                if attr not in mdata.__dict__:
+                    mdata.__setattr__(attr, value)
 
         # combine all of the data loaded across files together
-        out = []
-        for item in running_store:
-            out.append(pds.DataFrame.from_records(item, index=epoch_name))
-        out = pds.concat(out, axis=0)
+        out = _combine_netcdf4_pandas([item for item, _, _, _ in loaded],
+                                      epoch_name)
     else:
+        # xarray requires seekable files on disk
+        fnames = [compression.scratch_copy(fname) for fname in fnames]
         if len(fnames) == 1:
             out = xr.open_dataset(fnames[0])
         else:
             out = xr.open_mfdataset(fnames, combine='by_coords')
+        meta_vars = OrderedDict()
         for key in out.variables.keys():
             # Copy the variable attributes from the data object to the metadata
             meta_dict = {}
             for nc_key in out.variables[key].attrs.keys():
                 meta_dict[nc_key] = out.variables[key].attrs[nc_key]
-            mdata[key] = meta_dict
+            meta_vars[key] = meta_dict
             # Remove variable attributes from the data object
             out.variables[key].attrs = {}
+        mdata.update_many(meta_vars)
         # Copy the file attributes from the data object to the metadata
         for d in out.attrs.keys():
             if hasattr(mdata, d):
@@ -519,3 +928,188 @@ def load_netcdf4(fnames=None, strict_meta=False, file_format=None,
         out.attrs = {}
 
     return out, mdata
+
+
+# Meta labels, stored so that they may be restored on load
+_meta_labels = ['units_label', 'name_label', 'notes_label', 'desc_label',
+                'plot_label', 'axis_label', 'scale_label', 'min_label',
+                'max_label', 'fill_label']
+
+
+def _meta_to_json(meta, variables):
+    """Serialize the metadata for variables, and Meta attributes, to JSON"""
+    labels = {label: getattr(meta, label) for label in _meta_labels}
+    # Meta is case insensitive, but preserves the case of variable names
+    variables = [var.lower() for var in variables]
+    mdata = meta.data.loc[[var for var in meta.data.index
+                           if var.lower() in variables]]
+    attrs = {}
+    for attr in dir(meta):
+        if attr not in meta._base_attr and attr[0] != '_':
+            try:
+                attrs[attr] = json.loads(json.dumps(getattr(meta, attr)))
+            except TypeError:
+                pass
+    return json.dumps({'labels': labels, 'attrs': attrs,
+                       'data': json.loads(mdata.to_json(orient='index'))})
+
+
+def _meta_from_json(meta_json, columns=None):
+    """Create a Meta object from the output of _meta_to_json"""
+    meta_dict = json.loads(meta_json)
+    if columns is not None:
+        columns = [col.lower() for col in columns]
+    meta_vars = OrderedDict()
+    for var, var_dict in meta_dict['data'].items():
+        if columns is None or var.lower() in columns:
+            meta_vars[var] = {label: value for label, value
+                              in var_dict.items() if value is not None}
+    meta = pysat.Meta.from_dict(meta_vars, **meta_dict['labels'])
+    for attr, value in meta_dict['attrs'].items():
+        setattr(meta, attr, value)
+    return meta
+
+
+class NetCDF4Writer(object):
+    """Appends the data from a series of loads to a single netCDF4 file.
+
+    The file is created by `Instrument.to_netcdf4` for the first loaded
+    Instrument, which sets the variable layout and metadata. Later loads are
+    written along the unlimited epoch dimension, so only one load is held in
+    memory at a time.
+
+    Parameters
+    ----------
+    fname : string
+        full path of the netCDF4 file to write
+    **kwargs : dict
+        Keywords passed to `Instrument.to_netcdf4` when the file is created,
+        e.g. base_instrument, epoch_name, zlib, complevel, shuffle,
+        preserve_meta_case, and export_nan
+
+    Note
+    ----
+    Metadata and global attributes are taken from the first load. Each
+    later load must contain the same variables, and higher order variables
+    must have the same dimensions. Times must be unique and increasing
+    across loads, so padded Instruments may not be appended.
+
+    Examples
+    --------
+    ::
+
+        inst = pysat.Instrument('pysat', 'testing')
+        inst.bounds = (pysat.datetime(2009, 1, 1), pysat.datetime(2009, 3, 31))
+        with pysat.utils.NetCDF4Writer('season.nc') as writer:
+            for inst in inst:
+                writer.append(inst)
+
+    """
+
+    def __init__(self, fname, **kwargs):
+        if 'unlimited_time' in kwargs:
+            raise ValueError('appended files always use an unlimited time '
+                             'dimension')
+        self.fname = fname
+        self.epoch_name = kwargs.get('epoch_name', 'Epoch')
+        self._kwargs = kwargs
+        self._out_data = None
+        self._variables = None
+        self._layout = None
+        self._last_time = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        """Number of times written to the file"""
+        if self._out_data is None:
+            return 0
+        return len(self._out_data.dimensions[self.epoch_name])
+
+    def _create(self, inst):
+        """Write the first load and record where each variable is stored"""
+        import netCDF4
+
+        inst.to_netcdf4(self.fname, unlimited_time=True, **self._kwargs)
+
+        # sources within the Instrument for each netCDF4 variable
+        self._variables = list(inst.variables)
+        self._layout = []
+        for key in self._variables:
+            if self._kwargs.get('preserve_meta_case', False):
+                case_key = inst.meta.var_case_name(key)
+            else:
+                case_key = key
+            first = inst.data[key].iloc[0]
+            if isinstance(first, (pysat.DataFrame, pysat.Series)):
+                if hasattr(first, 'columns'):
+                    for col in first.columns:
+                        self._layout.append((case_key + '_' + col, key, col,
+                                             False))
+                else:
+                    self._layout.append((case_key + '_data', key, None,
+                                         False))
+                self._layout.append((case_key, key, None, True))
+            else:
+                self._layout.append((case_key, key, None, None))
+        self._out_data = netCDF4.Dataset(self.fname, mode='a')
+
+    def append(self, inst):
+        """Write the data loaded in an Instrument to the end of the file
+
+        Parameters
+        ----------
+        inst : pysat.Instrument
+            Instrument with loaded pandas data. Empty loads are skipped.
+
+        """
+        if not inst.pandas_format:
+            raise ValueError('only pandas data may be appended to a file')
+        if inst.empty:
+            return
+        if self._out_data is None and self._layout is not None:
+            raise ValueError('writer has already been closed')
+        if not (inst.index.is_monotonic_increasing and inst.index.is_unique):
+            raise ValueError('Times loaded must be unique and increasing')
+
+        if self._out_data is None:
+            self._create(inst)
+        else:
+            if list(inst.variables) != self._variables:
+                raise ValueError(' '.join(('Variables loaded do not match',
+                                           'those written to', self.fname)))
+            if inst.index[0] <= self._last_time:
+                raise ValueError(' '.join(('Times loaded overlap those',
+                                           'already written to',
+                                           self.fname)))
+            start = len(self)
+            stop = start + len(inst.index)
+            self._out_data[self.epoch_name][start:stop] = \
+                (inst.index.values.astype(np.int64) * 1.E-6).astype(np.int64)
+            for name, key, col, index in self._layout:
+                if index is None:
+                    values = inst.data[key].values
+                else:
+                    values = inst._stack_higher_order(key, col=col,
+                                                      index=index)
+                if values.dtype.kind == 'M':
+                    # datetimes are stored as milliseconds
+                    values = (values.astype(np.int64) *
+                              1.E-6).astype(np.int64)
+                self._out_data[name][start:stop] = values
+        self._last_time = inst.index[-1]
+
+    def close(self):
+        """Update the end date attributes and close the file"""
+        if self._out_data is None:
+            return
+        date_end = self._last_time.strftime('%a, %d %b %Y,  ' +
+                                            '%Y-%m-%dT%H:%M:%S.%f')
+        self._out_data.setncattr('Date_End', date_end[:-3] + ' UTC')
+        self._out_data.setncattr('File_Date', date_end[:-3] + ' UTC')
+        self._out_data.close()
+        self._out_data = None
@@ -0,0 +1,230 @@
+"""
+pysat.utils.compression - reading compressed data files
+=======================================================
+
+pysat.utils.compression contains functions that allow instrument load
+routines to read gzip, bzip2, xz, and zstandard compressed files as if
+they were uncompressed.
+"""
+
+import bz2
+import gzip
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+
+from pysat import logger
+
+# file extensions of the supported compression formats
+compressed_extensions = ['.gz', '.bz2', '.xz', '.zst']
+
+# location and maximum size in bytes of the scratch space used for
+# decompressed copies of files that must be read from disk
+scratch_dir = os.path.join(tempfile.gettempdir(), 'pysat_scratch')
+scratch_size = 2 * 1024**3
+
+
+def split_compression_ext(fname):
+    """Separate a compression file extension from a filename
+
+    Parameters
+    ----------
+    fname : string
+        Filename, with or without a compression extension
+
+    Returns
+    -------
+    base : string
+        Filename without the compression extension
+    ext : string
+        Compression extension, or '' if the file isn't compressed
+
+    """
+
+    for ext in compressed_extensions:
+        if fname.endswith(ext):
+            return fname[:-len(ext)], ext
+    return fname, ''
+
+
+def is_compressed(fname):
+    """True if the filename has a supported compression extension"""
+    return split_compression_ext(fname)[1] != ''
+
+
+class _RawReader(io.RawIOBase):
+    """Adapt a file object without readinto, such as the Python 2
+    bz2.BZ2File, for use with io.BufferedReader"""
+
+    def __init__(self, fobj):
+        self._fobj = fobj
+
+    def readable(self):
+        return True
+
+    def readinto(self, buff):
+        data = self._fobj.read(len(buff))
+        buff[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._fobj.close()
+        super(_RawReader, self).close()
+
+
+def open_file(fname, mode='r', encoding='utf-8'):
+    """Open a file, decompressing it while reading if needed
+
+    Parameters
+    ----------
+    fname : string
+        Filename
+    mode : string
+        Either 'r' to read text or 'rb' to read bytes (default='r')
+    encoding : string
+        Text encoding of compressed files opened with mode 'r'
+        (default='utf-8')
+
+    Returns
+    -------
+    file object
+        Open file, to be used like the output of the built-in open
+
+    Note
+    ----
+    Reading zstandard compressed files requires the zstandard package,
+    and reading xz compressed files on Python 2 requires backports.lzma.
+
+    """
+
+    if mode not in ['r', 'rb']:
+        raise ValueError('Compressed files may only be opened for reading')
+
+    ext = split_compression_ext(fname)[1]
+    if ext == '':
+        return open(fname, mode)
+
+    if ext == '.gz':
+        fbinary = gzip.open(fname, 'rb')
+    elif ext == '.bz2':
+        if hasattr(bz2, 'open'):
+            fbinary = bz2.open(fname, 'rb')
+        else:
+            # Python 2 BZ2File does not implement the io interface
+            fbinary = io.BufferedReader(_RawReader(bz2.BZ2File(fname, 'rb')))
+    elif ext == '.xz':
+        try:
+            import lzma
+        except ImportError:
+            try:
+                from backports import lzma
+            except ImportError:
+                raise ImportError(' '.join(('The lzma module (backports.lzma',
+                                            'on Python 2) is required to',
+                                            'read', fname)))
+        fbinary = lzma.open(fname, 'rb')
+    else:
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(' '.join(('The zstandard package is required',
+                                        'to read', fname)))
+        dctx = zstandard.ZstdDecompressor()
+        fbinary = io.BufferedReader(dctx.stream_reader(open(fname, 'rb'),
+                                                       closefd=True))
+
+    if mode == 'rb':
+        return fbinary
+    else:
+        return io.TextIOWrapper(fbinary, encoding=encoding)
+
+
+def read_file(fname):
+    """Return the (decompressed) contents of a file as bytes
+
+    Parameters
+    ----------
+    fname : string
+        Filename
+
+    Returns
+    -------
+    bytes
+        File contents
+
+    """
+
+    with open_file(fname, 'rb') as fin:
+        return fin.read()
+
+
+def scratch_copy(fname):
+    """Return path to a seekable, decompressed copy of a file
+
+    Parameters
+    ----------
+    fname : string
+        Filename
+
+    Returns
+    -------
+    string
+        fname if the file isn't compressed, otherwise the path to a
+        decompressed copy within scratch_dir
+
+    Note
+    ----
+    Copies are reused while the compressed file is unchanged. The least
+    recently used copies are removed when the scratch space exceeds
+    scratch_size bytes.
+
+    """
+
+    if not is_compressed(fname):
+        return fname
+
+    # name copies after the source file and its state, so that changes to
+    # the source file produce a new copy
+    fstat = os.stat(fname)
+    key = '{:s}{:d}{:f}'.format(os.path.abspath(fname), fstat.st_size,
+                                fstat.st_mtime)
+    key = hashlib.md5(key.encode('utf-8')).hexdigest()
+    base = os.path.basename(split_compression_ext(fname)[0])
+    copy_name = os.path.join(scratch_dir, '_'.join((key, base)))
+
+    if os.path.isfile(copy_name):
+        # mark as recently used
+        os.utime(copy_name, None)
+    else:
+        if not os.path.isdir(scratch_dir):
+            os.makedirs(scratch_dir)
+        temp_name = '{:s}.{:d}.part'.format(copy_name, os.getpid())
+        with open_file(fname, 'rb') as fin:
+            with open(temp_name, 'wb') as fout:
+                shutil.copyfileobj(fin, fout)
+        os.rename(temp_name, copy_name)
+        logger.info('Decompressed {:s} to {:s}'.format(fname, copy_name))
+        _limit_scratch(keep=copy_name)
+
+    return copy_name
+
+
+def _limit_scratch(keep=None):
+    """Remove least recently used scratch files until under scratch_size"""
+
+    copies = [os.path.join(scratch_dir, sname)
+              for sname in os.listdir(scratch_dir)
+              if not sname.endswith('.part')]
+    copies = sorted(copies, key=os.path.getmtime)
+    total = sum([os.path.getsize(sname) for sname in copies])
+
+    for sname in copies:
+        if total <= scratch_size:
+            break
+        if sname == keep:
+            continue
+        total -= os.path.getsize(sname)
+        os.remove(sname)
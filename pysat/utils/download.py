@@ -0,0 +1,602 @@
+"""
+pysat.utils.download - download engine for instrument routines
+==============================================================
+
+pysat.utils.download contains functions that download remote files over
+HTTP(S) or FTP. Connections are pooled and reused, files are downloaded
+concurrently and streamed to disk in chunks, and failed requests are retried
+with an increasing delay. Files only appear under their final name once they
+have been completely downloaded. Local files that match the remote file are
+not downloaded again, and interrupted downloads are resumed.
+"""
+
+import calendar
+from email.utils import mktime_tz, parsedate_tz
+import ftplib
+import hashlib
+import json
+import os
+import threading
+import time
+
+from multiprocessing.pool import ThreadPool
+import pandas as pds
+import requests
+
+from pysat import logger
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
+
+# HTTP status codes that indicate a temporary problem with the server
+retry_status_codes = [429, 500, 502, 503, 504]
+# HTTP status codes that indicate the remote file does not exist
+missing_status_codes = [404, 410]
+
+# remote file listings are stored in remote_list_dir and reused for
+# remote_list_ttl seconds
+remote_list_dir = os.path.join(os.path.expanduser('~'), '.pysat',
+                               'remote_file_lists')
+remote_list_ttl = 12 * 3600.
+
+# FTP connections are reused within each download thread
+_ftp_connections = threading.local()
+
+
+def create_session(user=None, password=None, pool_size=10):
+    """Create a requests Session with a pool of reusable connections
+
+    Parameters
+    ----------
+    user : string or NoneType
+        Username for HTTP basic authentication (default=None)
+    password : string or NoneType
+        Password for HTTP basic authentication (default=None)
+    pool_size : int
+        Maximum number of connections kept open per host (default=10)
+
+    Returns
+    -------
+    requests.Session
+        Session suitable for sharing across download threads
+
+    """
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size,
+                                            pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if user is not None:
+        session.auth = (user, password)
+    return session
+
+
+def _http_mtime(headers):
+    """Return the Last-Modified time from HTTP headers, or None"""
+
+    modified = headers.get('Last-Modified')
+    if modified is None:
+        return None
+    modified = parsedate_tz(modified)
+    if modified is None:
+        return None
+    return float(mktime_tz(modified))
+
+
+def _is_unchanged(local_fname, remote_size, remote_mtime):
+    """True if local_fname matches the remote file size and time"""
+
+    if remote_size is None or remote_mtime is None:
+        return False
+    if not os.path.isfile(local_fname):
+        return False
+    return (os.path.getsize(local_fname) == int(remote_size)
+            and os.path.getmtime(local_fname) >= remote_mtime)
+
+
+def _read_validator(temp_fname):
+    """Return the validator stored for a partial download, or None"""
+
+    if not os.path.isfile(temp_fname) or not os.path.isfile(temp_fname
+                                                            + '.info'):
+        return None
+    with open(temp_fname + '.info', 'r') as fin:
+        validator = fin.read().strip()
+    return validator if len(validator) > 0 else None
+
+
+def _write_validator(temp_fname, validator):
+    """Store the remote file version that a partial download belongs to"""
+
+    if validator is None:
+        _remove_partial(temp_fname, keep_temp=True)
+    else:
+        with open(temp_fname + '.info', 'w') as fout:
+            fout.write(validator)
+
+
+def _remove_partial(temp_fname, keep_temp=False):
+    """Remove a partial download and its validator"""
+
+    fnames = [temp_fname + '.info'] if keep_temp else [temp_fname,
+                                                       temp_fname + '.info']
+    for fname in fnames:
+        if os.path.isfile(fname):
+            os.remove(fname)
+
+
+def _http_download(url, local_fname, temp_fname, session, timeout,
+                   chunk_size, skip_unchanged):
+    """Stream a remote HTTP(S) file to temp_fname
+
+    Returns
+    -------
+    status : string
+        'missing' if the remote file does not exist, 'unchanged' if the
+        local file is already up to date, and 'downloaded' otherwise
+    remote_mtime : float or NoneType
+        Modification time of the remote file, if known
+
+    """
+
+    # the raw file is wanted, so byte ranges and sizes refer to it
+    headers = {'Accept-Encoding': 'identity'}
+    if skip_unchanged and os.path.isfile(local_fname):
+        # compare the size and time of the local file before transferring
+        # any data. Servers that don't support HEAD are checked below.
+        req = session.head(url, timeout=timeout, headers=headers,
+                           allow_redirects=True)
+        if req.status_code in missing_status_codes:
+            return 'missing', None
+        if req.ok:
+            remote_mtime = _http_mtime(req.headers)
+            if _is_unchanged(local_fname, req.headers.get('Content-Length'),
+                             remote_mtime):
+                return 'unchanged', remote_mtime
+
+    # resume a partial download if the remote file hasn't changed since
+    validator = _read_validator(temp_fname)
+    offset = 0
+    if validator is not None:
+        offset = os.path.getsize(temp_fname)
+        headers['Range'] = 'bytes={:d}-'.format(offset)
+        headers['If-Range'] = validator
+
+    with session.get(url, stream=True, timeout=timeout,
+                     headers=headers) as req:
+        if req.status_code in missing_status_codes:
+            return 'missing', None
+        if req.status_code == 416:
+            # partial file doesn't fit the remote file, start over
+            _remove_partial(temp_fname)
+            return _http_download(url, local_fname, temp_fname, session,
+                                  timeout, chunk_size, skip_unchanged)
+        req.raise_for_status()
+
+        remote_mtime = _http_mtime(req.headers)
+        if req.status_code == 206:
+            mode = 'ab'
+        else:
+            offset = 0
+            mode = 'wb'
+            if skip_unchanged and _is_unchanged(
+                    local_fname, req.headers.get('Content-Length'),
+                    remote_mtime):
+                return 'unchanged', remote_mtime
+            _write_validator(temp_fname, req.headers.get(
+                'ETag', req.headers.get('Last-Modified')))
+
+        size = 0
+        with open(temp_fname, mode) as fout:
+            for chunk in req.iter_content(chunk_size=chunk_size):
+                fout.write(chunk)
+                size += len(chunk)
+
+        # a dropped connection may end the stream early without an error
+        expected = req.headers.get('Content-Length')
+        if (expected is not None and 'Content-Encoding' not in req.headers
+                and int(expected) != size):
+            raise requests.exceptions.ChunkedEncodingError(
+                'Received {:d} of {:s} bytes from {:s}'.format(size, expected,
+                                                               url))
+    return 'downloaded', remote_mtime
+
+
+def _ftp_connection(host, user=None, password=None, timeout=None):
+    """Return an open FTP connection to host for the current thread"""
+
+    if not hasattr(_ftp_connections, 'hosts'):
+        _ftp_connections.hosts = {}
+
+    ftp = _ftp_connections.hosts.get(host)
+    if ftp is not None:
+        try:
+            ftp.voidcmd('NOOP')
+            return ftp
+        except ftplib.all_errors:
+            pass
+
+    ftp = ftplib.FTP(host, timeout=timeout)
+    if user is None:
+        ftp.login()
+    else:
+        ftp.login(user, password)
+    _ftp_connections.hosts[host] = ftp
+    return ftp
+
+
+def _ftp_code(err):
+    """Return the three digit reply code of an FTP error"""
+    return str(err.args[0]).split(" ", 1)[0]
+
+
+def _ftp_download(url, local_fname, temp_fname, user, password, timeout,
+                  chunk_size, skip_unchanged):
+    """Download a remote FTP file to temp_fname
+
+    Returns
+    -------
+    status : string
+        'missing' if the remote file does not exist, 'unchanged' if the
+        local file is already up to date, and 'downloaded' otherwise
+    remote_mtime : float or NoneType
+        Modification time of the remote file, if known
+
+    """
+
+    parsed = urlparse(url)
+    try:
+        ftp = _ftp_connection(parsed.hostname, user=user, password=password,
+                              timeout=timeout)
+        ftp.voidcmd('TYPE I')
+
+        # size and modification time aren't supported by all servers
+        modified = None
+        remote_mtime = None
+        remote_size = None
+        try:
+            modified = ftp.sendcmd('MDTM ' + parsed.path).split()[-1]
+            remote_mtime = float(calendar.timegm(
+                time.strptime(modified[:14], '%Y%m%d%H%M%S')))
+            remote_size = ftp.size(parsed.path)
+        except ftplib.error_perm as err:
+            if _ftp_code(err) == '550':
+                return 'missing', None
+        except ValueError:
+            pass
+
+        if skip_unchanged and _is_unchanged(local_fname, remote_size,
+                                            remote_mtime):
+            return 'unchanged', remote_mtime
+
+        # resume a partial download if the remote file hasn't changed since
+        offset = 0
+        if modified is not None and _read_validator(temp_fname) == modified:
+            offset = os.path.getsize(temp_fname)
+        else:
+            _remove_partial(temp_fname)
+            _write_validator(temp_fname, modified)
+
+        with open(temp_fname, 'ab' if offset > 0 else 'wb') as fout:
+            ftp.retrbinary('RETR ' + parsed.path, fout.write,
+                           blocksize=chunk_size,
+                           rest=offset if offset > 0 else None)
+    except ftplib.error_perm as err:
+        if _ftp_code(err) == '550':
+            return 'missing', None
+        raise
+    except ftplib.all_errors:
+        # drop the connection, it will be reopened on the next attempt
+        _ftp_connections.hosts.pop(parsed.hostname, None)
+        raise
+    return 'downloaded', remote_mtime
+
+
+def download_file(url, local_fname, session=None, user=None, password=None,
+                  retries=3, backoff=1.0, timeout=60.0,
+                  chunk_size=1024 * 1024, skip_unchanged=True):
+    """Download a single remote file
+
+    Parameters
+    ----------
+    url : string
+        Remote file location, starting with http://, https://, or ftp://
+    local_fname : string
+        Full path to save the file to
+    session : requests.Session or NoneType
+        Session to use for HTTP(S) requests. If None, a new session is
+        created using user and password. (default=None)
+    user : string or NoneType
+        Username for the remote server (default=None)
+    password : string or NoneType
+        Password for the remote server (default=None)
+    retries : int
+        Number of times to retry a failed download (default=3)
+    backoff : float
+        Seconds to wait before the first retry, doubled for each following
+        retry (default=1.0)
+    timeout : float
+        Seconds to wait for the server to respond (default=60.0)
+    chunk_size : int
+        Number of bytes written to disk at a time (default=1048576)
+    skip_unchanged : bool
+        If True, local_fname is only downloaded again if the remote file
+        has a different size or is newer (default=True)
+
+    Returns
+    -------
+    bool
+        True if the file was downloaded or is up to date, False if it isn't
+        available remotely
+
+    Raises
+    ------
+    requests.exceptions.RequestException or ftplib.Error
+        If the download still fails after all retries
+
+    Note
+    ----
+    The file is downloaded to local_fname + '.part' and renamed once
+    complete, so local_fname is never left partially written. If the
+    download is interrupted, the partial file is kept and the next attempt
+    resumes it, provided the remote file hasn't changed in the meantime.
+    The modification time of local_fname is set to that of the remote file.
+
+    """
+
+    is_ftp = url.lower().startswith('ftp://')
+    if session is None and not is_ftp:
+        session = create_session(user=user, password=password, pool_size=1)
+
+    if is_ftp:
+        retry_errors = ftplib.all_errors
+    else:
+        retry_errors = (requests.exceptions.ConnectionError,
+                        requests.exceptions.Timeout,
+                        requests.exceptions.ChunkedEncodingError,
+                        requests.exceptions.HTTPError)
+
+    temp_fname = local_fname + '.part'
+    for attempt in range(retries + 1):
+        try:
+            if is_ftp:
+                status, remote_mtime = _ftp_download(url, local_fname,
+                                                     temp_fname, user,
+                                                     password, timeout,
+                                                     chunk_size,
+                                                     skip_unchanged)
+            else:
+                status, remote_mtime = _http_download(url, local_fname,
+                                                      temp_fname, session,
+                                                      timeout, chunk_size,
+                                                      skip_unchanged)
+            break
+        except retry_errors as err:
+            # only retry on errors that may go away
+            retry = attempt < retries
+            if isinstance(err, requests.exceptions.HTTPError):
+                retry = retry and (err.response.status_code
+                                   in retry_status_codes)
+            elif isinstance(err, ftplib.error_perm):
+                retry = False
+            if not retry:
+                # keep partial files from dropped connections to resume
+                if (isinstance(err, (requests.exceptions.HTTPError,
+                                     ftplib.error_perm))
+                        or _read_validator(temp_fname) is None):
+                    _remove_partial(temp_fname)
+                raise
+            wait = backoff * 2**attempt
+            logger.info(' '.join(('Download of', url, 'failed:', str(err),
+                                  '- retrying in {:.1f} s'.format(wait))))
+            time.sleep(wait)
+
+    if status != 'downloaded':
+        _remove_partial(temp_fname)
+        if status == 'unchanged':
+            logger.info(' '.join((local_fname, 'is up to date')))
+        return status == 'unchanged'
+
+    _remove_partial(temp_fname, keep_temp=True)
+    if os.path.isfile(local_fname):
+        os.remove(local_fname)
+    os.rename(temp_fname, local_fname)
+    if remote_mtime is not None:
+        os.utime(local_fname, (time.time(), remote_mtime))
+    return True
+
+
+def download_files(urls, local_fnames, n_workers=4, session=None, user=None,
+                   password=None, retries=3, backoff=1.0, timeout=60.0,
+                   chunk_size=1024 * 1024, skip_unchanged=True):
+    """Download several remote files concurrently
+
+    Parameters
+    ----------
+    urls : list-like
+        Remote file locations, starting with http://, https://, or ftp://
+    local_fnames : list-like
+        Full paths to save each of the files to
+    n_workers : int
+        Number of files to download at the same time (default=4)
+    session : requests.Session or NoneType
+        Session to use for HTTP(S) requests. If None, a new session with
+        a connection pool of n_workers is created. (default=None)
+    user : string or NoneType
+        Username for the remote server (default=None)
+    password : string or NoneType
+        Password for the remote server (default=None)
+    retries : int
+        Number of times to retry each failed download (default=3)
+    backoff : float
+        Seconds to wait before the first retry, doubled for each following
+        retry (default=1.0)
+    timeout : float
+        Seconds to wait for the server to respond (default=60.0)
+    chunk_size : int
+        Number of bytes written to disk at a time (default=1048576)
+    skip_unchanged : bool
+        If True, files are only downloaded again if the remote file has a
+        different size or is newer (default=True)
+
+    Returns
+    -------
+    list
+        True for each file that was downloaded or is up to date, False for
+        files that aren't available remotely or that could not be downloaded
+
+    Note
+    ----
+    Errors for individual files are logged rather than raised, so that one
+    failed file does not stop the other downloads.
+
+    """
+
+    urls = list(urls)
+    local_fnames = list(local_fnames)
+    if len(urls) != len(local_fnames):
+        raise ValueError('Must supply one local filename for each url')
+    if len(urls) == 0:
+        return []
+
+    n_workers = max(1, min(int(n_workers), len(urls)))
+    if session is None:
+        session = create_session(user=user, password=password,
+                                 pool_size=n_workers)
+
+    def _download(args):
+        url, local_fname = args
+        try:
+            found = download_file(url, local_fname, session=session,
+                                  user=user, password=password,
+                                  retries=retries, backoff=backoff,
+                                  timeout=timeout, chunk_size=chunk_size,
+                                  skip_unchanged=skip_unchanged)
+        except ((requests.exceptions.RequestException,)
+                + ftplib.all_errors) as err:
+            logger.info(' '.join(('Unable to download', url, '-', str(err))))
+            return False
+        if found:
+            logger.info('Downloaded ' + url)
+        else:
+            logger.info('File not available: ' + url)
+        return found
+
+    if n_workers == 1:
+        return [_download(args) for args in zip(urls, local_fnames)]
+
+    pool = ThreadPool(n_workers)
+    try:
+        return pool.map(_download, zip(urls, local_fnames))
+    finally:
+        pool.close()
+        pool.join()
+
+
+def cached_file_list(key, list_rtn, start=None, stop=None, ttl=None):
+    """Return a list of remote files, only querying the server if needed
+
+    Parameters
+    ----------
+    key : string
+        Unique description of the remote file listing, such as the remote
+        directory and filename format
+    list_rtn : function
+        Called without arguments to get the remote files between start and
+        stop, as a pandas Series of filenames indexed by datetime
+    start : datetime or NoneType
+        First date covered by list_rtn, or None if there is no lower limit
+        (default=None)
+    stop : datetime or NoneType
+        Last date covered by list_rtn (inclusive), or None if there is no
+        upper limit (default=None)
+    ttl : float or NoneType
+        Seconds for which a listing is reused. If None, remote_list_ttl is
+        used. A value of 0 always queries the server. (default=None)
+
+    Returns
+    -------
+    pandas.Series
+        Filenames between start and stop, indexed by datetime
+
+    Note
+    ----
+    Listings are stored in remote_list_dir and reused for every request
+    whose date range falls within a listing that is younger than ttl.
+    Otherwise only the requested date range is listed again and merged into
+    the stored listing.
+
+    """
+
+    if ttl is None:
+        ttl = remote_list_ttl
+    start = pds.Timestamp.min if start is None else pds.Timestamp(start)
+    stop = pds.Timestamp.max if stop is None else pds.Timestamp(stop)
+
+    fname = os.path.join(remote_list_dir, '{:s}.json'.format(
+        hashlib.md5(key.encode('utf-8')).hexdigest()))
+    listing = _load_file_list(fname, key)
+
+    now = time.time()
+    fresh = [(lstart, lstop) for lstart, lstop, ltime in listing['ranges']
+             if now - ltime < ttl]
+    if any([(lstart <= start) & (lstop >= stop) for lstart, lstop in fresh]):
+        files = listing['files']
+    else:
+        new_files = list_rtn()
+        files = listing['files']
+        files = pds.concat([files[(files.index < start)
+                                  | (files.index > stop)], new_files])
+        files = files.sort_index()
+        # ranges within the new one are replaced by it
+        ranges = [lrange for lrange in listing['ranges']
+                  if (lrange[0] < start) | (lrange[1] > stop)]
+        ranges.append((start, stop, now))
+        _store_file_list(fname, key, ranges, files)
+
+    return files[(files.index >= start) & (files.index <= stop)]
+
+
+def _load_file_list(fname, key):
+    """Load a stored remote file listing, or an empty listing"""
+
+    listing = {'ranges': [], 'files': pds.Series([], dtype=object,
+                                                 index=pds.DatetimeIndex([]))}
+    if not os.path.isfile(fname):
+        return listing
+    try:
+        with open(fname, 'r') as fin:
+            stored = json.load(fin)
+    except (IOError, ValueError):
+        return listing
+    if stored.get('key') != key:
+        return listing
+
+    listing['ranges'] = [(pds.Timestamp(lstart), pds.Timestamp(lstop),
+                          ltime) for lstart, lstop, ltime in stored['ranges']]
+    dates = [date for date, name in stored['files']]
+    names = [name for date, name in stored['files']]
+    listing['files'] = pds.Series(names, index=pds.DatetimeIndex(dates),
+                                  dtype=object)
+    return listing
+
+
+def _store_file_list(fname, key, ranges, files):
+    """Store a remote file listing"""
+
+    if not os.path.isdir(remote_list_dir):
+        os.makedirs(remote_list_dir)
+    stored = {'key': key,
+              'ranges': [(lstart.isoformat(), lstop.isoformat(), ltime)
+                         for lstart, lstop, ltime in ranges],
+              'files': [(date.isoformat(), name)
+                        for date, name in zip(files.index, files.values)]}
+    temp_fname = '{:s}.{:d}.part'.format(fname, os.getpid())
+    with open(temp_fname, 'w') as fout:
+        json.dump(stored, fout)
+    if os.path.isfile(fname):
+        os.remove(fname)
+    os.rename(temp_fname, fname)
@@ -0,0 +1,180 @@
+"""
+pysat.utils.npy_store - memory mapped binary stores
+===================================================
+
+pysat.utils.npy_store contains functions that write loaded pandas data to a
+directory of numpy .npy files, one per variable, along with a JSON file
+holding the pysat metadata. Loading memory maps each file and wraps the
+arrays in a DataFrame without copying them, so data pages are only read
+from disk when accessed, and processes loading the same store share the
+operating system page cache.
+"""
+
+import json
+import os
+import shutil
+import warnings
+
+import numpy as np
+import pandas as pds
+# python 2/3 compatibility
+try:
+    basestring
+except NameError:
+    basestring = str
+
+import pysat
+from pysat.utils._core import _meta_from_json, _meta_to_json
+
+# default template for stores, relative to the top level directory
+default_format_str = '{year:04d}/{month:02d}{day:02d}.npys'
+
+# name of the file describing the variables and metadata within a store
+store_info = 'store.json'
+
+
+def _frame_from_arrays(arrays, columns, index):
+    """Create a DataFrame with one block for each array, without copying
+
+    Parameters
+    ----------
+    arrays : list
+        1D arrays, one for each column
+    columns : list
+        Column names
+    index : pandas.Index
+        Index for the DataFrame
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Note
+    ----
+    pandas joins columns with the same type into one block, copying them,
+    when a DataFrame is created from a dict. Each array is given its own
+    block instead. If the pandas internals are not available the arrays
+    are copied.
+
+    """
+    try:
+        from pandas.core.internals import BlockManager, make_block
+        blocks = [make_block(arr.reshape(1, len(arr)), placement=[i])
+                  for i, arr in enumerate(arrays)]
+        manager = BlockManager(blocks, [pds.Index(columns), index])
+        return pds.DataFrame(manager)
+    except (ImportError, TypeError, ValueError):
+        return pds.DataFrame(dict(zip(columns, arrays)), columns=columns,
+                             index=index)
+
+
+def write_npy_store(dirname, data, meta, epoch_name='Epoch'):
+    """Write a DataFrame and its metadata to a directory of .npy files
+
+    Parameters
+    ----------
+    dirname : string
+        Full path of the store directory, which is replaced if present.
+        Parent directories are created as needed.
+    data : pandas.DataFrame
+        Data, indexed by time. Columns of DataFrames or Series are not
+        written, and string columns are stored as fixed width unicode.
+    meta : pysat.Meta
+        Metadata for data
+    epoch_name : string
+        Name used for the time index (default='Epoch')
+
+    """
+    # higher order data has no single array representation
+    skipped = [key for key in data.columns if data[key].dtype == np.dtype('O')
+               and len(data) > 0
+               and isinstance(data[key].iloc[0], (pds.DataFrame, pds.Series))]
+    if len(skipped) > 0:
+        warnings.warn(' '.join(('Higher order variables are not written to',
+                                'npy stores:', ', '.join(skipped))))
+    columns = [key for key in data.columns if key not in skipped]
+
+    # stores only appear under their final name once completely written
+    temp_dir = '{:s}.{:d}.part'.format(dirname, os.getpid())
+    if os.path.isdir(temp_dir):
+        shutil.rmtree(temp_dir)
+    os.makedirs(temp_dir)
+
+    np.save(os.path.join(temp_dir, 'index.npy'),
+            data.index.values.astype(np.int64))
+    for i, key in enumerate(columns):
+        values = data[key].values
+        if values.dtype == np.dtype('O'):
+            values = values.astype(np.unicode_)
+        np.save(os.path.join(temp_dir, '{:d}.npy'.format(i)), values)
+    with open(os.path.join(temp_dir, store_info), 'w') as fout:
+        json.dump({'epoch_name': epoch_name, 'columns': columns,
+                   'meta': _meta_to_json(meta, columns)}, fout)
+
+    if os.path.isdir(dirname):
+        shutil.rmtree(dirname)
+    os.rename(temp_dir, dirname)
+
+
+def load_npy_store(dirnames, columns=None, mmap_mode='c'):
+    """Load stores written by write_npy_store
+
+    Parameters
+    ----------
+    dirnames : string or array_like of strings
+        Store directories to load
+    columns : list-like of strings or NoneType
+        Variables to load. If None, all variables are loaded. (default=None)
+    mmap_mode : string or NoneType
+        Memory map mode passed to numpy.load. The default copy on write
+        mode allows the loaded data to be changed without changing the
+        store. If None, the arrays are read into memory. (default='c')
+
+    Returns
+    -------
+    data : pandas.DataFrame
+        Data indexed by time
+    meta : pysat.Meta
+        Metadata stored with the first store, for the variables loaded
+
+    Note
+    ----
+    Numeric and datetime variables are not copied when a single store is
+    loaded. Loading several stores at once joins them into new arrays.
+
+    """
+    if isinstance(dirnames, basestring):
+        dirnames = [dirnames]
+
+    frames = []
+    meta = None
+    for dirname in dirnames:
+        with open(os.path.join(dirname, store_info), 'r') as fin:
+            info = json.load(fin)
+        if columns is None:
+            load_cols = info['columns']
+        else:
+            lower_cols = [col.lower() for col in columns]
+            load_cols = [col for col in info['columns']
+                         if col.lower() in lower_cols]
+        if meta is None:
+            meta = _meta_from_json(info['meta'], columns=load_cols)
+
+        index = np.load(os.path.join(dirname, 'index.npy'),
+                        mmap_mode=mmap_mode)
+        index = pds.DatetimeIndex(index.view('datetime64[ns]'),
+                                  name=info['epoch_name'])
+        arrays = []
+        for col in load_cols:
+            values = np.load(os.path.join(dirname, '{:d}.npy'.format(
+                info['columns'].index(col))), mmap_mode=mmap_mode)
+            if values.dtype.kind == 'U':
+                values = values.astype(object)
+            arrays.append(values)
+        frames.append(_frame_from_arrays(arrays, load_cols, index))
+
+    if len(frames) == 0:
+        return pds.DataFrame(None), pysat.Meta()
+    elif len(frames) == 1:
+        return frames[0], meta
+    return pds.concat(frames), meta
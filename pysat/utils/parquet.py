@@ -0,0 +1,183 @@
+"""
+pysat.utils.parquet - date partitioned Parquet stores
+=====================================================
+
+pysat.utils.parquet contains functions that write loaded pandas data to
+Apache Parquet files, one file per day, and read them back. The pysat
+metadata is stored with the schema of each file. Reads may be limited to
+a subset of the columns, and to the row groups within a time range, so
+only the data requested is read from disk.
+
+Writing and reading Parquet files requires the pyarrow package.
+"""
+
+import os
+import warnings
+
+import numpy as np
+import pandas as pds
+# python 2/3 compatibility
+try:
+    basestring
+except NameError:
+    basestring = str
+
+import pysat
+from pysat.utils._core import _meta_from_json, _meta_to_json
+
+# default template for files, relative to the top level directory
+default_format_str = '{year:04d}/{month:02d}{day:02d}.parquet'
+
+# key for the pysat metadata within the Parquet schema metadata
+meta_key = b'pysat_meta'
+
+
+def _import_pyarrow():
+    """Return the pyarrow and pyarrow.parquet modules"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(' '.join(('The pyarrow package is required to',
+                                    'read and write Parquet files')))
+    return pyarrow, pyarrow.parquet
+
+
+def write_parquet(fname, data, meta, epoch_name='Epoch',
+                  row_group_size=None, compression='snappy'):
+    """Write a DataFrame and its metadata to a Parquet file
+
+    Parameters
+    ----------
+    fname : string
+        Full path of the file to write. Directories are created as needed.
+    data : pandas.DataFrame
+        Data, indexed by time. Columns of DataFrames or Series are not
+        written.
+    meta : pysat.Meta
+        Metadata for data, stored with the file schema
+    epoch_name : string
+        Name of the column that stores the time index (default='Epoch')
+    row_group_size : int or NoneType
+        Number of rows in each row group. Smaller row groups allow reads
+        of a time range to skip more of the file. If None, one row group
+        is written. (default=None)
+    compression : string
+        Compression codec used by pyarrow (default='snappy')
+
+    """
+    pyarrow, pq = _import_pyarrow()
+
+    # higher order data has no columnar representation
+    skipped = [key for key in data.columns if data[key].dtype == np.dtype('O')
+               and len(data) > 0
+               and isinstance(data[key].iloc[0], (pds.DataFrame, pds.Series))]
+    if len(skipped) > 0:
+        warnings.warn(' '.join(('Higher order variables are not written to',
+                                'Parquet files:', ', '.join(skipped))))
+    frame = data.drop(skipped, axis=1).rename_axis(epoch_name).reset_index()
+
+    table = pyarrow.Table.from_pandas(frame, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[meta_key] = _meta_to_json(meta, frame.columns).encode('utf-8')
+    table = table.replace_schema_metadata(metadata)
+
+    dir_name = os.path.dirname(fname)
+    if dir_name != '' and not os.path.isdir(dir_name):
+        try:
+            os.makedirs(dir_name)
+        except OSError:
+            # created by another writer
+            pass
+    # files only appear under their final name once completely written
+    temp_name = '{:s}.{:d}.part'.format(fname, os.getpid())
+    pq.write_table(table, temp_name, row_group_size=row_group_size,
+                   compression=compression, coerce_timestamps='us')
+    os.rename(temp_name, fname)
+
+
+def _select_row_groups(pfile, epoch_name, start, stop):
+    """List the row groups of a ParquetFile with times from start to stop"""
+    num_groups = pfile.metadata.num_row_groups
+    if start is None and stop is None:
+        return list(range(num_groups))
+
+    col_idx = pfile.schema.to_arrow_schema().get_field_index(epoch_name)
+    selected = []
+    for i in range(num_groups):
+        stats = pfile.metadata.row_group(i).column(col_idx).statistics
+        if stats is None or not stats.has_min_max:
+            selected.append(i)
+            continue
+        # older versions of pyarrow return the stored integer microseconds
+        if isinstance(stats.min, (int, np.integer)):
+            group_min = pds.Timestamp(stats.min, unit='us')
+            group_max = pds.Timestamp(stats.max, unit='us')
+        else:
+            group_min = pds.Timestamp(stats.min)
+            group_max = pds.Timestamp(stats.max)
+        if ((start is None or group_max >= start)
+                and (stop is None or group_min <= stop)):
+            selected.append(i)
+    return selected
+
+
+def load_parquet(fnames, columns=None, start=None, stop=None,
+                 epoch_name='Epoch'):
+    """Load Parquet files written by write_parquet
+
+    Parameters
+    ----------
+    fnames : string or array_like of strings
+        Files to load
+    columns : list-like of strings or NoneType
+        Variables to read. If None, all variables are read. (default=None)
+    start : datetime or NoneType
+        Earliest time to load. Row groups ending before start are not read.
+        (default=None)
+    stop : datetime or NoneType
+        Latest time to load, inclusive. Row groups starting after stop are
+        not read. (default=None)
+    epoch_name : string
+        Name of the column that stores the time index (default='Epoch')
+
+    Returns
+    -------
+    data : pandas.DataFrame
+        Data indexed by time
+    meta : pysat.Meta
+        Metadata stored with the first file, for the variables loaded
+
+    """
+    pyarrow, pq = _import_pyarrow()
+
+    if isinstance(fnames, basestring):
+        fnames = [fnames]
+    if columns is not None:
+        columns = [epoch_name] + [col for col in columns if col != epoch_name]
+
+    tables = []
+    meta = None
+    for fname in fnames:
+        pfile = pq.ParquetFile(fname)
+        if meta is None:
+            schema_meta = pfile.schema.to_arrow_schema().metadata or {}
+            if meta_key in schema_meta:
+                # the epoch is the index, not a variable in the metadata
+                meta_columns = None if columns is None else columns[1:]
+                meta = _meta_from_json(schema_meta[meta_key].decode('utf-8'),
+                                       columns=meta_columns)
+        groups = _select_row_groups(pfile, epoch_name, start, stop)
+        if len(groups) > 0:
+            tables.append(pfile.read_row_groups(groups, columns=columns))
+
+    if meta is None:
+        meta = pysat.Meta()
+    if len(tables) == 0:
+        return pds.DataFrame(None), meta
+
+    data = pyarrow.concat_tables(tables).to_pandas()
+    data = data.set_index(epoch_name)
+    if start is not None or stop is not None:
+        data = data.loc[start:stop]
+    return data, meta